@@ -5,7 +5,7 @@ import numpy.random as rnd
 
 from gym_gridverse.action import Action
 from gym_gridverse.agent import Agent
-from gym_gridverse.design import draw_room, draw_wall_boundary
+from gym_gridverse.design import draw_room
 from gym_gridverse.envs.reset_functions import reset_function_registry
 from gym_gridverse.envs.reward_functions import reward_function_registry
 from gym_gridverse.envs.terminating_functions import (
@@ -13,10 +13,8 @@ from gym_gridverse.envs.terminating_functions import (
 )
 from gym_gridverse.envs.transition_functions import transition_function_registry
 from gym_gridverse.geometry import Area, Orientation
-from gym_gridverse.grid import Grid
 from gym_gridverse.grid_object import (
     Color,
-    Floor,
     GridObject,
     Wall,
     DeliveryAddress,
@@ -24,6 +22,7 @@ from gym_gridverse.grid_object import (
 )
 from gym_gridverse.rng import choice, get_gv_rng_if_none
 from gym_gridverse.state import State
+from gym_gridverse.utils.layouts import cached_parse_ascii_layout
 
 
 @reset_function_registry.register
@@ -33,49 +32,30 @@ def coin_maze(*, rng: Optional[rnd.Generator] = None) -> State:
     # must call this to include reproduceable stochasticity
     rng = get_gv_rng_if_none(rng)
 
-    # initializes grid with Coin
-    grid = Grid.from_shape((7, 9), factory=Floor)
-    # assigns Wall to the border
-    draw_wall_boundary(grid)
-    # draw other walls
-    # draw_room(grid, Area((2, 4), (2, 6)), DeliveryHub)
-    # re-assign openings
-    grid[2, 3] = DeliveryHub()
-    grid[5, 4] = DeliveryAddress(3)
-    grid[3, 4] = DeliveryAddress(3)
-    grid[3, 5] = DeliveryAddress(2)
-    grid[3, 6] = DeliveryAddress(2)
-    grid[3, 7] = DeliveryAddress(1)
-    # grid[3, 8] = DeliveryAddress()
-
-    # final result (#=Wall, .=Coin):
-
-    # #########
-    # #.......#
-    # #.W.WWW.#
-    # #.W...W.#
-    # #.WWW.W.#
-    # #.......#
-    # #########
+    # the layout is compiled once (#=Wall, .=Floor, H=DeliveryHub, digits are
+    # DeliveryAddress items), and only cloned here
+    template = cached_parse_ascii_layout(_COIN_MAZE_LAYOUT)
+    grid = template.instantiate()
 
     # randomized agent position and orientation
-    agent_position = choice(
-        rng,
-        [
-            position
-            for position in grid.area.positions()
-            if isinstance(grid[position], Floor)
-        ],
-    )
+    agent_position = choice(rng, template.floor_positions)
     agent_orientation = choice(rng, list(Orientation))
     agent = Agent(agent_position, agent_orientation)
 
-    # remove coin from agent initial posiCtion
-    grid[agent.position] = Floor()
-
     return State(grid, agent)
 
 
+_COIN_MAZE_LAYOUT = (
+    '#########',
+    '#.......#',
+    '#..H....#',
+    '#...3221#',
+    '#.......#',
+    '#...3...#',
+    '#########',
+)
+
+
 @transition_function_registry.register
 def reload_items_from_Hub_transition(  # reload
     state: State,
@@ -94,11 +74,16 @@ def reload_items_from_Hub_transition(  # reload
         ):  # OPEN
             if state.agent.max_capacity > state.agent.capacity:
                 state.agent.capacity += 1
-                Hub.item_num -= 1
+                state.grid.set_object_attribute(
+                    state.agent.position, 'item_num', Hub.item_num - 1
+                )
+                Hub = state.grid[state.agent.position]
         print(f'drone capacity after reload : {state.agent.capacity}')
 
         if Hub.is_empty:
-            Hub.state_index = 1
+            state.grid.set_object_attribute(
+                state.agent.position, 'state_index', 1
+            )
             print(f'Hub is empty')
 
 
@@ -117,7 +102,11 @@ def unload_transition(  # unload
         delivery_address = state.grid[state.agent.position]
         if state.agent.capacity > 0 and delivery_address.is_empty == False:
             print(f'delivery before : {delivery_address.num_items}')
-            delivery_address.num_items -= 1
+            state.grid.set_object_attribute(
+                state.agent.position,
+                'num_items',
+                delivery_address.num_items - 1,
+            )
             state.agent.finished_deliver_num += 1
             state.agent.capacity -= 1
             # print(f'delivery after : {delivery_address.num_items}')
@@ -175,7 +164,11 @@ def reload_reward(
                 reward = 0
         if (Hub.is_empty == True) and (Hub.is_rewarded == False):
             reward = reward_Hub
-            Hub.is_rewarded = True
+            # through the grid, such that the write is undoable, and does
+            # not affect the previous state
+            next_state.grid.set_object_attribute(
+                next_state.agent.position, 'is_rewarded', True
+            )
         else:
             reward = 0
     else:
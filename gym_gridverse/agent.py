@@ -4,6 +4,7 @@ from typing import Optional
 
 from .geometry import Orientation, Position, Transform
 from .grid_object import GridObject, NoneGridObject
+from .utils.undo_log import UndoLog
 
 
 class Agent:
@@ -32,13 +33,16 @@ class Agent:
             grid_object (Optional[GridObject]): object held by the agent.
         """
 
+        # if set, modifications record their inverse operations
+        self.undo_log: Optional[UndoLog] = None
+
         self.transform = Transform(position, orientation)
-        self.grid_object: GridObject = (
+        self._grid_object: GridObject = (
             NoneGridObject() if grid_object is None else grid_object
         )
-        self.capacity = capacity
+        self._capacity = capacity
         self.max_capacity = max_capacity
-        self.finished_deliver_num = finished_deliver_num
+        self._finished_deliver_num = finished_deliver_num
 
     def front(self) -> Position:
         return self.transform * Position.from_orientation(Orientation.F)
@@ -49,6 +53,9 @@ class Agent:
 
     @position.setter
     def position(self, position: Position):
+        if self.undo_log is not None:
+            self.undo_log.record(setattr, self, 'position', self.position)
+
         self.transform.position = position
 
     @property
@@ -57,8 +64,49 @@ class Agent:
 
     @orientation.setter
     def orientation(self, orientation: Orientation):
+        if self.undo_log is not None:
+            self.undo_log.record(setattr, self, 'orientation', self.orientation)
+
         self.transform.orientation = orientation
 
+    @property
+    def grid_object(self) -> GridObject:
+        return self._grid_object
+
+    @grid_object.setter
+    def grid_object(self, grid_object: GridObject):
+        if self.undo_log is not None:
+            self.undo_log.record(setattr, self, 'grid_object', self.grid_object)
+
+        self._grid_object = grid_object
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity: int):
+        if self.undo_log is not None:
+            self.undo_log.record(setattr, self, 'capacity', self.capacity)
+
+        self._capacity = capacity
+
+    @property
+    def finished_deliver_num(self) -> int:
+        return self._finished_deliver_num
+
+    @finished_deliver_num.setter
+    def finished_deliver_num(self, finished_deliver_num: int):
+        if self.undo_log is not None:
+            self.undo_log.record(
+                setattr,
+                self,
+                'finished_deliver_num',
+                self.finished_deliver_num,
+            )
+
+        self._finished_deliver_num = finished_deliver_num
+
     def __eq__(self, other):
         if isinstance(other, Agent):
             return (
@@ -71,6 +119,12 @@ class Agent:
     def __hash__(self):
         return hash((self.transform, self.grid_object))
 
+    def __getstate__(self):
+        # copies do not share (or record into) the undo log
+        state = self.__dict__.copy()
+        state['undo_log'] = None
+        return state
+
     def __repr__(self):
         # TODO: test
         return (
@@ -1,11 +1,17 @@
-from typing import Optional, Tuple
+import copy
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
 
 import numpy.random as rnd
 
 from gym_gridverse.action import Action
+from gym_gridverse.agent import Agent
 from gym_gridverse.debugging import gv_debug
 from gym_gridverse.envs import InnerEnv
-from gym_gridverse.envs.observation_functions import ObservationFunction
+from gym_gridverse.envs.observation_functions import (
+    ObservationFunction,
+    observation_cache_key,
+)
 from gym_gridverse.envs.reset_functions import ResetFunction
 from gym_gridverse.envs.reward_functions import RewardFunction
 from gym_gridverse.envs.terminating_functions import TerminatingFunction
@@ -13,10 +19,12 @@ from gym_gridverse.envs.transition_functions import (
     TransitionFunction,
     transition_with_copy,
 )
+from gym_gridverse.grid import Grid
 from gym_gridverse.observation import Observation
-from gym_gridverse.rng import make_rng
+from gym_gridverse.rng import BufferedRng, Seed, make_rng, spawn_seeds
 from gym_gridverse.spaces import ActionSpace, ObservationSpace, StateSpace
 from gym_gridverse.state import State
+from gym_gridverse.utils.undo_log import UndoLog
 
 
 class GridWorld(InnerEnv):
@@ -32,9 +40,25 @@ class GridWorld(InnerEnv):
         observation_function: ObservationFunction,
         reward_function: RewardFunction,
         termination_function: TerminatingFunction,
+        *,
+        observation_cache_size: int = 0,
+        rng_buffer_size: int = 1024,
     ):
         """Initializes a GridWorld from the given components.
 
+        Consecutive steps often produce the same agent view (e.g., turning in
+        place, bumping into walls);  if `observation_cache_size` is positive,
+        observations of deterministic egocentric observation functions are
+        cached based on the agent view content and held object (see
+        :py:func:`~gym_gridverse.envs.observation_functions.observation_cache_key`),
+        keeping the most recently used ones.  Cached observations are shared,
+        and should not be modified.
+
+        Once seeded, the functions receive a
+        :py:class:`~gym_gridverse.rng.BufferedRng` with buffer size
+        `rng_buffer_size`, which serves their small draws from pre-drawn blocks
+        (a plain generator if zero).
+
         Args:
             state_space (StateSpace):
             action_space (ActionSpace):
@@ -44,6 +68,8 @@ class GridWorld(InnerEnv):
             observation_function (ObservationFunction):
             reward_function (RewardFunction):
             termination_function (TerminatingFunction):
+            observation_cache_size (int): maximum number of cached observations
+            rng_buffer_size (int): number of uniforms pre-drawn at a time
         """
 
         # TODO: maybe add a parameter to avoid calls to `contain` everywhere
@@ -55,15 +81,56 @@ class GridWorld(InnerEnv):
         self._reward_function = reward_function
         self._termination_function = termination_function
 
-        self._rng: Optional[rnd.Generator] = None
+        # independent streams, such that e.g. generating observations (or not)
+        # does not affect the dynamics
+        self._reset_rng: Optional[rnd.Generator] = None
+        self._transition_rng: Optional[rnd.Generator] = None
+        self._observation_rng: Optional[rnd.Generator] = None
+
+        if rng_buffer_size < 0:
+            raise ValueError(
+                f'rng_buffer_size ({rng_buffer_size}) must be non-negative'
+            )
+        self._rng_buffer_size = rng_buffer_size
+
+        if observation_cache_size < 0:
+            raise ValueError(
+                f'observation_cache_size ({observation_cache_size}) '
+                'must be non-negative'
+            )
+        self._observation_cache_size = observation_cache_size
+        self._observation_cache: OrderedDict[
+            Hashable, Observation
+        ] = OrderedDict()
+
+        self._undo_log: Optional[UndoLog] = None
+        self._undo_checkpoints: List[int] = []
 
         super().__init__(state_space, action_space, observation_space)
 
-    def set_seed(self, seed: Optional[int] = None):
-        self._rng = make_rng(seed)
+    def set_seed(self, seed: Optional[Seed] = None):
+        """Seeds the environment
+
+        The reset, transition and observation functions each get their own
+        random stream, spawned from the seed (see
+        :py:func:`~gym_gridverse.rng.spawn_seeds`).
+
+        Args:
+            seed (Optional[Seed]): integer seed or seed sequence;  the streams
+                are its first three children, which coincide with other
+                children spawned from the same seed sequence
+        """
+        rngs = [make_rng(child) for child in spawn_seeds(seed, 3)]
+        if self._rng_buffer_size > 0:
+            rngs = [
+                BufferedRng(rng, buffer_size=self._rng_buffer_size)
+                for rng in rngs
+            ]
+
+        self._reset_rng, self._transition_rng, self._observation_rng = rngs
 
     def functional_reset(self) -> State:
-        state = self._reset_function(rng=self._rng)
+        state = self._reset_function(rng=self._reset_rng)
         if gv_debug() and not self.state_space.contains(state):
             raise ValueError('state does not satisfy state_space')
 
@@ -75,13 +142,13 @@ class GridWorld(InnerEnv):
         if gv_debug() and not self.state_space.contains(state):
             raise ValueError('state does not satisfy state_space')
         if not self.action_space.contains(action):
-            raise ValueError('action {action} does not satisfy action-space')
+            raise ValueError(f'action {action} does not satisfy action-space')
 
         next_state = transition_with_copy(
             self._transition_function,
             state,
             action,
-            rng=self._rng,
+            rng=self._transition_rng,
         )
 
         if gv_debug() and not self.state_space.contains(next_state):
@@ -93,8 +160,113 @@ class GridWorld(InnerEnv):
         return (next_state, reward, terminal)
 
     def functional_observation(self, state: State) -> Observation:
-        observation = self._observation_function(state, rng=self._rng)
+        key = (
+            observation_cache_key(self._observation_function, state)
+            if self._observation_cache_size > 0
+            else None
+        )
+
+        if key is not None:
+            try:
+                observation = self._observation_cache[key]
+            except KeyError:
+                pass
+            else:
+                self._observation_cache.move_to_end(key)
+                return observation
+
+        observation = self._observation_function(
+            state, rng=self._observation_rng
+        )
         if gv_debug() and not self.observation_space.contains(observation):
             raise ValueError('observation does not satisfy observation_space')
 
+        if key is not None:
+            # the state objects may later be modified in place
+            _detach_objects(observation)
+            self._observation_cache[key] = observation
+            if len(self._observation_cache) > self._observation_cache_size:
+                self._observation_cache.popitem(last=False)
+
         return observation
+
+    def step_in_place(self, action: Action) -> Tuple[float, bool]:
+        """Runs the dynamics like :py:meth:`step`, but modifies the state in place
+
+        The inverse of each modification is recorded, such that
+        :py:meth:`undo` restores the state as it was before the step.  This
+        avoids a copy of the state per step, e.g., in depth-first tree search.
+
+        Args:
+            action (Action): the chosen action to apply
+
+        Returns:
+            Tuple[float, bool]: reward and terminal
+        """
+        state = self.state
+
+        if gv_debug() and not self.state_space.contains(state):
+            raise ValueError('state does not satisfy state_space')
+        if not self.action_space.contains(action):
+            raise ValueError(f'action {action} does not satisfy action-space')
+
+        # a new state (e.g., after a reset) starts a new undo log
+        if self._undo_log is None or state.grid.undo_log is not self._undo_log:
+            self._undo_log = UndoLog()
+            self._undo_checkpoints.clear()
+            state.grid.undo_log = state.agent.undo_log = self._undo_log
+
+        # reward and termination functions still need the previous state
+        previous_state = _shallow_copy(state)
+        self._undo_checkpoints.append(self._undo_log.checkpoint())
+        self._transition_function(state, action, rng=self._transition_rng)
+
+        if gv_debug() and not self.state_space.contains(state):
+            raise ValueError('next_state does not satisfy state_space')
+
+        reward = self._reward_function(previous_state, action, state)
+        terminal = self._termination_function(previous_state, action, state)
+
+        self._observation = None
+        return reward, terminal
+
+    def undo(self):
+        """Reverts the last :py:meth:`step_in_place`"""
+        if (
+            self._undo_log is None
+            or self.state.grid.undo_log is not self._undo_log
+            or not self._undo_checkpoints
+        ):
+            raise RuntimeError('there is no step to undo')
+
+        self._undo_log.undo(self._undo_checkpoints.pop())
+        self._observation = None
+
+
+def _shallow_copy(state: State) -> State:
+    """copies the grid layout and agent, sharing the grid objects"""
+    agent = state.agent
+    return State(
+        Grid([list(row) for row in state.grid.objects]),
+        Agent(
+            agent.position,
+            agent.orientation,
+            agent.grid_object,
+            agent.capacity,
+            agent.max_capacity,
+            agent.finished_deliver_num,
+        ),
+    )
+
+
+def _detach_objects(observation: Observation):
+    """replaces objects with instance attributes by copies"""
+    grid = observation.grid
+    for position in grid.area.positions():
+        if vars(grid[position]):
+            grid[position] = copy.deepcopy(grid[position])
+
+    if vars(observation.agent.grid_object):
+        observation.agent.grid_object = copy.deepcopy(
+            observation.agent.grid_object
+        )
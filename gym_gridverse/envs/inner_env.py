@@ -3,6 +3,7 @@ from typing import Optional, Tuple
 
 from gym_gridverse.action import Action
 from gym_gridverse.observation import Observation
+from gym_gridverse.rng import Seed
 from gym_gridverse.spaces import ActionSpace, ObservationSpace, StateSpace
 from gym_gridverse.state import State
 
@@ -33,7 +34,7 @@ class InnerEnv(metaclass=abc.ABCMeta):
         self._observation: Optional[Observation] = None
 
     @abc.abstractmethod
-    def set_seed(self, seed: Optional[int] = None):
+    def set_seed(self, seed: Optional[Seed] = None):
         assert False, "Must be implemented by derived class"
 
     @abc.abstractmethod
@@ -0,0 +1,417 @@
+"""Multi-agent drone delivery, with many drones sharing one grid
+
+The state of the drones and of the delivery objects is stored in arrays, and
+each step updates all drones at once with array operations, such that the cost
+of a step barely depends on the number of drones.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.random as rnd
+
+from gym_gridverse.action import Action
+from gym_gridverse.agent import Agent
+from gym_gridverse.envs.utils import get_next_position
+from gym_gridverse.geometry import Orientation, Position
+from gym_gridverse.grid_object import DeliveryAddress, DeliveryHub
+from gym_gridverse.rng import Seed, get_gv_rng_if_none, make_rng
+from gym_gridverse.state import State
+from gym_gridverse.utils.layouts import GridTemplate
+
+Actions = Union[Sequence[Action], np.ndarray]
+"""one action per drone, either Action members or their integer values"""
+
+
+@dataclass
+class DroneSwarmState:
+    """Array state of the drones and delivery objects;  row i is drone i"""
+
+    positions: np.ndarray
+    """(K, 2) drone (y, x) positions"""
+    orientations: np.ndarray
+    """(K,) drone orientations, as :py:class:`Orientation` values"""
+    capacities: np.ndarray
+    """(K,) number of items carried by each drone"""
+    finished_deliver_nums: np.ndarray
+    """(K,) number of items delivered by each drone"""
+    address_items: np.ndarray
+    """(H, W) number of items still requested by each DeliveryAddress"""
+    hub_items: np.ndarray
+    """(H, W) number of items still available in each DeliveryHub"""
+    hub_rewarded: np.ndarray
+    """(H, W) whether each empty DeliveryHub was already rewarded"""
+
+    @property
+    def num_drones(self) -> int:
+        return len(self.positions)
+
+    def copy(self) -> DroneSwarmState:
+        return DroneSwarmState(
+            **{f.name: getattr(self, f.name).copy() for f in fields(self)}
+        )
+
+
+@dataclass(frozen=True)
+class DroneRewards:
+    """Per-drone reward terms, see :py:meth:`MultiDroneGridWorld.functional_step`"""
+
+    living: float = -0.1
+    delivery: float = 800.0
+    reload: float = 200.0
+    hub_emptied: float = 200.0
+    """once per DeliveryHub, for the first ACTUATE on it once it is empty"""
+    empty_actuate: float = -10.0
+    """ACTUATE on an empty DeliveryHub, or on a DeliveryAddress which is empty
+    or without carried items"""
+    invalid_actuate: float = -5.0
+    """ACTUATE on any other object"""
+    holding: float = -0.2
+    """per carried item"""
+    terminal: float = 500.0
+
+
+class MultiDroneGridWorld:
+    """Drone delivery environment with `num_drones` drones sharing one grid.
+
+    Each drone moves and turns like the single agent of
+    :py:class:`~gym_gridverse.envs.gridworld.GridWorld` (`move_agent` and
+    `turn_agent`), and ACTUATE reloads one item on a non-empty DeliveryHub (if
+    below `max_capacity`), or delivers one item on a DeliveryAddress which
+    still requests items (if carrying any).
+
+    Drones never share a cell;  movement collisions are resolved
+    deterministically:
+
+    * drones which would swap cells both stay in place;
+    * drones moving into a cell which stays occupied stay in place;
+    * among drones moving into the same free cell, the lowest index moves and
+      the others stay in place;
+
+    repeated until no drone moves into an occupied cell.  Drones may follow
+    each other, i.e., move into a cell which is being vacated.
+
+    The episode ends when all items have been delivered.  This differs from
+    drone_env's `no_more_Deliverys`, which compares the deliveries of its
+    single agent to `DeliveryHub.target_num`;  the two coincide on layouts
+    requesting `DeliveryHub.target_num` items (e.g., the coin maze).
+    """
+
+    def __init__(
+        self,
+        template: GridTemplate,
+        num_drones: int,
+        *,
+        max_capacity: int = 10,
+        rewards: Optional[DroneRewards] = None,
+    ):
+        """Initializes the environment on a fixed layout
+
+        Args:
+            template (GridTemplate): grid layout
+            num_drones (int): number of drones, placed on random Floor cells
+            max_capacity (int): maximum number of items carried by a drone
+            rewards (DroneRewards, optional): reward terms
+        """
+        if not 0 < num_drones <= len(template.floor_positions):
+            raise ValueError(
+                f'number of drones ({num_drones}) must be positive and fit '
+                f'in the {len(template.floor_positions)} Floor cells'
+            )
+
+        self.template = template
+        self.num_drones = num_drones
+        self.max_capacity = max_capacity
+        self.rewards = DroneRewards() if rewards is None else rewards
+
+        grid = template.instantiate()
+        self._walkable = ~grid.property_mask('blocks_movement')
+        self._address_items = np.zeros(grid.shape.as_tuple, dtype=int)
+        self._hub_items = np.zeros(grid.shape.as_tuple, dtype=int)
+        self._address_mask = np.zeros(grid.shape.as_tuple, dtype=bool)
+        self._hub_mask = np.zeros(grid.shape.as_tuple, dtype=bool)
+        for object_type, array, mask, name in [
+            (
+                DeliveryAddress,
+                self._address_items,
+                self._address_mask,
+                'num_items',
+            ),
+            (DeliveryHub, self._hub_items, self._hub_mask, 'item_num'),
+        ]:
+            for positions in grid.object_index(object_type).values():
+                for position in positions:
+                    array[position.yx] = getattr(grid[position], name)
+                    mask[position.yx] = True
+
+        self._floor_positions = np.array(
+            [position.yx for position in template.floor_positions]
+        )
+
+        self._rng: Optional[rnd.Generator] = None
+        self._state: Optional[DroneSwarmState] = None
+
+    def set_seed(self, seed: Optional[Seed] = None):
+        self._rng = make_rng(seed)
+
+    def functional_reset(self) -> DroneSwarmState:
+        """Returns a new state, with drones on random distinct Floor cells"""
+        rng = get_gv_rng_if_none(self._rng)
+
+        indices = rng.choice(
+            len(self._floor_positions), size=self.num_drones, replace=False
+        )
+        return DroneSwarmState(
+            positions=self._floor_positions[indices],
+            orientations=rng.integers(len(Orientation), size=self.num_drones),
+            capacities=np.zeros(self.num_drones, dtype=int),
+            finished_deliver_nums=np.zeros(self.num_drones, dtype=int),
+            address_items=self._address_items.copy(),
+            hub_items=self._hub_items.copy(),
+            hub_rewarded=np.zeros(self._hub_items.shape, dtype=bool),
+        )
+
+    def functional_step(
+        self, state: DroneSwarmState, actions: Actions
+    ) -> Tuple[DroneSwarmState, np.ndarray, bool]:
+        """Returns next state, per-drone rewards, and done flag
+
+        Each drone receives the living reward, the holding reward per item it
+        carried, the delivery/reload reward for a successful ACTUATE, the
+        hub emptied, empty actuate or invalid actuate reward for other
+        ACTUATEs (as the drone_env reward functions), and, once all items are
+        delivered, the terminal reward.
+
+        Args:
+            state (DroneSwarmState): current state (not modified)
+            actions (Actions): one action per drone
+
+        Returns:
+            Tuple[DroneSwarmState, numpy.ndarray, bool]: next state, (K,)
+            rewards, and done flag
+        """
+        actions = _action_values(actions)
+        if actions.shape != (state.num_drones,):
+            raise ValueError(
+                f'expected {state.num_drones} actions, got {actions.shape}'
+            )
+
+        next_state = state.copy()
+        holding = state.capacities
+
+        targets = state.positions + _move_deltas[state.orientations, actions]
+        targets = np.where(
+            self._is_walkable(targets)[:, None], targets, state.positions
+        )
+        next_state.positions = resolve_collisions(
+            state.positions, targets, self._walkable.shape
+        )
+        next_state.orientations = _next_orientations[
+            state.orientations, actions
+        ]
+
+        actuate = actions == Action.ACTUATE.value
+        ys, xs = next_state.positions.T
+        on_hub = self._hub_mask[ys, xs]
+        on_address = self._address_mask[ys, xs]
+        hub_items = state.hub_items[ys, xs]
+        address_items = state.address_items[ys, xs]
+
+        reload = actuate & (hub_items > 0) & (holding < self.max_capacity)
+        deliver = actuate & (address_items > 0) & (holding > 0)
+        hub_emptied = (
+            actuate & on_hub & (hub_items == 0) & ~state.hub_rewarded[ys, xs]
+        )
+        empty_actuate = actuate & (
+            (on_hub & (hub_items == 0))
+            | (on_address & ((address_items == 0) | (holding == 0)))
+        )
+        invalid_actuate = actuate & ~on_hub & ~on_address
+
+        # drones occupy distinct cells, so each cell is updated at most once
+        next_state.hub_items[ys[reload], xs[reload]] -= 1
+        next_state.capacities[reload] += 1
+        next_state.address_items[ys[deliver], xs[deliver]] -= 1
+        next_state.capacities[deliver] -= 1
+        next_state.finished_deliver_nums[deliver] += 1
+        next_state.hub_rewarded[ys[hub_emptied], xs[hub_emptied]] = True
+
+        done = not next_state.address_items.any()
+
+        rewards = self.rewards.living + self.rewards.holding * holding
+        rewards[reload] += self.rewards.reload
+        rewards[deliver] += self.rewards.delivery
+        rewards[hub_emptied] += self.rewards.hub_emptied
+        rewards[empty_actuate] += self.rewards.empty_actuate
+        rewards[invalid_actuate] += self.rewards.invalid_actuate
+        if done:
+            rewards += self.rewards.terminal
+
+        return next_state, rewards, done
+
+    def reset(self):
+        """Resets the state"""
+        self._state = self.functional_reset()
+
+    def step(self, actions: Actions) -> Tuple[np.ndarray, bool]:
+        """Runs the dynamics for one timestep, and returns rewards and done flag
+
+        Args:
+            actions (Actions): one action per drone
+
+        Returns:
+            Tuple[numpy.ndarray, bool]: (K,) rewards and terminal
+        """
+        self._state, rewards, done = self.functional_step(self.state, actions)
+        return rewards, done
+
+    @property
+    def state(self) -> DroneSwarmState:
+        """Return the current state
+
+        Returns:
+            DroneSwarmState:
+        """
+        if self._state is None:
+            raise RuntimeError(
+                'The state was not set properly;  was the environment reset?'
+            )
+
+        return self._state
+
+    def to_state(self, state: DroneSwarmState, drone: int) -> State:
+        """Returns the single-agent view of the state, from a drone's side
+
+        Meant for rendering and for single-agent functions (e.g.,
+        observation functions);  the other drones are not represented.
+
+        Args:
+            state (DroneSwarmState):
+            drone (int): drone index
+
+        Returns:
+            State:
+        """
+        grid = self.template.instantiate()
+        for array, initial, name in [
+            (state.address_items, self._address_items, 'num_items'),
+            (state.hub_items, self._hub_items, 'item_num'),
+        ]:
+            for y, x in np.argwhere(array != initial).tolist():
+                grid.set_object_attribute(
+                    Position(y, x), name, int(array[y, x])
+                )
+
+        for y, x in np.argwhere(
+            (self._hub_items > 0) & (state.hub_items == 0)
+        ).tolist():
+            grid.set_object_attribute(Position(y, x), 'state_index', 1)
+
+        for y, x in np.argwhere(state.hub_rewarded).tolist():
+            grid.set_object_attribute(Position(y, x), 'is_rewarded', True)
+
+        agent = Agent(
+            Position(*state.positions[drone].tolist()),
+            Orientation(int(state.orientations[drone])),
+            capacity=int(state.capacities[drone]),
+            max_capacity=self.max_capacity,
+            finished_deliver_num=int(state.finished_deliver_nums[drone]),
+        )
+        return State(grid, agent)
+
+    def _is_walkable(self, positions: np.ndarray) -> np.ndarray:
+        height, width = self._walkable.shape
+        ys, xs = positions.T
+        inside = (0 <= ys) & (ys < height) & (0 <= xs) & (xs < width)
+        return (
+            inside
+            & self._walkable[ys.clip(0, height - 1), xs.clip(0, width - 1)]
+        )
+
+
+def resolve_collisions(
+    positions: np.ndarray, targets: np.ndarray, shape: Tuple[int, int]
+) -> np.ndarray:
+    """Returns the positions reached by agents moving towards targets
+
+    See :py:class:`MultiDroneGridWorld` for the collision rules.
+
+    Args:
+        positions (numpy.ndarray): (K, 2) distinct current positions
+        targets (numpy.ndarray): (K, 2) target positions, within shape
+        shape (Tuple[int, int]): grid (height, width)
+
+    Returns:
+        numpy.ndarray: (K, 2) distinct next positions
+    """
+    num_agents = len(positions)
+    num_cells = shape[0] * shape[1]
+    cells = np.ravel_multi_index(tuple(positions.T), shape)
+    target_cells = np.ravel_multi_index(tuple(targets.T), shape)
+    moving = target_cells != cells
+
+    # agents swapping cells both stay
+    owners = np.full(num_cells, -1)
+    owners[cells] = np.arange(num_agents)
+    others = owners[target_cells]
+    (movers,) = np.nonzero(moving & (others >= 0))
+    moving[movers[target_cells[others[movers]] == cells[movers]]] = False
+
+    while True:
+        occupied = np.zeros(num_cells, dtype=bool)
+        occupied[cells[~moving]] = True
+
+        # among agents moving into the same free cell, the lowest index wins
+        (candidates,) = np.nonzero(moving & ~occupied[target_cells])
+        _, first = np.unique(target_cells[candidates], return_index=True)
+        winners = np.zeros(num_agents, dtype=bool)
+        winners[candidates[first]] = True
+
+        if np.array_equal(winners, moving):
+            break
+
+        moving = winners
+
+    return np.where(moving[:, None], targets, positions)
+
+
+def _action_values(actions: Actions) -> np.ndarray:
+    if isinstance(actions, np.ndarray) and actions.dtype != object:
+        return actions
+
+    return np.array(
+        [
+            action.value if isinstance(action, Action) else action
+            for action in actions
+        ],
+        dtype=int,
+    )
+
+
+# (orientation, action) -> (dy, dx), as per move_agent
+_move_deltas = np.array(
+    [
+        [
+            get_next_position(Position(0, 0), orientation, action).yx
+            for action in Action
+        ]
+        for orientation in Orientation
+    ]
+)
+
+# (orientation, action) -> orientation, as per turn_agent
+_turn_orientations = {
+    Action.TURN_LEFT: Orientation.L,
+    Action.TURN_RIGHT: Orientation.R,
+}
+_next_orientations = np.array(
+    [
+        [
+            (orientation * _turn_orientations.get(action, Orientation.F)).value
+            for action in Action
+        ]
+        for orientation in Orientation
+    ]
+)
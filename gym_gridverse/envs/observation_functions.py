@@ -1,8 +1,9 @@
 import inspect
 import warnings
 from functools import partial
-from typing import List, Optional
+from typing import Hashable, List, Optional
 
+import numpy as np
 import numpy.random as rnd
 from typing_extensions import Protocol  # python3.7 compatibility
 
@@ -12,7 +13,8 @@ from gym_gridverse.envs.visibility_functions import (
     visibility_function_registry,
 )
 from gym_gridverse.geometry import Area, Orientation, Position
-from gym_gridverse.grid_object import Hidden
+from gym_gridverse.grid import Grid
+from gym_gridverse.grid_object import GridObject, Hidden
 from gym_gridverse.observation import Observation
 from gym_gridverse.state import State
 from gym_gridverse.utils.custom import import_if_custom
@@ -108,10 +110,10 @@ def from_visibility(
     visibility_function: VisibilityFunction,
     rng: Optional[rnd.Generator] = None,
 ) -> Observation:
-    pov_area = state.agent.transform * area
     pov_agent_position = Position(-area.ymin, -area.xmin)
 
-    observation_grid = state.grid.subgrid(pov_area) * state.agent.orientation
+    objects = state.grid.view_objects(state.agent.transform, area)
+    observation_grid = Grid(objects.tolist())
     visibility = visibility_function(
         observation_grid, pov_agent_position, rng=rng
     )
@@ -122,9 +124,9 @@ def from_visibility(
             f'should be {(area.height, area.width)}'
         )
 
-    for pos in observation_grid.area.positions():
-        if not visibility[pos.y, pos.x]:
-            observation_grid[pos] = Hidden()
+    if not visibility.all():
+        objects = np.where(visibility, objects, Hidden())
+        observation_grid = Grid(objects.tolist())
 
     observation_agent = Agent(
         pov_agent_position, Orientation.F, state.agent.grid_object
@@ -194,6 +196,66 @@ def stochastic_raytracing(
     )
 
 
+# deterministic observation functions whose observation only depends on the
+# objects in the agent view and on the held object
+_view_determined_observation_functions = {
+    fully_transparent,
+    partially_occluded,
+    raytracing,
+}
+
+
+def observation_cache_key(
+    observation_function: ObservationFunction, state: State
+) -> Optional[Hashable]:
+    """Returns a key which determines the observation, if there is one
+
+    The key is a snapshot of the full state of the objects in the (rotated)
+    agent view and of the held object (including attributes which do not
+    affect object equality, e.g., `DeliveryAddress.num_items`), and is only
+    available for deterministic observation functions obtained from
+    :py:func:`factory` (e.g., not for `stochastic_raytracing`).
+
+    Args:
+        observation_function (ObservationFunction):
+        state (State):
+    Returns:
+        Optional[Hashable]: cache key, or None if the observation is not cacheable
+    """
+    if (
+        not isinstance(observation_function, partial)
+        or observation_function.func
+        not in _view_determined_observation_functions
+    ):
+        return None
+
+    area = observation_function.keywords['area']
+    objects = state.grid.view_objects(state.agent.transform, area)
+    return (
+        tuple(_grid_object_key(obj) for obj in objects.flat),
+        _grid_object_key(state.agent.grid_object),
+    )
+
+
+def _grid_object_key(obj: GridObject) -> Hashable:
+    """snapshot of the type and instance attributes of an object"""
+    attributes = vars(obj)
+    if not attributes:
+        return type(obj)
+
+    return type(obj), tuple(
+        sorted(
+            (
+                name,
+                _grid_object_key(value)
+                if isinstance(value, GridObject)
+                else value,
+            )
+            for name, value in attributes.items()
+        )
+    )
+
+
 def factory(name: str, **kwargs) -> ObservationFunction:
     name = import_if_custom(name)
 
@@ -1,8 +1,16 @@
 import inspect
 import itertools as itt
 import warnings
-from functools import partial
-from typing import List, Optional, Set, Tuple, Type
+import weakref
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import lru_cache, partial
+from typing import Deque, List, Optional, Sequence, Set, Tuple, Type
 
 import more_itertools as mitt
 import numpy as np
@@ -33,10 +41,21 @@ from gym_gridverse.grid_object import (
     DeliveryAddress,
     DeliveryHub,
 )
-from gym_gridverse.rng import choice, choices, get_gv_rng_if_none, shuffle
+from gym_gridverse.rng import (
+    choice,
+    choices,
+    get_gv_rng_if_none,
+    make_rng,
+    shuffle,
+)
 from gym_gridverse.state import State
 from gym_gridverse.utils.custom import import_if_custom
 from gym_gridverse.utils.functions import checkraise_kwargs, select_kwargs
+from gym_gridverse.utils.layouts import (
+    GridTemplate,
+    cached_load_layout,
+    cached_parse_ascii_layout,
+)
 from gym_gridverse.utils.protocols import get_keyword_parameter
 from gym_gridverse.utils.registry import FunctionRegistry
 
@@ -594,6 +613,255 @@ def memory_rooms(
     return State(grid, agent)
 
 
+@reset_function_registry.register
+def from_layout(
+    ascii_layout: Sequence[str],
+    *,
+    agent_position: Optional[Sequence[int]] = None,
+    rng: Optional[rnd.Generator] = None,
+) -> State:
+    """A fixed ASCII layout, with a random agent orientation
+
+    The layout is compiled once into a
+    :py:class:`~gym_gridverse.utils.layouts.GridTemplate`, see
+    :py:data:`~gym_gridverse.utils.layouts.ASCII_LEGEND` for the characters;
+    each reset only clones the template.  In YAML:
+
+        reset_function:
+          name: from_layout
+          ascii_layout:
+            - '#####'
+            - '#H.1#'
+            - '#####'
+
+    Args:
+        ascii_layout (Sequence[str]): layout rows
+        agent_position (Sequence[int], optional): (y, x) agent position, on a
+            cell which does not block movement;  random Floor position if not
+            given
+        rng: (`Generator, optional`)
+
+    Returns:
+        State:
+    """
+    rng = get_gv_rng_if_none(rng)
+
+    template = cached_parse_ascii_layout(tuple(ascii_layout))
+    return _state_from_template(template, agent_position, rng=rng)
+
+
+@reset_function_registry.register
+def from_layout_file(
+    path: str,
+    *,
+    agent_position: Optional[Sequence[int]] = None,
+    rng: Optional[rnd.Generator] = None,
+) -> State:
+    """A fixed layout loaded from a file, with a random agent orientation
+
+    Suited to large custom maps;  the file (an ASCII map, or a `.npy` array of
+    character codes, see :py:func:`~gym_gridverse.utils.layouts.load_layout`)
+    is parsed in bulk into a
+    :py:class:`~gym_gridverse.utils.layouts.GridTemplate` once, and re-loaded
+    only if modified.  In YAML:
+
+        reset_function:
+          name: from_layout_file
+          path: maps/town.txt
+
+    Args:
+        path (str): layout file
+        agent_position (Sequence[int], optional): (y, x) agent position, on a
+            cell which does not block movement;  random Floor position if not
+            given
+        rng: (`Generator, optional`)
+
+    Returns:
+        State:
+    """
+    rng = get_gv_rng_if_none(rng)
+
+    template = cached_load_layout(path)
+    return _state_from_template(template, agent_position, rng=rng)
+
+
+def _state_from_template(
+    template: GridTemplate,
+    agent_position: Optional[Sequence[int]],
+    *,
+    rng: rnd.Generator,
+) -> State:
+    grid = template.instantiate()
+
+    position = (
+        choice(rng, template.floor_positions)
+        if agent_position is None
+        else Position(*agent_position)
+    )
+    if not grid.area.contains(position):
+        raise ValueError(f'agent position {position} is outside the grid')
+    if grid[position].blocks_movement:
+        raise ValueError(
+            f'agent position {position} is on a {type(grid[position]).__name__}'
+            ' which blocks movement'
+        )
+
+    agent = Agent(position, choice(rng, list(Orientation)))
+    return State(grid, agent)
+
+
+class ResetPool:
+    """Reset function which hands out pre-generated states.
+
+    Initial states are generated in batches of `pool_size` by the wrapped
+    reset function, in the background (a thread or a process) while the
+    previous batch is being used.  Each batch uses its own generator, seeded
+    from the rng given to the first call which needs it, so that the sequence
+    of states is deterministic given the rng;  if a different rng is given
+    (e.g., after the environment is re-seeded), pending states are discarded.
+
+    Satisfies the :py:class:`ResetFunction` protocol.
+    """
+
+    def __init__(
+        self,
+        reset_function: ResetFunction,
+        *,
+        pool_size: int = 64,
+        background: str = 'thread',
+    ):
+        """Wraps a reset function
+
+        Args:
+            reset_function (ResetFunction): function generating the states
+            pool_size (int): number of states generated per batch
+            background (str): 'thread', 'process', or 'none'
+        """
+        if pool_size <= 0:
+            raise ValueError(f'pool_size ({pool_size}) must be positive')
+
+        if background not in ['thread', 'process', 'none']:
+            raise ValueError(f'invalid background `{background}`')
+
+        self.reset_function = reset_function
+        self.pool_size = pool_size
+        self.background = background
+
+        self._executor: Optional[Executor] = None
+        self._states: Deque[State] = deque()
+        self._future: Optional[Future] = None
+        self._rng: Optional[rnd.Generator] = None
+
+    def __call__(self, *, rng: Optional[rnd.Generator] = None) -> State:
+        rng = get_gv_rng_if_none(rng)
+
+        if rng is not self._rng:
+            self.clear()
+            self._rng = rng
+
+        if not self._states:
+            if self._future is None:
+                self._submit(rng)
+
+            assert self._future is not None
+            self._states.extend(self._future.result())
+            self._future = None
+
+            # prepares the next batch while this one is being used;  without
+            # a background worker, the next batch is generated when needed
+            if self.background != 'none':
+                self._submit(rng)
+
+        return self._states.popleft()
+
+    def _submit(self, rng: rnd.Generator):
+        seed = int(rng.integers(np.iinfo(np.int64).max))
+
+        if self.background == 'none':
+            self._future = Future()
+            self._future.set_result(
+                _generate_states(self.reset_function, seed, self.pool_size)
+            )
+            return
+
+        if self._executor is None:
+            self._executor = (
+                ThreadPoolExecutor(max_workers=1)
+                if self.background == 'thread'
+                else ProcessPoolExecutor(max_workers=1)
+            )
+
+        self._future = self._executor.submit(
+            _generate_states, self.reset_function, seed, self.pool_size
+        )
+
+    def clear(self):
+        """Discards pre-generated and pending states"""
+        if self._future is not None:
+            self._future.cancel()
+
+        self._states.clear()
+        self._future = None
+        self._rng = None
+
+    def close(self):
+        """Discards all states and stops the background worker"""
+        self.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __del__(self):
+        # the executor is missing if __init__ raised
+        if getattr(self, '_executor', None) is not None:
+            self.close()
+
+
+def _generate_states(
+    reset_function: ResetFunction, seed: int, n: int
+) -> List[State]:
+    rng = make_rng(seed)
+    return [reset_function(rng=rng) for _ in range(n)]
+
+
+# pools of the `pooled` reset function, one per wrapped reset function and
+# pool arguments
+_reset_pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+@reset_function_registry.register
+def pooled(
+    *,
+    reset_function: ResetFunction,
+    pool_size: int = 64,
+    background: str = 'thread',
+    rng: Optional[rnd.Generator] = None,
+) -> State:
+    """Returns a pre-generated state of the given reset function
+
+    See :py:class:`ResetPool`;  the pool is shared by all calls with the same
+    `reset_function` object, `pool_size` and `background`.
+
+    Args:
+        reset_function (ResetFunction): function generating the states
+        pool_size (int): number of states generated per batch
+        background (str): 'thread', 'process', or 'none'
+        rng: (`Generator, optional`)
+
+    Returns:
+        State:
+    """
+    pools = _reset_pools.setdefault(reset_function, {})
+    try:
+        pool = pools[pool_size, background]
+    except KeyError:
+        pool = pools[pool_size, background] = ResetPool(
+            reset_function, pool_size=pool_size, background=background
+        )
+
+    return pool(rng=rng)
+
+
 def factory(name: str, **kwargs) -> ResetFunction:
     name = import_if_custom(name)
 
@@ -646,6 +914,19 @@ def delivery_town(
 
     rng = get_gv_rng_if_none(rng)
 
+    # the layout is fixed;  only the agent orientation is random
+    grid = _delivery_town_template(shape).instantiate()
+
+    # Agent Settings
+    agent_position = Position(1, 1)
+    agent_orientation = choice(rng, list(Orientation))
+    agent = Agent(agent_position, agent_orientation)
+
+    return State(grid, agent)
+
+
+@lru_cache(maxsize=None)
+def _delivery_town_template(shape: Shape) -> GridTemplate:
     if shape.height < 3 or shape.width < 5 or shape == Shape(3, 5):
         raise ValueError(f'Shape must larger than (3, 5), given {shape}')
 
@@ -682,9 +963,4 @@ def delivery_town(
     grid[2, 7] = DeliveryAddress(num_items=2)
     grid[7, 7] = DeliveryAddress(num_items=3)
 
-    # Agent Settings
-    agent_position = Position(1, 1)
-    agent_orientation = choice(rng, list(Orientation))
-    agent = Agent(agent_position, agent_orientation)
-
-    return State(grid, agent)
+    return GridTemplate.from_grid(grid)
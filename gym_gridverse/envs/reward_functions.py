@@ -1,6 +1,5 @@
 import inspect
 import warnings
-from collections import deque
 from functools import lru_cache, partial
 from typing import Callable, Iterator, List, Optional, Sequence, Tuple, Type
 
@@ -12,6 +11,7 @@ from typing_extensions import Protocol  # python3.7 compatibility
 from gym_gridverse.action import Action
 from gym_gridverse.envs.utils import get_next_position
 from gym_gridverse.geometry import DistanceFunction, Position
+from gym_gridverse.grid import Grid
 from gym_gridverse.grid_object import (
     Beacon,
     Door,
@@ -24,6 +24,7 @@ from gym_gridverse.grid_object import (
 )
 from gym_gridverse.state import State
 from gym_gridverse.utils.custom import import_if_custom
+from gym_gridverse.utils.distance_fields import multi_source_bfs
 from gym_gridverse.utils.functions import checkraise_kwargs, select_kwargs
 from gym_gridverse.utils.protocols import (
     get_keyword_parameter,
@@ -420,36 +421,44 @@ def getting_closer(
     )
 
 
+def _walkable_layout(grid: Grid) -> Tuple[Tuple[bool, ...], ...]:
+    """hashable layout of the cells which do not block movement"""
+    return tuple(map(tuple, (~grid.property_mask('blocks_movement')).tolist()))
+
+
+def _distance_field(grid: Grid, sources: np.ndarray) -> np.ndarray:
+    """distances to the nearest source through cells which do not block
+    movement;  cached based on the walkable cells and the sources"""
+    walkable = ~grid.property_mask('blocks_movement')
+    return _cached_distance_field(
+        grid.shape.as_tuple,
+        np.packbits(walkable).tobytes(),
+        np.packbits(sources).tobytes(),
+    )
+
+
+@lru_cache(maxsize=64)
+def _cached_distance_field(
+    shape: Tuple[int, int], walkable_bytes: bytes, sources_bytes: bytes
+) -> np.ndarray:
+    def unpack(data: bytes) -> np.ndarray:
+        bits = np.unpackbits(
+            np.frombuffer(data, dtype=np.uint8), count=shape[0] * shape[1]
+        )
+        return bits.reshape(shape).astype(bool)
+
+    distances = multi_source_bfs(
+        unpack(walkable_bytes), unpack(sources_bytes)
+    ).distances
+    distances.flags.writeable = False
+    return distances
+
+
 @lru_cache(maxsize=10)
 def dijkstra(
     layout: Tuple[Tuple[bool]], source_position: Tuple[int, int]
 ) -> np.ndarray:
-    layout_array = np.array(layout)
-
-    visited = np.zeros(layout_array.shape, dtype=bool)
-    visited[source_position] = True
-    distances = np.full(layout_array.shape, float('inf'))
-    distances[source_position] = 0.0
-
-    frontier = deque([source_position])
-    while frontier:
-        y_old, x_old = frontier.popleft()
-
-        for dy, dx in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            y_new = y_old + dy
-            x_new = x_old + dx
-
-            if (
-                0 <= y_new < layout_array.shape[0]
-                and 0 <= x_new < layout_array.shape[1]
-                and layout_array[y_new, x_new]
-                and not visited[y_new, x_new]
-            ):
-                distances[y_new, x_new] = distances[y_old, x_old] + 1
-                visited[y_new, x_new] = True
-                frontier.append((y_new, x_new))
-
-    return distances
+    return multi_source_bfs(np.array(layout), [source_position]).distances
 
 @reward_function_registry.register
 def getting_closer_Address(
@@ -481,62 +490,26 @@ def getting_closer_Address(
 
 
     def _distance_agent_to_nearest_object(state): # Delivery Address
-        object_positions = [
-            position
-            for position in state.grid.area.positions()
-            if isinstance(state.grid[position], object_type)
-        ]
-
-        if not object_positions:
+        # NaN outside of the addresses
+        items = state.grid.attribute_array(object_type, 'num_items')
+        is_address = ~np.isnan(items)
+        if not is_address.any():
             return float('inf')  # No objects of the specified type found
 
-        layout = tuple(
-            tuple(
-                not state.grid[y, x].blocks_movement
-                for x in range(state.grid.shape.width)
-            )
-            for y in range(state.grid.shape.height)
-        )
-
-        agent_position = (state.agent.position.y, state.agent.position.x)
-        distances = []
-
-        for object_position in object_positions:
-            distance_array = dijkstra(
-                layout, (object_position.y, object_position.x)
-            )
-            delivery_address = state.grid[object_position]
-            remaining_items = delivery_address.num_items 
-            if remaining_items == 0 :
-                 distances.append(100)
-            else :
-                distances.append(distance_array[agent_position[0], agent_position[1]])
-
-        return min(distances)
+        non_empty = is_address & (items != 0)
+        distance = _distance_field(state.grid, non_empty)[
+            state.agent.position.yx
+        ]
+        # empty addresses count as being at distance 100
+        has_empty = (non_empty != is_address).any()
+        return min(distance, 100) if has_empty else distance
 
     distance_prev = _distance_agent_to_nearest_object(state)
     distance_next = _distance_agent_to_nearest_object(next_state)
 
     def _weighted_address_value(state):
-        address_positions = [
-            position
-            for position in state.grid.area.positions()
-            if isinstance(state.grid[position], object_type)
-        ]
-
-        total_value = 0
-        for address_position in address_positions:
-            #distance_to_hub = _distance_to_nearest_hub(state, address_position)
-            delivery_address = state.grid[address_position]
-            remaining_items = delivery_address.num_items  # Assuming `remaining_items` attribute exists
-
-            # Higher reward for addresses closer to the hub and with more items
-            address_value = (
-                remaining_items * reward_items_factor
-            )
-            total_value += address_value
-
-        return total_value
+        items = state.grid.attribute_array(object_type, 'num_items')
+        return np.nansum(items) * reward_items_factor
 
     value_prev = _weighted_address_value(state)
     value_next = _weighted_address_value(next_state)
@@ -629,44 +602,18 @@ def getting_closer_Hub(
     """
 
     def _distance_agent_object(state):
-        object_position = mitt.one(
-            position
-            for position in state.grid.area.positions()
-            if isinstance(state.grid[position], object_type)
-        )
+        # NaN outside of the hub
+        items = state.grid.attribute_array(object_type, 'item_num')
+        is_hub = ~np.isnan(items)
+        if np.count_nonzero(is_hub) != 1:
+            raise ValueError(f'expected exactly one {object_type.__name__}')
+
+        return _distance_field(state.grid, is_hub)[state.agent.position.yx]
 
-        layout = tuple(
-            tuple(
-                not state.grid[y, x].blocks_movement
-                for x in range(state.grid.shape.width)
-            )
-            for y in range(state.grid.shape.height)
-        )
-        distance_array = dijkstra(
-            layout, (object_position.y, object_position.x)
-        )
-        return distance_array[state.agent.position.y, state.agent.position.x]
     def _weighted_address_value(state):
-        address_positions = [
-            position
-            for position in state.grid.area.positions()
-            if isinstance(state.grid[position], object_type)
-        ]
+        items = state.grid.attribute_array(object_type, 'item_num')
+        return np.nansum(items) * 0.01
 
-        total_value = 0
-        for address_position in address_positions:
-            #distance_to_hub = _distance_to_nearest_hub(state, address_position)
-            delivery_hub= state.grid[address_position]
-            remaining_items = delivery_hub.item_num  # Assuming `remaining_items` attribute exists
-            #print(f'Hub remain item :{remaining_items}')
-            # Higher reward for addresses closer to the hub and with more items
-            address_value = (
-                remaining_items * 0.01
-            )
-            total_value += address_value
-        
-        return total_value
-    
     distance_prev = _distance_agent_object(state)
     distance_next = _distance_agent_object(next_state)
 
@@ -734,13 +681,7 @@ def getting_closer_shortest_path(
             if isinstance(state.grid[position], object_type)
         )
 
-        layout = tuple(
-            tuple(
-                not state.grid[y, x].blocks_movement
-                for x in range(state.grid.shape.width)
-            )
-            for y in range(state.grid.shape.height)
-        )
+        layout = _walkable_layout(state.grid)
         distance_array = dijkstra(
             layout, (object_position.y, object_position.x)
         )
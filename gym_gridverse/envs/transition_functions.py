@@ -4,12 +4,13 @@ import warnings
 from functools import partial
 from typing import List, Optional, Sequence
 
+import numpy as np
 import numpy.random as rnd
 from typing_extensions import Protocol  # python3.7 compatibility
 
 from gym_gridverse.action import Action
 from gym_gridverse.envs.utils import get_next_position
-from gym_gridverse.geometry import Orientation, get_manhattan_boundary
+from gym_gridverse.geometry import Orientation, Position
 from gym_gridverse.grid_object import (
     Box,
     Door,
@@ -285,34 +286,90 @@ def move_obstacles(
 
     Randomly moves each MovingObstacle to a neighbouring Floor cell, if possible.
 
+    Obstacles are moved one at a time (in row-major order), so that each one
+    sees the moves of the previous ones;  however, only obstacles which are
+    close enough to another obstacle to be affected are processed
+    sequentially, while all others are processed at once.
+
     Args:
         state (`State`): current state
         action (`Action`): action taken by agent (ignored)
     """
     rng = get_gv_rng_if_none(rng)
 
+    # type checks once per distinct type, rather than once per cell
+    types = [type(obj) for row in state.grid.objects for obj in row]
+    distinct_types = list(dict.fromkeys(types))
+    type_ids = {t: i for i, t in enumerate(distinct_types)}
+    type_grid = np.array([type_ids[t] for t in types]).reshape(
+        state.grid.shape.height, state.grid.shape.width
+    )
+    is_floor = np.array([issubclass(t, Floor) for t in distinct_types])
+    is_obstacle = np.array(
+        [issubclass(t, MovingObstacle) for t in distinct_types]
+    )
+
+    # masks padded with non-floor cells, such that neighbours are always valid
+    floor = np.zeros((type_grid.shape[0] + 4, type_grid.shape[1] + 4), bool)
+    obstacles = np.zeros_like(floor)
+    floor[2:-2, 2:-2] = is_floor[type_grid]
+    obstacles[2:-2, 2:-2] = is_obstacle[type_grid]
+
     # get all positions before performing any movement
-    positions = [
-        position
-        for position in state.grid.area.positions()
-        if isinstance(state.grid[position], MovingObstacle)
-    ]
+    ys, xs = np.nonzero(obstacles)
+    if len(ys) == 0:
+        return
+
+    # one random number per obstacle, used to pick among its free neighbours
+    uniforms = rng.random(len(ys))
+
+    # (num_obstacles, 4) neighbours, same order as get_manhattan_boundary
+    neighbour_ys = ys[:, None] + _NEIGHBOUR_OFFSETS[:, 0]
+    neighbour_xs = xs[:, None] + _NEIGHBOUR_OFFSETS[:, 1]
+    candidates = floor[neighbour_ys, neighbour_xs]
+    num_candidates = candidates.sum(axis=1)
+    choices = (uniforms * num_candidates).astype(int)
+    targets = np.argmax(candidates.cumsum(axis=1) > choices[:, None], axis=1)
+
+    # obstacles within distance 2 of another obstacle may be affected by its
+    # move (taking or freeing a neighbour), and are processed sequentially
+    num_nearby_obstacles = sum(
+        obstacles[ys + dy, xs + dx] for dy, dx in _DIAMOND_OFFSETS
+    )
+    sequential = num_nearby_obstacles > 1
 
-    for position in positions:
-        next_positions = [
-            next_position
-            for next_position in get_manhattan_boundary(position, distance=1)
-            if state.grid.area.contains(next_position)
-            and isinstance(state.grid[next_position], Floor)
-        ]
-
-        try:
-            i = rng.choice(len(next_positions))
-        except ValueError:
-            pass
+    for i, (y, x) in enumerate(zip(ys.tolist(), xs.tolist())):
+        if sequential[i]:
+            free = floor[neighbour_ys[i], neighbour_xs[i]]
+            num_free = np.count_nonzero(free)
+            if num_free == 0:
+                continue
+
+            j = np.flatnonzero(free)[int(uniforms[i] * num_free)]
         else:
-            next_position = next_positions[i]
-            state.grid.swap(position, next_position)
+            if num_candidates[i] == 0:
+                continue
+
+            j = targets[i]
+
+        next_y = y + int(_NEIGHBOUR_OFFSETS[j, 0])
+        next_x = x + int(_NEIGHBOUR_OFFSETS[j, 1])
+        floor[y, x], floor[next_y, next_x] = True, False
+        state.grid.swap(
+            Position(y - 2, x - 2), Position(next_y - 2, next_x - 2)
+        )
+
+
+# up, right, down, left (same order as get_manhattan_boundary)
+_NEIGHBOUR_OFFSETS = np.array([(-1, 0), (0, 1), (1, 0), (0, -1)])
+
+# offsets with manhattan distance at most 2 (including zero)
+_DIAMOND_OFFSETS = [
+    (dy, dx)
+    for dy in range(-2, 3)
+    for dx in range(-2, 3)
+    if abs(dy) + abs(dx) <= 2
+]
 
 
 @transition_function_registry.register
@@ -350,14 +407,14 @@ def actuate_door(
         pass
 
     elif not door.is_locked:
-        door.state = Door.Status.OPEN
+        state.grid.set_object_attribute(position, 'state', Door.Status.OPEN)
 
     else:
         if (
             isinstance(state.agent.grid_object, Key)
             and state.agent.grid_object.color == door.color
         ):
-            door.state = Door.Status.OPEN
+            state.grid.set_object_attribute(position, 'state', Door.Status.OPEN)
 
 
 @transition_function_registry.register
@@ -406,15 +463,13 @@ def teleport(
     telepod = state.grid[state.agent.position]
 
     if isinstance(telepod, Telepod):
-        positions = [
-            position
-            for position in state.grid.area.positions()
-            if position != state.agent.position
-            and isinstance(state.grid[position], Telepod)
-            and state.grid[position].color == telepod.color
-        ]
-        i = rng.choice(len(positions))
-        state.agent.position = positions[i]
+        # telepods of the same color, including the current one
+        positions = state.grid.object_index(type(telepod))[telepod.color]
+        j = positions.index(state.agent.position)
+
+        # random telepod other than the current one
+        i = rng.choice(len(positions) - 1)
+        state.agent.position = positions[i if i < j else i + 1]
 
 
 def factory(name: str, **kwargs) -> TransitionFunction:
@@ -1,13 +1,14 @@
 import functools
 import inspect
 import warnings
-from typing import List, Optional, Union
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import numpy.random as rnd
 from typing_extensions import Protocol  # python3.7 compatibility
 
-from gym_gridverse.geometry import Position
+from gym_gridverse.geometry import Area, Position
 from gym_gridverse.grid import Grid
 from gym_gridverse.rng import get_gv_rng_if_none
 from gym_gridverse.utils.custom import import_if_custom
@@ -16,7 +17,10 @@ from gym_gridverse.utils.protocols import (
     get_keyword_parameter,
     get_positional_parameters,
 )
-from gym_gridverse.utils.raytracing import cached_compute_rays_fancy
+from gym_gridverse.utils.raytracing import (
+    cached_compute_ray_table,
+    count_lit_rays,
+)
 from gym_gridverse.utils.registry import FunctionRegistry
 
 
@@ -194,16 +198,9 @@ def raytracing(
     threshold: Union[int, float] = 1,
     rng: Optional[rnd.Generator] = None,
 ) -> np.ndarray:
-    rays = cached_compute_rays_fancy(position, grid.area)
-    counts_num = np.zeros((grid.shape.height, grid.shape.width), dtype=int)
-    counts_den = np.zeros((grid.shape.height, grid.shape.width), dtype=int)
-
-    for ray in rays:
-        light = True
-        for pos in ray:
-            counts_num[pos.y, pos.x] += int(light)
-            counts_den[pos.y, pos.x] += 1
-            light = light and not grid[pos].blocks_vision
+    table = cached_compute_ray_table(position, grid.area)
+    counts_num = count_lit_rays(table, _blocks_vision(grid))
+    counts_den = table.counts
 
     visibility = (
         counts_num >= threshold
@@ -222,23 +219,187 @@ def stochastic_raytracing(  # TODO: add test
 ) -> np.ndarray:
     rng = get_gv_rng_if_none(rng)
 
-    rays = cached_compute_rays_fancy(position, grid.area)
-    counts_num = np.zeros((grid.shape.height, grid.shape.width), dtype=int)
-    counts_den = np.zeros((grid.shape.height, grid.shape.width), dtype=int)
+    probs = stochastic_raytracing_probabilities(grid, position)
+    visibility = rng.random(probs.shape) <= probs
+    return visibility
+
+
+def stochastic_raytracing_probabilities(
+    grid: Grid, position: Position
+) -> np.ndarray:
+    """Returns the visibility probabilities used by `stochastic_raytracing`
+
+    The probability of each cell is the fraction of rays which reach it;
+    probability maps are cached per position and blocking mask.
+
+    Args:
+        grid (Grid):
+        position (Position):
+    Returns:
+        numpy.ndarray: (grid.shape.height, grid.shape.width) float array
+    """
+    blocks = _blocks_vision(grid)
+    return _cached_stochastic_raytracing_probabilities(
+        position, blocks.shape, np.packbits(blocks).tobytes()
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_stochastic_raytracing_probabilities(
+    position: Position, shape: Sequence[int], packed_blocks: bytes
+) -> np.ndarray:
+    height, width = shape
+    blocks = np.unpackbits(
+        np.frombuffer(packed_blocks, dtype=np.uint8), count=height * width
+    )
+    blocks = blocks.reshape(height, width).astype(bool)
+
+    area = Area((0, height - 1), (0, width - 1))
+    table = cached_compute_ray_table(position, area)
+    counts_num = count_lit_rays(table, blocks)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        probs = np.nan_to_num(counts_num / table.counts)
+
+    probs.flags.writeable = False
+    return probs
+
+
+def stochastic_raytracing_batch(
+    grids: Sequence[Grid],
+    positions: Sequence[Position],
+    *,
+    rng: Optional[rnd.Generator] = None,
+) -> np.ndarray:
+    """Batched `stochastic_raytracing` over grids of the same shape
+
+    All visibilities are sampled with a single call to the rng.
 
-    for ray in rays:
-        light = True
-        for pos in ray:
-            counts_num[pos.y, pos.x] += int(light)
-            counts_den[pos.y, pos.x] += 1
-            light = light and not grid[pos].blocks_vision
+    Args:
+        grids (Sequence[Grid]):
+        positions (Sequence[Position]):
+        rng (Optional[rnd.Generator]):
+    Returns:
+        numpy.ndarray: (len(grids), height, width) boolean array
+    """
+    rng = get_gv_rng_if_none(rng)
 
-    probs = np.nan_to_num(counts_num / counts_den)
+    probs = np.stack(
+        [
+            stochastic_raytracing_probabilities(grid, position)
+            for grid, position in zip(grids, positions)
+        ]
+    )
     visibility = rng.random(probs.shape) <= probs
     return visibility
 
 
-def factory(name: str, **kwargs) -> VisibilityFunction:
+def _blocks_vision(grid: Grid) -> np.ndarray:
+    return grid.property_mask('blocks_vision')
+
+
+class CachedVisibilityFunction:
+    """Visibility function wrapper which memoizes visibilities.
+
+    Deterministic visibility functions such as `raytracing` or
+    `partially_occluded` only depend on the agent position and on which cells
+    block vision.  This wrapper packs the `blocks_vision` mask into a bytes key,
+    and keeps the most recently used visibilities in a bounded cache.  Cached
+    visibilities are shared, and therefore read-only.
+
+    Only wrap visibility functions which satisfy the above (i.e., not
+    `stochastic_raytracing`).
+    """
+
+    def __init__(
+        self, visibility_function: VisibilityFunction, *, maxsize: int = 1024
+    ):
+        """Wraps a deterministic visibility function
+
+        Args:
+            visibility_function (VisibilityFunction): function to memoize
+            maxsize (int): maximum number of cached visibilities
+        """
+        if maxsize <= 0:
+            raise ValueError(f'maxsize ({maxsize}) must be positive')
+
+        self.visibility_function = visibility_function
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[
+            Tuple[Position, Tuple[int, int], bytes], np.ndarray
+        ] = OrderedDict()
+
+    def __call__(
+        self,
+        grid: Grid,
+        position: Position,
+        *,
+        rng: Optional[rnd.Generator] = None,
+    ) -> np.ndarray:
+        blocks = _blocks_vision(grid)
+        key = (position, blocks.shape, np.packbits(blocks).tobytes())
+
+        try:
+            visibility = self._cache[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return visibility
+
+        self.misses += 1
+        visibility = self.visibility_function(grid, position, rng=rng)
+        visibility.flags.writeable = False
+
+        self._cache[key] = visibility
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+        return visibility
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of calls served from the cache (0.0 if never called)"""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls > 0 else 0.0
+
+    def cache_info(self) -> Dict[str, Union[int, float]]:
+        """Returns cache statistics"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'size': len(self._cache),
+            'maxsize': self.maxsize,
+        }
+
+    def cache_clear(self):
+        """Clears the cache and its statistics"""
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+
+# visibility functions which use the rng, and cannot be cached
+_stochastic_visibility_functions = {stochastic_raytracing}
+
+
+def factory(
+    name: str, *, cache_size: Optional[int] = None, **kwargs
+) -> VisibilityFunction:
+    """Returns the named visibility function, with bound arguments
+
+    Args:
+        name (str): registered (or custom) visibility function name
+        cache_size (Optional[int]): if given, the visibility function is
+            wrapped in a :py:class:`CachedVisibilityFunction` of this size
+        **kwargs: visibility function arguments
+    Returns:
+        VisibilityFunction:
+    """
     name = import_if_custom(name)
 
     try:
@@ -264,4 +425,12 @@ def factory(name: str, **kwargs) -> VisibilityFunction:
 
     checkraise_kwargs(kwargs, required_keys)
     kwargs = select_kwargs(kwargs, required_keys + optional_keys)
-    return functools.partial(function, **kwargs)
+    visibility_function = functools.partial(function, **kwargs)
+
+    if cache_size is None:
+        return visibility_function
+
+    if function in _stochastic_visibility_functions:
+        raise ValueError(f'visibility function {name} cannot be cached')
+
+    return CachedVisibilityFunction(visibility_function, maxsize=cache_size)
@@ -45,6 +45,9 @@ def process_reserved_keys(data):
             for d in data['terminating_functions']
         ]
 
+    if 'reset_function' in data:
+        data['reset_function'] = factory_reset_function(data['reset_function'])
+
     if 'reward_function' in data:
         data['reward_function'] = factory_reward_function(
             data['reward_function']
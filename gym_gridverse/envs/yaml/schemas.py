@@ -123,8 +123,12 @@ schemas.update(
             as_reference=True,
         ),
         'visibility_function': Schema(
-            {'name': str, Optional(object): object},
-            description='A visibility function',
+            {
+                'name': str,
+                Optional('cache_size'): And(int, _positive_schema()),
+                Optional(object): object,
+            },
+            description='A visibility function;  cache_size enables caching (deterministic functions only)',
             name='visibility_function',
             as_reference=True,
         ),
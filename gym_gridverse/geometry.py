@@ -6,6 +6,8 @@ import math
 from dataclasses import dataclass
 from typing import Callable, Iterable, List, Sequence, Tuple, Union, overload
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class Shape:
@@ -117,12 +119,60 @@ class Area:
 
         return positions
 
+    def coordinates(self, selection: str = 'all') -> np.ndarray:
+        """array of all/border/inside coordinates
+
+        Array equivalent of :py:meth:`positions`, with the same order.
+
+        Args:
+            selection (str): 'all', 'border', or 'inside'
+        Returns:
+            numpy.ndarray: (N, 2) integer array of (y, x) coordinates
+        """
+
+        if selection not in ['all', 'border', 'inside']:
+            raise ValueError(f'invalid selection `{selection}`')
+
+        ys = np.arange(self.ymin, self.ymax + 1)
+        xs = np.arange(self.xmin, self.xmax + 1)
+
+        if selection == 'all':
+            return _cartesian_product(ys, xs)
+
+        if selection == 'border':
+            return np.concatenate(
+                [
+                    _cartesian_product(np.array([self.ymin, self.ymax]), xs),
+                    _cartesian_product(
+                        ys[1:-1], np.array([self.xmin, self.xmax])
+                    ),
+                ]
+            )
+
+        return _cartesian_product(ys[1:-1], xs[1:-1])
+
     def contains(self, position: Position) -> bool:
         return (
             self.ymin <= position.y <= self.ymax
             and self.xmin <= position.x <= self.xmax
         )
 
+    def contains_coordinates(self, coordinates: np.ndarray) -> np.ndarray:
+        """array equivalent of :py:meth:`contains`
+
+        Args:
+            coordinates (numpy.ndarray): (..., 2) array of (y, x) coordinates
+        Returns:
+            numpy.ndarray: (...) boolean array
+        """
+        ys, xs = coordinates[..., 0], coordinates[..., 1]
+        return (
+            (self.ymin <= ys)
+            & (ys <= self.ymax)
+            & (self.xmin <= xs)
+            & (xs <= self.xmax)
+        )
+
 
 @dataclass(frozen=True)
 class Position:
@@ -210,9 +260,13 @@ class Orientation(enum.Enum):
     def __mul__(self, other: Area) -> Area:
         ...
 
+    @overload
+    def __mul__(self, other: np.ndarray) -> np.ndarray:
+        ...
+
     def __mul__(
-        self, other: Union[Orientation, Position, Area]
-    ) -> Union[Orientation, Position, Area]:
+        self, other: Union[Orientation, Position, Area, np.ndarray]
+    ) -> Union[Orientation, Position, Area, np.ndarray]:
         if isinstance(other, Orientation):
             return _orientation_rotations[self, other]
 
@@ -231,6 +285,10 @@ class Orientation(enum.Enum):
 
             assert False
 
+        if isinstance(other, np.ndarray):
+            # coordinates are (y, x) pairs along the last axis
+            return other @ _orientation_matrices[self].T
+
         if isinstance(other, Area):
             if self is Orientation.F:
                 return Area(
@@ -298,9 +356,13 @@ class Transform:
     def __mul__(self, other: Orientation) -> Orientation:
         ...
 
+    @overload
+    def __mul__(self, other: np.ndarray) -> np.ndarray:
+        ...
+
     def __mul__(
-        self, other: Union[Transform, Position, Area, Orientation]
-    ) -> Union[Transform, Position, Area, Orientation]:
+        self, other: Union[Transform, Position, Area, Orientation, np.ndarray]
+    ) -> Union[Transform, Position, Area, Orientation, np.ndarray]:
         """Returns rigid body transformation of other geometric objects
 
         Implements the following behaviors:
@@ -308,8 +370,13 @@ class Transform:
         2. transform * position -> transformed position
         3. transform * orientation -> transformed orientation
         4. transform * area -> transformed area
+        5. transform * coordinates -> transformed coordinates, i.e., array
+           with (y, x) pairs along the last axis
         """
 
+        if isinstance(other, np.ndarray):
+            return np.asarray(self.position.yx) + self.orientation * other
+
         if isinstance(other, Transform):
             return Transform(
                 self.position + self.orientation * other.position,
@@ -378,20 +445,76 @@ def get_manhattan_boundary(position: Position, distance: int) -> List[Position]:
     return boundary
 
 
+def get_manhattan_boundary_coordinates(
+    coordinates: np.ndarray, distance: int
+) -> np.ndarray:
+    """Array equivalent of :py:func:`get_manhattan_boundary`
+
+    Args:
+        coordinates (numpy.ndarray): (..., 2) array of (y, x) centers
+        distance (int): The distance of the boundary returned
+
+    Returns:
+        numpy.ndarray: (..., 4 * distance, 2) array of boundary coordinates,
+        in the same order as :py:func:`get_manhattan_boundary`
+    """
+    offsets = np.array(
+        [
+            position.yx
+            for position in get_manhattan_boundary(Position(0, 0), distance)
+        ]
+    )
+    return np.asarray(coordinates)[..., None, :] + offsets
+
+
+def manhattan_distances(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """manhattan distances between broadcastable (..., 2) coordinate arrays"""
+    return np.abs(np.subtract(p, q)).sum(axis=-1)
+
+
+def euclidean_distances(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """euclidean distances between broadcastable (..., 2) coordinate arrays"""
+    return np.sqrt(np.square(np.subtract(p, q)).sum(axis=-1))
+
+
 DistanceFunction = Callable[[Position, Position], float]
+DistanceArrayFunction = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
 
+def distance_function_factory(name: str, *, vectorized: bool = False):
+    """Returns the named distance function
+
+    Args:
+        name (str): 'manhattan' or 'euclidean'
+        vectorized (bool): if True, returns the array equivalent
+            (:py:data:`DistanceArrayFunction`) instead of the
+            :py:data:`DistanceFunction`
 
-def distance_function_factory(name: str):
+    Returns:
+        Union[DistanceFunction, DistanceArrayFunction]:
+    """
     # TODO: test
     if name == 'manhattan':
-        return Position.manhattan_distance
+        return (
+            manhattan_distances if vectorized else Position.manhattan_distance
+        )
 
     if name == 'euclidean':
-        return Position.euclidean_distance
+        return (
+            euclidean_distances if vectorized else Position.euclidean_distance
+        )
 
     raise ValueError(f'invalid distance function name {name}')
 
 
+def _cartesian_product(ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+    """(len(ys) * len(xs), 2) array of (y, x) pairs, in row-major order"""
+    coordinates = np.empty((len(ys), len(xs), 2), dtype=int)
+    coordinates[..., 0] = ys[:, None]
+    coordinates[..., 1] = xs[None, :]
+    return coordinates.reshape(-1, 2)
+
+
 # cached values (used to avoid if-else chains)
 
 # for Position.from_orientation
@@ -426,6 +549,14 @@ _orientation_rotations = {
     (Orientation.L, Orientation.L): Orientation.B,
 }
 
+# for Orientation.__mul__ (coordinate arrays), acting on (y, x) column vectors
+_orientation_matrices = {
+    Orientation.F: np.array([[1, 0], [0, 1]]),
+    Orientation.R: np.array([[0, 1], [-1, 0]]),
+    Orientation.B: np.array([[-1, 0], [0, -1]]),
+    Orientation.L: np.array([[0, -1], [1, 0]]),
+}
+
 # for Orientation.neg
 _orientation_neg = {
     Orientation.F: Orientation.F,
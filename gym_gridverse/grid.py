@@ -1,9 +1,26 @@
 from __future__ import annotations
 
-from typing import List, Set, Tuple, Type, Union, cast
-
-from .geometry import Area, Orientation, Position, Shape
-from .grid_object import Floor, GridObject, GridObjectFactory, Hidden
+import copy
+from collections import Counter
+from functools import lru_cache
+from typing import (
+    Any,
+    Counter as CounterType,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+import numpy as np
+
+from .geometry import Area, Orientation, Position, Shape, Transform
+from .grid_object import Color, Floor, GridObject, GridObjectFactory, Hidden
+from .utils.undo_log import UndoLog
 
 
 class Grid:
@@ -25,6 +42,33 @@ class Grid:
         self.shape = Shape(len(objects), len(objects[0]))
         self.area = Area((0, self.shape.height - 1), (0, self.shape.width - 1))
 
+        # if set, modifications record their inverse operations
+        self.undo_log: Optional[UndoLog] = None
+
+        # positions of objects of the indexed types, see object_index
+        self._object_index: Dict[
+            Type[GridObject], Dict[Color, Tuple[Position, ...]]
+        ] = {}
+
+        # histograms of object types and colors (built on first use, then
+        # updated by writes), see object_types and object_colors
+        self._type_counts: Optional[CounterType[Type[GridObject]]] = None
+        self._color_counts: Optional[CounterType[Color]] = None
+
+        # boolean masks of object properties (built on first use, then updated
+        # by writes), see property_mask
+        self._property_masks: Dict[str, np.ndarray] = {}
+
+        # numeric attributes of the objects of a type (built on first use, then
+        # updated by writes), see attribute_array
+        self._attribute_arrays: Dict[
+            Tuple[Type[GridObject], str], np.ndarray
+        ] = {}
+
+        # objects padded with Hidden objects on all sides, see view_objects
+        self._padded_objects: Optional[np.ndarray] = None
+        self._padding = 0
+
     @staticmethod
     def from_shape(
         shape: Union[Shape, Tuple[int, int]],
@@ -64,7 +108,122 @@ class Grid:
         Returns:
             Set[Type[GridObject]]:
         """
-        return set(type(self[position]) for position in self.area.positions())
+        if self._type_counts is None:
+            self._type_counts = Counter(
+                type(obj) for row in self.objects for obj in row
+            )
+
+        return set(self._type_counts)
+
+    def object_colors(self) -> Set[Color]:
+        """Returns the set of object colors in the grid
+
+        Returns:
+            Set[Color]:
+        """
+        if self._color_counts is None:
+            self._color_counts = Counter(
+                obj.color for row in self.objects for obj in row
+            )
+
+        return set(self._color_counts)
+
+    def property_mask(self, name: str) -> np.ndarray:
+        """Returns the boolean mask of an object property.
+
+        The mask is built on first use, and then kept up to date by writes
+        (:py:meth:`__setitem__`, :py:meth:`swap` and
+        :py:meth:`set_object_attribute`);  the returned array is a read-only
+        view, which reflects later writes.
+
+        Args:
+            name (str): 'blocks_movement', 'blocks_vision', or 'holdable'
+        Returns:
+            numpy.ndarray: (height, width) boolean array
+        """
+        try:
+            mask = self._property_masks[name]
+        except KeyError:
+            if name not in _MASK_PROPERTIES:
+                raise ValueError(f'invalid object property `{name}`')
+
+            mask = np.array(
+                [[getattr(obj, name) for obj in row] for row in self.objects],
+                dtype=bool,
+            )
+            self._property_masks[name] = mask
+
+        view = mask.view()
+        view.flags.writeable = False
+        return view
+
+    def attribute_array(
+        self, object_type: Type[GridObject], name: str
+    ) -> np.ndarray:
+        """Returns a numeric attribute of the objects of a type, as an array.
+
+        Cells which do not contain an object of exactly `object_type` are NaN.
+        Like :py:meth:`property_mask`, the array is built on first use, and
+        then kept up to date by writes;  the returned array is a read-only
+        view, which reflects later writes.
+
+        Args:
+            object_type (Type[GridObject]): exact type of the objects
+            name (str): attribute name, e.g., 'num_items'
+        Returns:
+            numpy.ndarray: (height, width) float array
+        """
+        try:
+            array = self._attribute_arrays[object_type, name]
+        except KeyError:
+            array = np.array(
+                [
+                    [_object_attribute(obj, object_type, name) for obj in row]
+                    for row in self.objects
+                ],
+                dtype=float,
+            ).reshape(self.shape.as_tuple)
+            self._attribute_arrays[object_type, name] = array
+
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def object_index(
+        self, object_type: Type[GridObject]
+    ) -> Dict[Color, Tuple[Position, ...]]:
+        """Returns the positions of the objects of a type, grouped by color.
+
+        The first call registers interest in the object type and builds the
+        index;  the index is then reused until an object of that type is
+        written, moved or modified in the grid.  Meant for objects which
+        rarely move (telepods, exits, ...), so that queries are O(1).
+
+        Positions are in row-major order.
+
+        Args:
+            object_type (Type[GridObject]): exact type of the objects
+        Returns:
+            Dict[Color, Tuple[~gym_gridverse.geometry.Position, ...]]:
+        """
+        try:
+            return self._object_index[object_type]
+        except KeyError:
+            pass
+
+        positions: Dict[Color, List[Position]] = {}
+        for y, row in enumerate(self.objects):
+            for x, obj in enumerate(row):
+                if type(obj) is object_type:
+                    positions.setdefault(obj.color, []).append(Position(y, x))
+
+        index = {color: tuple(ps) for color, ps in positions.items()}
+        self._object_index[object_type] = index
+        return index
+
+    def _invalidate_object_index(self, *objs: GridObject):
+        for obj in objs:
+            self._object_index.pop(type(obj), None)
 
     def get(
         self,
@@ -110,8 +269,69 @@ class Grid:
         if not isinstance(obj, GridObject):
             raise TypeError('grid can only contain grid objects')
 
+        if self.undo_log is not None:
+            self.undo_log.record(self.__setitem__, (y, x), self.objects[y][x])
+
+        if self._object_index:
+            self._invalidate_object_index(self.objects[y][x], obj)
+
+        if self._type_counts is not None:
+            _counter_replace(
+                self._type_counts, type(self.objects[y][x]), type(obj)
+            )
+        if self._color_counts is not None:
+            _counter_replace(
+                self._color_counts, self.objects[y][x].color, obj.color
+            )
+
         self.objects[y][x] = obj
 
+        for name, mask in self._property_masks.items():
+            mask[y, x] = getattr(obj, name)
+
+        for (object_type, name), array in self._attribute_arrays.items():
+            array[y, x] = _object_attribute(obj, object_type, name)
+
+        if self._padded_objects is not None:
+            self._padded_objects[
+                y % self.shape.height + self._padding,
+                x % self.shape.width + self._padding,
+            ] = obj
+
+    def set_object_attribute(self, position: Position, name: str, value: Any):
+        """Sets an attribute of the grid object at the given position.
+
+        If the grid has an undo log, the object is copied before being
+        modified (and written back), so that the change is recorded and other
+        references to the object are not affected.
+
+        Args:
+            position (~gym_gridverse.geometry.Position):
+            name (str): attribute name
+            value (Any): attribute value
+        """
+        obj = self[position]
+
+        if self.undo_log is not None:
+            obj = copy.copy(obj)
+            self[position] = obj
+        else:
+            if self._object_index:
+                self._invalidate_object_index(obj)
+            if name == 'color':
+                self._color_counts = None
+
+        setattr(obj, name, value)
+
+        # properties may depend on the modified attribute (e.g., door state)
+        for mask_name, mask in self._property_masks.items():
+            mask[position.y, position.x] = getattr(obj, mask_name)
+
+        for (object_type, array_name), array in self._attribute_arrays.items():
+            array[position.y, position.x] = _object_attribute(
+                obj, object_type, array_name
+            )
+
     def swap(self, p: Position, q: Position):
         """Swaps the grid objects at two positions.
 
@@ -119,7 +339,33 @@ class Grid:
             p (~gym_gridverse.geometry.Position):
             q (~gym_gridverse.geometry.Position):
         """
-        self[p], self[q] = self[q], self[p]
+        (py, px), (qy, qx) = p.yx, q.yx
+
+        if self._object_index:
+            self._invalidate_object_index(
+                self.objects[py][px], self.objects[qy][qx]
+            )
+
+        self.objects[py][px], self.objects[qy][qx] = (
+            self.objects[qy][qx],
+            self.objects[py][px],
+        )
+
+        for mask in self._property_masks.values():
+            mask[py, px], mask[qy, qx] = mask[qy, qx], mask[py, px]
+
+        for array in self._attribute_arrays.values():
+            array[py, px], array[qy, qx] = array[qy, qx], array[py, px]
+
+        if self._padded_objects is not None:
+            padded, d = self._padded_objects, self._padding
+            padded[py + d, px + d], padded[qy + d, qx + d] = (
+                self.objects[py][px],
+                self.objects[qy][qx],
+            )
+
+        if self.undo_log is not None:
+            self.undo_log.record(self.swap, p, q)
 
     def subgrid(self, area: Area) -> Grid:
         """Returns subgrid slice at given area.
@@ -145,6 +391,48 @@ class Grid:
             ]
         )
 
+    def view_objects(self, transform: Transform, area: Area) -> np.ndarray:
+        """Returns the objects in the area, as seen from a frame of reference.
+
+        Array equivalent of `(self.subgrid(transform * area) *
+        transform.orientation).objects`, i.e., cells outside of the grid are
+        represented as Hidden objects.  The objects are gathered from a
+        Hidden-padded object array (kept up to date by grid writes) using
+        precomputed per-orientation index maps.
+
+        Args:
+            transform (~gym_gridverse.geometry.Transform): frame of reference
+            area (~gym_gridverse.geometry.Area): area relative to the frame
+        Returns:
+            numpy.ndarray: (area.height, area.width) object array
+        """
+        # areas are not necessarily hashable (e.g., if built from lists)
+        ys, xs, padding = _view_index_maps(
+            area.ymin, area.ymax, area.xmin, area.xmax, transform.orientation
+        )
+
+        if self._padded_objects is None or self._padding < padding:
+            self._padded_objects = _pad_objects(self.objects, padding)
+            self._padding = padding
+
+        y, x = transform.position.yx
+        return self._padded_objects[
+            ys + (y + self._padding), xs + (x + self._padding)
+        ]
+
+    def view(self, transform: Transform, area: Area) -> Grid:
+        """Returns the area as seen from a frame of reference.
+
+        Equivalent to `self.subgrid(transform * area) * transform.orientation`.
+
+        Args:
+            transform (~gym_gridverse.geometry.Transform): frame of reference
+            area (~gym_gridverse.geometry.Area): area relative to the frame
+        Returns:
+            Grid: New instance, sliced and rotated appropriately
+        """
+        return Grid(self.view_objects(transform, area).tolist())
+
     def __mul__(self, other: Orientation) -> Grid:
         """returns grid transformed according to given orientation.
 
@@ -183,10 +471,62 @@ class Grid:
     def __hash__(self):
         return hash(tuple(map(tuple, self.objects)))
 
+    def __getstate__(self):
+        # copies do not share (or record into) the undo log
+        state = self.__dict__.copy()
+        state['undo_log'] = None
+        # cheaper to rebuild on demand than to copy
+        state['_padded_objects'] = None
+        state['_padding'] = 0
+        return state
+
     def __repr__(self):
         return f'<{self.__class__.__name__} {self.shape.height}x{self.shape.width} objects={self.objects}>'
 
 
+# object properties with a mask, see Grid.property_mask
+_MASK_PROPERTIES = ('blocks_movement', 'blocks_vision', 'holdable')
+
+
+# cell value of Grid.attribute_array
+def _object_attribute(
+    obj: GridObject, object_type: Type[GridObject], name: str
+) -> float:
+    return getattr(obj, name) if type(obj) is object_type else np.nan
+
+
+def _counter_replace(counter: CounterType, old: Any, new: Any):
+    """updates the histogram after replacing an `old` item with a `new` one"""
+    if old != new:
+        counter[new] += 1
+        counter[old] -= 1
+        if counter[old] == 0:
+            del counter[old]
+
+
+@lru_cache(maxsize=None)
+def _view_index_maps(
+    ymin: int, ymax: int, xmin: int, xmax: int, orientation: Orientation
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """index maps (relative to the frame position) of the rotated area cells,
+    and the padding which keeps them within a padded grid"""
+    area = Area((ymin, ymax), (xmin, xmax))
+    coordinates = orientation * area.coordinates()
+    coordinates = coordinates.reshape(area.height, area.width, 2)
+    ys, xs = coordinates[..., 0], coordinates[..., 1]
+    ys.flags.writeable = xs.flags.writeable = False
+    return ys, xs, int(np.abs(coordinates).max())
+
+
+def _pad_objects(objects: List[List[GridObject]], padding: int) -> np.ndarray:
+    height, width = len(objects), len(objects[0])
+    padded = np.empty((height + 2 * padding, width + 2 * padding), dtype=object)
+    padded.flat = [Hidden() for _ in range(padded.size)]
+    for y, row in enumerate(objects, padding):
+        padded[y, padding : padding + width] = row
+    return padded
+
+
 def _rotate_matrix_forward(data):
     return data
 
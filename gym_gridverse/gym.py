@@ -2,15 +2,15 @@ from __future__ import annotations
 
 import time
 from functools import partial
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import gym
 import numpy as np
 import pkg_resources
-from gym.utils import seeding
 
 from gym_gridverse.envs.yaml.factory import factory_env_from_yaml
 from gym_gridverse.outer_env import OuterEnv
+from gym_gridverse.rasterization import GridVerseRasterizer
 from gym_gridverse.representations.observation_representations import (
     make_observation_representation,
 )
@@ -18,6 +18,7 @@ from gym_gridverse.representations.spaces import Space, SpaceType
 from gym_gridverse.representations.state_representations import (
     make_state_representation,
 )
+from gym_gridverse.rng import Seed, make_seed_sequence
 
 
 def outer_space_to_gym_space(space: Dict[str, Space]) -> gym.spaces.Space:
@@ -42,7 +43,14 @@ def from_factory(factory: OuterEnvFactory):
 
 class GymEnvironment(gym.Env):
     metadata = {
-        'render.modes': ['human', 'human_state', 'human_observation'],
+        'render.modes': [
+            'human',
+            'human_state',
+            'human_observation',
+            'rgb_array',
+            'rgb_array_state',
+            'rgb_array_observation',
+        ],
         'video.frames_per_second': 50,
     }
 
@@ -73,11 +81,24 @@ class GymEnvironment(gym.Env):
 
         self._state_viewer = None
         self._observation_viewer = None
+        self._rasterizer = GridVerseRasterizer()
+
+    def seed(self, seed: Optional[Seed] = None) -> List[int]:
+        """Seeds the environment
 
-    def seed(self, seed: Optional[int] = None) -> List[int]:
-        actual_seed = seeding.create_seed(seed)
-        self.outer_env.inner_env.set_seed(actual_seed)
-        return [actual_seed]
+        Args:
+            seed (Optional[Seed]): integer seed or seed sequence (e.g., one of
+                :py:func:`~gym_gridverse.rng.spawn_seeds`), fresh entropy if
+                None;  the environment streams are the first children of the
+                seed sequence (see :py:func:`~gym_gridverse.rng.spawn_seeds`),
+                so it should not also be spawned from for other purposes
+
+        Returns:
+            List[int]: the entropy which reproduces the seeding
+        """
+        seed_sequence = make_seed_sequence(seed)
+        self.outer_env.inner_env.set_seed(seed_sequence)
+        return [seed_sequence.entropy]
 
     def set_state_representation(self, name: str):
         """Changes the state representation."""
@@ -117,9 +138,33 @@ class GymEnvironment(gym.Env):
         Returns:
             Dict[str, numpy.ndarray]: initial observation
         """
-        self.outer_env.reset()
+        self.reset_no_obs()
         return self.observation
 
+    def reset_no_obs(self):
+        """Resets the state of the environment, without observation.
+
+        The observation is only generated if later requested through
+        :py:attr:`observation`.
+        """
+        self.outer_env.reset()
+
+    def reset_batch(
+        self, n: int, seeds: Optional[Sequence[Optional[int]]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Resets the state of the environment `n` times.
+
+        See :py:meth:`~gym_gridverse.outer_env.OuterEnv.reset_batch`.
+
+        Args:
+            n (int): number of resets
+            seeds (Sequence[Optional[int]], optional): one seed per reset
+
+        Returns:
+            Dict[str, numpy.ndarray]: stacked initial observations
+        """
+        return self.outer_env.reset_batch(n, seeds)
+
     def step(self, action: int):
         """Runs the environment dynamics for one timestep.
 
@@ -129,16 +174,28 @@ class GymEnvironment(gym.Env):
         Returns:
             Tuple[Dict[str, numpy.ndarray], float, bool, Dict]: (observation, reward, terminal, info dictionary)
         """
+        reward, done, info = self.step_no_obs(action)
+        return self.observation, reward, done, info
+
+    def step_no_obs(self, action: int) -> Tuple[float, bool, Dict]:
+        """Runs the environment dynamics for one timestep, without observation.
+
+        Meant for agents which do not use observations (e.g., state-based
+        agents and planners);  the observation is only generated if later
+        requested through :py:attr:`observation`.
+
+        Args:
+            action (int): agent's action
+
+        Returns:
+            Tuple[float, bool, Dict]: (reward, terminal, info dictionary)
+        """
         action_ = self.outer_env.action_space.int_to_action(action)
         reward, done = self.outer_env.step(action_)
-        return self.observation, reward, done, {}
+        return reward, done, {}
 
     def render(self, mode='human'):
         # TODO: test
-        # only import rendering if actually rendering (avoid importing when
-        # using library remotely using ssh on a display-less environment)
-        from gym_gridverse.rendering import GridVerseViewer
-
         if mode not in [
             'human',
             'human_state',
@@ -153,6 +210,11 @@ class GymEnvironment(gym.Env):
         if self.outer_env.inner_env.state is None:
             return
 
+        if mode in ['human', 'human_state', 'human_observation']:
+            # only import rendering if actually rendering (avoid importing when
+            # using library remotely using ssh on a display-less environment)
+            from gym_gridverse.rendering import GridVerseViewer
+
         if mode in ['human', 'human_state']:
             if self._state_viewer is None:
                 self._state_viewer = GridVerseViewer(
@@ -181,35 +243,16 @@ class GymEnvironment(gym.Env):
 
         rgb_arrays = []
 
+        # rgb arrays are rasterized without pyglet, i.e., without a display
         if mode in ['rgb_array', 'rgb_array_state']:
-            if self._state_viewer is None:
-                self._state_viewer = GridVerseViewer(
-                    self.outer_env.inner_env.state_space.grid_shape,
-                    caption='State',
-                )
-
-                # without sleep the first frame could be black
-                time.sleep(0.05)
-
-            rgb_array_state = self._state_viewer.render(
-                self.outer_env.inner_env.state,
-                return_rgb_array=True,
+            rgb_array_state = self._rasterizer.render(
+                self.outer_env.inner_env.state
             )
             rgb_arrays.append(rgb_array_state)
 
         if mode in ['rgb_array', 'rgb_array_observation']:
-            if self._observation_viewer is None:
-                self._observation_viewer = GridVerseViewer(
-                    self.outer_env.inner_env.observation_space.grid_shape,
-                    caption='Observation',
-                )
-
-                # without sleep the first frame could be black
-                time.sleep(0.05)
-
-            rgb_array_observation = self._observation_viewer.render(
-                self.outer_env.inner_env.observation,
-                return_rgb_array=True,
+            rgb_array_observation = self._rasterizer.render(
+                self.outer_env.inner_env.observation
             )
             rgb_arrays.append(rgb_array_observation)
 
@@ -231,16 +274,29 @@ class GymStateWrapper(gym.Wrapper):
     """
     Gym Wrapper to replace the standard observation representation with state instead.
 
-    Doesn't change underlying environment, won't change render
+    Doesn't change underlying environment, won't change render.  The
+    environment observations are added to the step info, unless disabled
+    through `observation_info`;  if the wrapped environment is the
+    GymEnvironment itself (i.e., no other wrappers in between), disabled
+    observations are not generated.
     """
 
-    def __init__(self, env: GymEnvironment):
+    def __init__(self, env: GymEnvironment, *, observation_info: bool = True):
+        """Wraps the environment
+
+        Args:
+            env (GymEnvironment): environment with a state representation
+            observation_info (bool): if True, the environment observation is
+                added to the info dictionary returned by :py:meth:`step`;  if
+                False, observations are not generated
+        """
         # Make sure we have a valid state representation
         if env.state_space is None:
             ValueError('GymEnvironment does not have a state space')
 
         super().__init__(env)
         self.observation_space = env.state_space
+        self.observation_info = observation_info
 
     @property
     def observation(self) -> Dict[str, np.ndarray]:
@@ -252,7 +308,11 @@ class GymStateWrapper(gym.Wrapper):
         Returns:
             Dict[str, numpy.ndarray]: initial state
         """
-        self.env.reset()
+        # the observation is skipped only if there are no wrappers in between
+        if isinstance(self.env, GymEnvironment):
+            self.env.reset_no_obs()
+        else:
+            self.env.reset()
         return self.observation
 
     def step(self, action: int):
@@ -264,8 +324,14 @@ class GymStateWrapper(gym.Wrapper):
         Returns:
             Tuple[Dict[str, numpy.ndarray], float, bool, Dict]: (state, reward, terminal, info dictionary)
         """
-        observation, reward, done, info = self.env.step(action)
-        info['observation'] = observation
+        if isinstance(self.env, GymEnvironment):
+            reward, done, info = self.env.step_no_obs(action)
+            if self.observation_info:
+                info['observation'] = self.env.observation
+        else:
+            observation, reward, done, info = self.env.step(action)
+            if self.observation_info:
+                info['observation'] = observation
         return self.observation, reward, done, info
 
 
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -43,6 +43,42 @@ class OuterEnv:
         """Resets the state"""
         self.inner_env.reset()
 
+    def reset_batch(
+        self, n: int, seeds: Optional[Sequence[Optional[int]]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Resets the state `n` times, and returns the stacked observations
+
+        Each reset is preceded by seeding the inner environment with the
+        respective seed, if given;  the environment is left in the last initial
+        state.
+
+        Args:
+            n (int): number of resets
+            seeds (Sequence[Optional[int]], optional): one seed per reset
+
+        Returns:
+            Dict[str, numpy.ndarray]: representations of the initial
+            observations, each stacked along a new leading axis of size `n`
+        """
+        if n <= 0:
+            raise ValueError(f'number of resets ({n}) must be positive')
+        if seeds is not None and len(seeds) != n:
+            raise ValueError(
+                f'number of seeds ({len(seeds)}) does not match number of '
+                f'resets ({n})'
+            )
+        if self.observation_representation is None:
+            raise RuntimeError('Observation representation not available')
+
+        def observations():
+            for i in range(n):
+                if seeds is not None:
+                    self.inner_env.set_seed(seeds[i])
+                self.inner_env.reset()
+                yield self.observation
+
+        return _stack_representations(observations(), n)
+
     def step(self, action: Action) -> Tuple[float, bool]:
         """Runs the dynamics for one timestep, and returns reward and done flag
 
@@ -79,3 +115,21 @@ class OuterEnv:
         return self.observation_representation.convert(
             self.inner_env.observation
         )
+
+
+def _stack_representations(
+    representations: Iterable[Dict[str, np.ndarray]], n: int
+) -> Dict[str, np.ndarray]:
+    """Stacks `n` representations into pre-allocated arrays, one per key"""
+    stacked: Dict[str, np.ndarray] = {}
+    for i, representation in enumerate(representations):
+        if i == 0:
+            stacked = {
+                key: np.empty((n,) + array.shape, dtype=array.dtype)
+                for key, array in representation.items()
+            }
+
+        for key, array in representation.items():
+            stacked[key][i] = array
+
+    return stacked
@@ -0,0 +1,467 @@
+"""Headless rendering of states and observations into RGB arrays.
+
+Unlike :py:mod:`gym_gridverse.rendering`, this module does not depend on
+pyglet or OpenGL:  each grid object is drawn once (per type, state, color and
+tile size) into a tile sprite using NumPy, and whole frames are then assembled
+by gathering the sprites of all cells at once.  The sprites follow the same
+geometry and palette as :py:mod:`gym_gridverse.rendering`.
+"""
+from __future__ import annotations
+
+import math
+from typing import Dict, Hashable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from gym_gridverse.geometry import Orientation
+from gym_gridverse.grid_object import (
+    Beacon,
+    Color,
+    DeliveryAddress,
+    DeliveryHub,
+    Door,
+    Exit,
+    Floor,
+    GridObject,
+    Hidden,
+    Key,
+    MovingObstacle,
+    Telepod,
+    Wall,
+)
+from gym_gridverse.observation import Observation
+from gym_gridverse.state import State
+
+Point = Tuple[float, float]
+RGB = Tuple[float, float, float]
+
+BACKGROUND = (0.65, 0.65, 0.65)
+BLACK = (0.0, 0.0, 0.0)
+
+NONE = (0.5, 0.5, 0.5)
+RED = (0.796, 0.255, 0.329)
+GREEN = (0.329, 0.796, 0.255)
+BLUE = (0.255, 0.329, 0.796)
+YELLOW = (0.796, 0.796, 0.329)
+PURPLE = (0.584, 0.329, 0.796)
+
+colormap = {
+    Color.NONE: NONE,
+    Color.RED: RED,
+    Color.GREEN: GREEN,
+    Color.BLUE: BLUE,
+    Color.YELLOW: YELLOW,
+    Color.PURPLE: PURPLE,
+}
+
+_orientation_as_radians = {
+    Orientation.F: 0.0,
+    Orientation.L: math.pi / 2,
+    Orientation.B: math.pi,
+    Orientation.R: math.pi * 3 / 2,
+}
+
+
+def _transform(
+    points: Sequence[Point],
+    *,
+    translation: Point = (0.0, 0.0),
+    rotation: float = 0.0,
+) -> List[Point]:
+    """rotates, then translates the points (same order as rendering.Transform)"""
+    cos, sin = math.cos(rotation), math.sin(rotation)
+    dx, dy = translation
+    return [(cos * x - sin * y + dx, sin * x + cos * y + dy) for x, y in points]
+
+
+def _circle(radius: float, res: int = 30) -> List[Point]:
+    return [
+        (
+            math.cos(2 * math.pi * i / res) * radius,
+            math.sin(2 * math.pi * i / res) * radius,
+        )
+        for i in range(res)
+    ]
+
+
+def _capsule(length: float, width: float) -> List[List[Point]]:
+    box = [
+        (0.0, -width / 2),
+        (0.0, width / 2),
+        (length, width / 2),
+        (length, -width / 2),
+    ]
+    circle0 = _circle(width / 2)
+    circle1 = _transform(_circle(width / 2), translation=(length, 0.0))
+    return [box, circle0, circle1]
+
+
+_SQUARE = [(-1.0, -1.0), (-1.0, 1.0), (1.0, 1.0), (1.0, -1.0)]
+
+
+class _Canvas:
+    """Supersampled RGBA tile in cell coordinates, i.e., [-1, 1] with +y up"""
+
+    def __init__(self, tile_size: int, supersampling: int):
+        self.tile_size = tile_size
+        self.supersampling = supersampling
+
+        n = tile_size * supersampling
+        coordinates = (np.arange(n) + 0.5) / n * 2.0 - 1.0
+        self._x = coordinates[None, :]
+        self._y = -coordinates[:, None]
+        self._rgba = np.zeros((n, n, 4))
+
+    def _paint(self, mask: np.ndarray, color: RGB):
+        self._rgba[mask] = (*color, 1.0)
+
+    def fill(self, points: Sequence[Point], color: RGB = BLACK):
+        """fills the polygon (even-odd rule)"""
+        inside = np.zeros(self._rgba.shape[:2], dtype=bool)
+        for (x1, y1), (x2, y2) in zip(points, [*points[1:], points[0]]):
+            if y1 == y2:
+                continue
+
+            crosses = (y1 > self._y) != (y2 > self._y)
+            x_cross = x1 + (self._y - y1) * (x2 - x1) / (y2 - y1)
+            inside ^= crosses & (self._x < x_cross)
+
+        self._paint(inside, color)
+
+    def stroke(
+        self,
+        points: Sequence[Point],
+        color: RGB = BLACK,
+        *,
+        linewidth: float = 1.0,
+        closed: bool = True,
+    ):
+        """strokes the polyline;  linewidth is in pixels, as in pyglet"""
+        segments = list(zip(points, points[1:]))
+        if closed:
+            segments.append((points[-1], points[0]))
+
+        # half linewidth in cell coordinates
+        radius = max(linewidth, 1.0) / self.tile_size
+
+        mask = np.zeros(self._rgba.shape[:2], dtype=bool)
+        for (x1, y1), (x2, y2) in segments:
+            dx, dy = x2 - x1, y2 - y1
+            px, py = self._x - x1, self._y - y1
+            norm2 = dx * dx + dy * dy
+            t = (
+                np.clip((px * dx + py * dy) / norm2, 0.0, 1.0)
+                if norm2 > 0.0
+                else 0.0
+            )
+            mask |= (px - t * dx) ** 2 + (py - t * dy) ** 2 <= radius**2
+
+        self._paint(mask, color)
+
+    def rgba(self) -> np.ndarray:
+        """downsampled tile, with color premultiplied by alpha"""
+        n, s = self.tile_size, self.supersampling
+        return self._rgba.reshape(n, s, n, s, 4).mean(axis=(1, 3))
+
+
+def _draw_hidden(canvas: _Canvas, hidden: Hidden):
+    canvas.fill(_SQUARE)
+
+
+def _draw_wall(canvas: _Canvas, wall: Wall):
+    canvas.fill(_SQUARE, RED)
+    for line in [
+        # horizontal
+        [(-1.0, -0.33), (1.0, -0.33)],
+        [(-1.0, 0.33), (1.0, 0.33)],
+        # vertical
+        [(-0.5, -1.0), (-0.5, -0.33)],
+        [(0.5, -1.0), (0.5, -0.33)],
+        # vertical
+        [(0.0, -0.33), (0.0, 0.33)],
+        # vertical
+        [(-0.5, 1.0), (-0.5, 0.33)],
+        [(0.5, 1.0), (0.5, 0.33)],
+    ]:
+        canvas.stroke(line, closed=False)
+
+
+def _draw_door(canvas: _Canvas, door: Door):
+    pad = 0.8
+    color = colormap[door.color]
+
+    if door.is_open:
+        canvas.fill(
+            [(-1.0, -1.0), (-1.0, 1.0), (-pad, 1.0), (-pad, -1.0)], color
+        )
+        canvas.fill([(pad, -1.0), (pad, 1.0), (1.0, 1.0), (1.0, -1.0)], color)
+        canvas.fill(
+            [(-1.0, -1.0), (-1.0, -pad), (1.0, -pad), (1.0, -1.0)], color
+        )
+        canvas.fill([(-1.0, pad), (-1.0, 1.0), (1.0, 1.0), (1.0, pad)], color)
+    else:
+        canvas.fill(_SQUARE, color)
+
+    canvas.stroke([(-pad, -pad), (-pad, pad), (pad, pad), (pad, -pad)])
+
+    if door.is_locked:
+        translation = (0.4, 0.0)
+        canvas.fill(_transform(_circle(0.2, 10), translation=translation))
+        canvas.fill(
+            _transform(
+                [(-0.2, -0.4), (0.0, 0.0), (0.2, -0.4)],
+                translation=translation,
+            )
+        )
+    elif not door.is_open:
+        canvas.stroke(_transform(_circle(0.2, 10), translation=(0.4, 0.0)))
+
+
+def _key_parts() -> List[List[Point]]:
+    parts = [_transform(_circle(0.4, 6), translation=(-0.3, 0.0))]
+    parts.extend(_capsule(0.6, 0.2))
+    for x in [0.4, 0.5, 0.6]:
+        parts.extend(
+            _transform(part, translation=(x, 0.0), rotation=math.pi / 2)
+            for part in _capsule(0.3, 0.1)
+        )
+    return parts
+
+
+def _draw_key(canvas: _Canvas, key: Key):
+    parts = _key_parts()
+    for part in parts:
+        canvas.stroke(part, linewidth=4)
+    for part in parts:
+        canvas.fill(part, colormap[key.color])
+
+
+def _draw_exit(canvas: _Canvas, exit_: Exit):
+    if exit_.color is not Color.NONE:
+        canvas.fill(_SQUARE, colormap[exit_.color])
+
+    pad = 0.8
+    canvas.stroke(
+        _transform(
+            [(0.0, -pad), (0.0, pad), (pad, pad / 2), (0.0, 0.0)],
+            translation=(-pad / 4, 0.0),
+        ),
+        linewidth=2,
+        closed=False,
+    )
+
+
+def _draw_moving_obstacle(canvas: _Canvas, obstacle: MovingObstacle):
+    pad = 0.8
+    diamond = [(-pad, 0.0), (0.0, pad), (pad, 0.0), (0.0, -pad)]
+    canvas.fill(diamond, RED)
+    canvas.stroke(diamond, linewidth=3)
+
+
+def _draw_telepod(canvas: _Canvas, telepod: Telepod):
+    res = 100
+    circle = _circle(0.8, res)
+    canvas.fill(circle, colormap[telepod.color])
+    canvas.stroke(circle, linewidth=2)
+
+    polar = np.linspace((0.8, 0.0), (0.0, 4 * math.pi), res)
+    spiral = [(math.cos(ang) * rad, math.sin(ang) * rad) for rad, ang in polar]
+    canvas.stroke(spiral, linewidth=2, closed=False)
+
+
+def _draw_unknown(canvas: _Canvas, obj: GridObject):
+    """used for beacons, and any object without a dedicated sprite"""
+    circle = _circle(0.8, 100)
+    canvas.fill(circle, colormap[obj.color])
+    canvas.stroke(circle, linewidth=2)
+    canvas.stroke([(0.4, -0.4), (-0.4, 0.4)], linewidth=2)
+    canvas.stroke([(0.4, 0.4), (-0.4, -0.4)], linewidth=2)
+
+
+_package_colors = {0: BLUE, 1: GREEN, 2: YELLOW, 3: RED}
+
+
+def _draw_address(canvas: _Canvas, address: DeliveryAddress):
+    pad = 0.8
+    house = [(-pad, 0), (0, pad), (pad, 0), (pad, -pad), (-pad, -pad)]
+    canvas.fill(house, colormap[address.color])
+    canvas.stroke(house, linewidth=2)
+
+    # representation of pending delivery items (default black fill beyond 3
+    # items, as in the viewer)
+    circle = _circle(0.4)
+    canvas.fill(circle, _package_colors.get(address.num_items, BLACK))
+    canvas.stroke(circle, linewidth=2)
+
+
+def _draw_hub(canvas: _Canvas, hub: DeliveryHub):
+    r = 0.4
+    smallpad = 0.5
+    hexagon = [
+        (
+            r * math.cos(math.pi / 180 * 60 * i),
+            r * math.sin(math.pi / 180 * 60 * i),
+        )
+        for i in range(6)
+    ]
+    canvas.fill(hexagon, colormap[hub.color])
+    canvas.stroke(hexagon, linewidth=2)
+    canvas.stroke(
+        [
+            (-smallpad, -smallpad),
+            (-smallpad * 0.5, smallpad),
+            (smallpad * 0.5, smallpad),
+            (smallpad, -smallpad),
+        ],
+        linewidth=2,
+    )
+
+
+def _draw_object(canvas: _Canvas, obj: GridObject):
+    if isinstance(obj, Floor):
+        pass
+    elif isinstance(obj, Hidden):
+        _draw_hidden(canvas, obj)
+    elif isinstance(obj, Wall):
+        _draw_wall(canvas, obj)
+    elif isinstance(obj, Key):
+        _draw_key(canvas, obj)
+    elif isinstance(obj, Door):
+        _draw_door(canvas, obj)
+    elif isinstance(obj, Exit):
+        _draw_exit(canvas, obj)
+    elif isinstance(obj, MovingObstacle):
+        _draw_moving_obstacle(canvas, obj)
+    elif isinstance(obj, Telepod):
+        _draw_telepod(canvas, obj)
+    elif isinstance(obj, Beacon):
+        _draw_unknown(canvas, obj)
+    elif isinstance(obj, DeliveryAddress):
+        _draw_address(canvas, obj)
+    elif isinstance(obj, DeliveryHub):
+        _draw_hub(canvas, obj)
+    else:
+        # unknown grid object
+        _draw_unknown(canvas, obj)
+
+
+def sprite_key(obj: GridObject) -> Hashable:
+    """key which identifies the look of a grid object"""
+    key = (type(obj), obj.state_index, obj.color)
+    # delivery addresses are drawn according to their pending items, which
+    # are not part of their state index
+    if isinstance(obj, DeliveryAddress):
+        key += (obj.num_items,)
+    return key
+
+
+def _composite(rgba: np.ndarray, background: np.ndarray) -> np.ndarray:
+    rgb = rgba[..., :3] + background * (1.0 - rgba[..., 3:])
+    return np.round(rgb * 255).astype(np.uint8)
+
+
+class GridVerseRasterizer:
+    """Renders states and observations into RGB arrays, without a display.
+
+    Produces the same images as
+    :py:meth:`gym_gridverse.rendering.GridVerseViewer.render` with
+    `return_rgb_array=True` (without the HUD, which is ignored).
+    """
+
+    def __init__(self, *, tile_size: int = 40, supersampling: int = 3):
+        """Creates a rasterizer
+
+        Args:
+            tile_size (int): number of pixels per cell side
+            supersampling (int): samples per pixel side, for anti-aliasing
+        """
+        if tile_size <= 0 or supersampling <= 0:
+            raise ValueError('tile_size and supersampling must be positive')
+
+        self.tile_size = tile_size
+        self.supersampling = supersampling
+
+        self._background = np.array(BACKGROUND)
+
+        # sprites stacked in a single atlas, indexed by their sprite key
+        self._atlas = np.zeros((0, tile_size, tile_size, 3), dtype=np.uint8)
+        self._atlas_indices: Dict[Hashable, int] = {}
+
+        self._agent_sprites = {
+            orientation: self._make_agent_sprite(orientation)
+            for orientation in Orientation
+        }
+
+    def _make_agent_sprite(self, orientation: Orientation) -> np.ndarray:
+        pad = 0.7
+        canvas = _Canvas(self.tile_size, self.supersampling)
+        canvas.stroke(
+            _transform(
+                [(-pad, -pad), (0.0, pad), (pad, -pad)],
+                rotation=_orientation_as_radians[orientation],
+            ),
+            linewidth=3,
+        )
+        return canvas.rgba()
+
+    def _atlas_index(self, obj: GridObject) -> int:
+        key = sprite_key(obj)
+        try:
+            return self._atlas_indices[key]
+        except KeyError:
+            pass
+
+        canvas = _Canvas(self.tile_size, self.supersampling)
+        _draw_object(canvas, obj)
+        sprite = _composite(canvas.rgba(), self._background)
+
+        index = len(self._atlas)
+        self._atlas = np.concatenate([self._atlas, sprite[None]])
+        self._atlas_indices[key] = index
+        return index
+
+    def render(
+        self, state_or_observation: Union[State, Observation], **kwargs
+    ) -> np.ndarray:
+        """Renders a state or observation
+
+        Args:
+            state_or_observation (Union[State, Observation]): frame to render
+            **kwargs: ignored, for compatibility with GridVerseViewer.render
+
+        Returns:
+            numpy.ndarray: (height * tile_size, width * tile_size, 3) uint8
+        """
+        grid = state_or_observation.grid
+        agent = state_or_observation.agent
+        T = self.tile_size
+
+        indices = np.array(
+            [[self._atlas_index(obj) for obj in row] for row in grid.objects],
+            dtype=np.int64,
+        )
+
+        # (H, W, T, T, 3) -> (H * T, W * T, 3)
+        image = (
+            self._atlas[indices]
+            .transpose(0, 2, 1, 3, 4)
+            .reshape(grid.shape.height * T, grid.shape.width * T, 3)
+        )
+
+        # agent
+        y, x = agent.position.y, agent.position.x
+        if grid.area.contains(agent.position):
+            tile = image[y * T : (y + 1) * T, x * T : (x + 1) * T]
+            rgba = self._agent_sprites[agent.orientation]
+            tile[...] = _composite(rgba, tile / 255.0)
+
+        # grid lines, including the bottom and right borders (as in the viewer)
+        image[::T] = 0
+        image[:, ::T] = 0
+        image[-1] = 0
+        image[:, -1] = 0
+
+        return image
+
+    def close(self):
+        """no-op, for compatibility with GridVerseViewer"""
@@ -22,7 +22,7 @@ from typing_extensions import TypedDict
 
 from gym_gridverse.action import Action
 from gym_gridverse.observation import Observation
-from gym_gridverse.rendering import GridVerseViewer
+from gym_gridverse.rasterization import GridVerseRasterizer
 from gym_gridverse.state import State
 from gym_gridverse.utils.rl import make_return_computer
 
@@ -94,18 +94,32 @@ class HUD_Info(TypedDict):
 
 
 def generate_images(
-    data: Union[Data[State], Data[Observation], Data[Image]]
+    data: Union[Data[State], Data[Observation], Data[Image]],
+    *,
+    headless: bool = False,
 ) -> Iterator[Image]:
-    """Generate images associated with the input data"""
+    """Generate images associated with the input data
+
+    If `headless`, frames are rendered by
+    :py:class:`~gym_gridverse.rasterization.GridVerseRasterizer`, which does
+    not require a display.
+    """
 
     if data.is_image_data:
         yield from data.frames
         return
 
     data = cast(Union[Data[State], Data[Observation]], data)
-    shape = data.frames[0].grid.shape
-    viewer = GridVerseViewer(shape)
-    viewer.flip_hud()
+
+    if headless:
+        viewer = GridVerseRasterizer()
+    else:
+        # only import rendering if actually rendering with pyglet
+        from gym_gridverse.rendering import GridVerseViewer
+
+        shape = data.frames[0].grid.shape
+        viewer = GridVerseViewer(shape)
+        viewer.flip_hud()
 
     hud_info: HUD_Info = {
         'action': None,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 from functools import partial
-from typing import Optional, Sequence, Tuple, Union
+from typing import Dict, Hashable, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pyglet
@@ -26,6 +26,7 @@ from gym_gridverse.grid_object import (
 )
 from drone_env import DeliveryAddress, DeliveryHub
 from gym_gridverse.observation import Observation
+from gym_gridverse.rasterization import sprite_key
 from gym_gridverse.state import State
 
 
@@ -522,6 +523,46 @@ def make_hub(obj: GridObject) -> rendering.Geom:
     return Group([geom_hub, geom_boundary, geom_package])
 
 
+def make_geom(obj: GridObject) -> Optional[rendering.Geom]:
+    """returns the geometry of a grid object, or None if nothing is drawn"""
+    if isinstance(obj, Floor):
+        return None
+
+    if isinstance(obj, Hidden):
+        return make_hidden(obj)
+
+    if isinstance(obj, Wall):
+        return make_wall(obj)
+
+    if isinstance(obj, Key):
+        return make_key(obj)
+
+    if isinstance(obj, Door):
+        return make_door(obj)
+
+    if isinstance(obj, Exit):
+        return make_exit(obj)
+
+    if isinstance(obj, MovingObstacle):
+        return make_moving_obstacle(obj)
+
+    if isinstance(obj, Telepod):
+        return make_telepod(obj)
+
+    if isinstance(obj, Beacon):
+        return make_beacon(obj)
+
+    # not defined yet, but will be used in the future
+    if isinstance(obj, DeliveryAddress):
+        return make_address(obj)
+
+    if isinstance(obj, DeliveryHub):
+        return make_hub(obj)
+
+    # unknown grid object
+    return make_unknown(obj)
+
+
 def convert_pos(position: Position, *, num_rows: int) -> Tuple[float, float]:
     return 2 * position.x, 2 * (num_rows - 1 - position.y)
 
@@ -590,6 +631,15 @@ class GridVerseViewer:
             rendering.Transform(scale=(0.5 / shape.width, 0.5 / shape.height)),
         ]
 
+        # geometries are shared by all cells with the same sprite key, and
+        # each cell reuses its positioned geometry until its key changes
+        self._geom_cache: Dict[Hashable, Optional[rendering.Geom]] = {}
+        self._cell_geoms: Dict[
+            Position, Tuple[Hashable, Optional[rendering.Geom]]
+        ] = {}
+        self._position_transforms: Dict[Position, rendering.Transform] = {}
+        self._agent_geom = make_agent()
+
         m = 40
         self._viewer = _CustomViewer(m * shape.width, m * shape.height)
         self._viewer.set_bounds(0.0, 1.0, 0.0, 1.0)
@@ -678,62 +728,16 @@ class GridVerseViewer:
 
         for position in state_or_observation.grid.area.positions():
             obj = state_or_observation.grid[position]
+            geom = self._cell_geom(obj, position)
+            if geom is not None:
+                self._viewer.add_onetime(geom)
 
-            if isinstance(obj, Floor):
-                pass
-
-            elif isinstance(obj, Hidden):
-                geom = make_hidden(obj)
-                self._draw_geom_onetime(geom, position)
-
-            elif isinstance(obj, Wall):
-                geom = make_wall(obj)
-                self._draw_geom_onetime(geom, position)
-
-            elif isinstance(obj, Key):
-                geom = make_key(obj)
-                self._draw_geom_onetime(geom, position)
-
-            elif isinstance(obj, Door):
-                geom = make_door(obj)
-                self._draw_geom_onetime(geom, position)
-
-            elif isinstance(obj, Exit):
-                geom = make_exit(obj)
-                self._draw_geom_onetime(geom, position)
-
-            elif isinstance(obj, MovingObstacle):
-                geom = make_moving_obstacle(obj)
-                self._draw_geom_onetime(geom, position)
-
-            elif isinstance(obj, Telepod):
-                geom = make_telepod(obj)
-                self._draw_geom_onetime(geom, position)
-
-            elif isinstance(obj, Beacon):
-                geom = make_beacon(obj)
-                self._draw_geom_onetime(geom, position)
-
-            # not defined yet, but will be used in the future
-            elif isinstance(obj, DeliveryAddress):
-                geom = make_address(obj)
-                self._draw_geom_onetime(geom, position)
-
-            elif isinstance(obj, DeliveryHub):
-                geom = make_hub(obj)
-                self._draw_geom_onetime(geom, position)
-
-            else:
-                # unknown grid object
-                geom = make_unknown(obj)
-                self._draw_geom_onetime(geom, position)
-
-        geom = make_agent()
-        self._draw_geom_onetime(
-            geom,
+        geom = self._make_transformed_geom(
+            self._agent_geom,
             state_or_observation.agent.position,
             state_or_observation.agent.orientation,
         )
+        self._viewer.add_onetime(geom)
 
         self._viewer.add_onetime(self._grid)
         other_drawables = [self._hud_layout] if self._draw_hud else []
@@ -741,20 +745,57 @@ class GridVerseViewer:
             return_rgb_array=return_rgb_array, other_drawables=other_drawables
         )
 
-    def _draw_geom_onetime(
+    def _cell_geom(
+        self, obj: GridObject, position: Position
+    ) -> Optional[rendering.Geom]:
+        """returns the (cached) positioned geometry of the object"""
+        key = sprite_key(obj)
+
+        try:
+            cached_key, geom = self._cell_geoms[position]
+        except KeyError:
+            pass
+        else:
+            if cached_key == key:
+                return geom
+
+        try:
+            base_geom = self._geom_cache[key]
+        except KeyError:
+            base_geom = self._geom_cache[key] = make_geom(obj)
+
+        geom = (
+            None
+            if base_geom is None
+            else self._make_transformed_geom(base_geom, position)
+        )
+        self._cell_geoms[position] = key, geom
+        return geom
+
+    def _make_transformed_geom(
         self,
         geom: rendering.Geom,
         position: Position,
         orientation: Orientation = Orientation.F,
-    ):
+    ) -> rendering.Geom:
+        """wraps a shared geometry with the transforms of a grid cell"""
+        transformed_geom = Group([geom])
         rotation = _orientation_as_radians[orientation]
-        geom.add_attr(rendering.Transform(rotation=rotation))
-        geom.add_attr(
-            rendering.Transform(translation=self._pos_converter(position))
-        )
+        transformed_geom.add_attr(rendering.Transform(rotation=rotation))
+        transformed_geom.add_attr(self._position_transform(position))
         for transform in self._viewer_transforms:
-            geom.add_attr(transform)
-        self._viewer.add_onetime(geom)
+            transformed_geom.add_attr(transform)
+        return transformed_geom
+
+    def _position_transform(self, position: Position) -> rendering.Transform:
+        try:
+            return self._position_transforms[position]
+        except KeyError:
+            transform = rendering.Transform(
+                translation=self._pos_converter(position)
+            )
+            self._position_transforms[position] = transform
+            return transform
 
 
 _orientation_as_radians = {
@@ -185,3 +185,34 @@ class Space:
             lower_bound,
             upper_bound,
         )
+
+
+def compact_dtype(space: Space) -> np.dtype:
+    """returns the smallest dtype which can hold every value of the space
+
+    Integer spaces use the smallest (preferably unsigned) integer type covering
+    the space bounds, e.g., `uint8` for the `compact` representations;
+    continuous spaces use `float32`.
+
+    Args:
+        space (Space): space
+
+    Returns:
+        numpy.dtype:
+    """
+    if space.space_type is SpaceType.CONTINUOUS:
+        return np.dtype(np.float32)
+
+    lower = space.lower_bound.min() if space.lower_bound.size > 0 else 0
+    upper = space.upper_bound.max() if space.upper_bound.size > 0 else 0
+    dtypes = (
+        [np.uint8, np.uint16, np.uint32, np.uint64]
+        if lower >= 0
+        else [np.int8, np.int16, np.int32, np.int64]
+    )
+    for dtype in dtypes:
+        info = np.iinfo(dtype)
+        if info.min <= lower and upper <= info.max:
+            return np.dtype(dtype)
+
+    raise ValueError(f'space bounds ({lower}, {upper}) exceed 64 bits')
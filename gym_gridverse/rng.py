@@ -1,16 +1,57 @@
-from typing import List, Optional, Sequence, TypeVar
+from typing import List, Optional, Sequence, TypeVar, Union
 
+import numpy as np
 import numpy.random as rnd
 
 # library-level generator, used if one is not provided (e.g. by environment)
 _gv_rng: Optional[rnd.Generator] = None
 
+Seed = Union[int, rnd.SeedSequence]
+"""integer seed, or seed sequence (e.g., spawned by :py:func:`spawn_seeds`)"""
 
-def make_rng(seed: Optional[int] = None) -> rnd.Generator:
+
+def make_rng(seed: Optional[Seed] = None) -> rnd.Generator:
     """make a new rng object"""
     return rnd.default_rng(seed)
 
 
+def make_seed_sequence(seed: Optional[Seed] = None) -> rnd.SeedSequence:
+    """make a seed sequence (fresh entropy if seed is None)"""
+    return (
+        seed if isinstance(seed, rnd.SeedSequence) else rnd.SeedSequence(seed)
+    )
+
+
+def spawn_seeds(seed: Optional[Seed], n: int) -> List[rnd.SeedSequence]:
+    """spawn n independent child seed sequences
+
+    Children are reproducible given the seed, and each child only depends on
+    its own index;  e.g., seeding environment i of a pool with child i gives
+    the same results regardless of how many workers the pool is split into.
+
+    Unlike :py:meth:`numpy.random.SeedSequence.spawn`, a seed sequence input is
+    not modified, i.e., spawning twice from it gives the same children.  The
+    children are always the first n children of the seed (regardless of its
+    `n_children_spawned`), i.e., the same as those of `seed.spawn(n)` on a
+    fresh seed sequence;  seeds which must be independent of other children
+    of a seed sequence should themselves be distinct children of it.
+    """
+    seed_sequence = make_seed_sequence(seed)
+    return [
+        rnd.SeedSequence(
+            seed_sequence.entropy,
+            spawn_key=seed_sequence.spawn_key + (i,),
+            pool_size=seed_sequence.pool_size,
+        )
+        for i in range(n)
+    ]
+
+
+def spawn_rngs(seed: Optional[Seed], n: int) -> List[rnd.Generator]:
+    """spawn n independent rng objects, see :py:func:`spawn_seeds`"""
+    return [make_rng(child) for child in spawn_seeds(seed, n)]
+
+
 def reset_gv_rng(seed: Optional[int] = None) -> rnd.Generator:
     """reset the gym-gridverse module rng"""
     global _gv_rng
@@ -28,6 +69,97 @@ def get_gv_rng_if_none(rng: Optional[rnd.Generator]) -> rnd.Generator:
     return get_gv_rng() if rng is None else rng
 
 
+class BufferedRng(rnd.Generator):
+    """Generator which serves scalar draws from pre-drawn blocks of uniforms.
+
+    Each call into a generator has a fixed overhead which dominates small
+    draws (e.g., a single `rng.integers(n)` or `rng.choice(n)`);  this
+    generator draws `buffer_size` uniforms at a time, and serves scalar
+    :py:meth:`random`, :py:meth:`integers` and :py:meth:`choice` draws from
+    them.  Other draws go to the underlying bit generator directly.
+
+    Draws are reproducible given the wrapped generator's state, but differ
+    from those of the wrapped generator itself.
+    """
+
+    def __init__(self, rng: rnd.Generator, *, buffer_size: int = 1024):
+        """Wraps (i.e., shares the bit generator of) a generator
+
+        Args:
+            rng (Generator): wrapped generator
+            buffer_size (int): number of uniforms drawn at a time
+        """
+        if buffer_size <= 0:
+            raise ValueError(f'buffer_size ({buffer_size}) must be positive')
+
+        super().__init__(rng.bit_generator)
+        self._buffer_size = buffer_size
+        self._values: List[float] = []
+        self._index = 0
+
+    def __reduce__(self):
+        return (
+            _make_buffered_rng,
+            (self.bit_generator, self._buffer_size, self._values, self._index),
+        )
+
+    def _uniform(self) -> float:
+        if self._index >= len(self._values):
+            self._values = super().random(self._buffer_size).tolist()
+            self._index = 0
+
+        self._index += 1
+        return self._values[self._index - 1]
+
+    def random(self, size=None, dtype=np.float64, out=None):
+        # array draws are already cheap per element
+        if size is not None or out is not None or dtype is not np.float64:
+            return super().random(size, dtype, out)
+
+        return self._uniform()
+
+    def integers(
+        self, low, high=None, size=None, dtype=np.int64, endpoint=False
+    ):
+        # fast path only for the common scalar draws, e.g., `integers(n)`
+        if (
+            size is not None
+            or dtype is not np.int64
+            or not isinstance(low, _integer_types)
+            or not (high is None or isinstance(high, _integer_types))
+        ):
+            return super().integers(low, high, size, dtype, endpoint)
+
+        low, high = (0, int(low)) if high is None else (int(low), int(high))
+        n = high - low + endpoint
+        if not 0 < n <= 2**53:
+            return super().integers(low, high, size, dtype, endpoint)
+
+        # the min guards against the product rounding up to n
+        return np.int64(low + min(int(self._uniform() * n), n - 1))
+
+    def choice(self, a, size=None, replace=True, p=None, axis=0, shuffle=True):
+        if size is None and p is None and type(a) is int and a > 0:
+            return int(self.integers(a))
+
+        return super().choice(a, size, replace, p, axis, shuffle)
+
+
+_integer_types = (int, np.integer)
+
+
+def _make_buffered_rng(
+    bit_generator: rnd.BitGenerator,
+    buffer_size: int,
+    values: List[float],
+    index: int,
+) -> BufferedRng:
+    rng = BufferedRng(rnd.Generator(bit_generator), buffer_size=buffer_size)
+    rng._values = values
+    rng._index = index
+    return rng
+
+
 # auxiliary methods solve typing issues associated with rng sampling
 
 T = TypeVar('T')
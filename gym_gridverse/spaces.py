@@ -54,6 +54,7 @@ class StateSpace:
         self.object_types = list(object_types)
         self.colors = set(colors) | {Color.NONE}
 
+        self._grid_object_types = set(object_types)
         self._agent_object_types = set(object_types) | {NoneGridObject}
 
     def contains(self, state: State) -> bool:
@@ -61,7 +62,7 @@ class StateSpace:
         # TODO: test
         return (
             state.grid.shape == self.grid_shape
-            and state.grid.object_types().issubset(self.object_types)
+            and state.grid.object_types().issubset(self._grid_object_types)
             and state.grid.area.contains(state.agent.position)
             and isinstance(state.agent.orientation, Orientation)
             and type(state.agent.grid_object) in self._agent_object_types
@@ -132,10 +133,11 @@ class StateSpace:
 class ActionSpace:
     def __init__(self, actions: Sequence[Action]):
         self.actions = actions
+        self._actions = frozenset(actions)
 
     def contains(self, action: Action) -> bool:
         """True if the action satisfies the action-space"""
-        return action in self.actions
+        return action in self._actions
 
     def int_to_action(self, action: int) -> Action:
         return self.actions[action]
@@ -193,10 +195,9 @@ class ObservationSpace:
         grid_objs_in_space = observation.grid.object_types().issubset(
             self._grid_object_types
         )
-        grid_objs_colors_in_space = set(
-            observation.grid[pos].color
-            for pos in observation.grid.area.positions()
-        ).issubset(self.colors)
+        grid_objs_colors_in_space = observation.grid.object_colors().issubset(
+            self.colors
+        )
         agent_obj_color_in_space = (
             observation.agent.grid_object.color in self.colors
         )
@@ -0,0 +1,109 @@
+"""Distance fields, i.e., shortest path distances from every cell to the nearest
+of many sources, computed by a single breadth-first search"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class DistanceField:
+    """Distances to the nearest source, and which source is the nearest"""
+
+    distances: np.ndarray
+    """(height, width) float distances, `inf` where no source is reachable"""
+    nearest_sources: np.ndarray
+    """(height, width) int index of the nearest source, -1 where no source is
+    reachable;  ties go to the lowest index"""
+
+
+def multi_source_bfs(
+    walkable: np.ndarray, sources: np.ndarray, *, connectivity: int = 4
+) -> DistanceField:
+    """Computes the distance field of many sources in one breadth-first search
+
+    Paths step between neighboring walkable cells;  sources need not be
+    walkable themselves (e.g., a source can be a door or a building).  The
+    cost is O(cells), regardless of the number of sources.
+
+    Args:
+        walkable (numpy.ndarray): (height, width) boolean mask of the cells
+            which paths can go through
+        sources (numpy.ndarray): (N, 2) (y, x) source coordinates, or
+            (height, width) boolean mask (sources indexed in row-major order)
+        connectivity (int): 4 (orthogonal steps) or 8 (also diagonal steps)
+    Returns:
+        DistanceField:
+    """
+    try:
+        offsets = _neighbor_offsets[connectivity]
+    except KeyError as error:
+        raise ValueError(
+            f'connectivity ({connectivity}) must be either 4 or 8'
+        ) from error
+
+    walkable = np.asarray(walkable, dtype=bool)
+    height, width = walkable.shape
+    sources = np.asarray(sources)
+    if sources.dtype == bool:
+        if sources.shape != walkable.shape:
+            raise ValueError(
+                f'sources mask shape {sources.shape} does not match '
+                f'walkable shape {walkable.shape}'
+            )
+        sources = np.argwhere(sources)
+    sources = sources.reshape(-1, 2).astype(int, copy=False)
+    if not (
+        (0 <= sources[:, 0]).all()
+        and (sources[:, 0] < height).all()
+        and (0 <= sources[:, 1]).all()
+        and (sources[:, 1] < width).all()
+    ):
+        raise ValueError('sources must be within the walkable shape')
+
+    # flat indices into cells padded with a non-walkable border, such that
+    # neighbor offsets never leave the array or wrap around rows
+    padded_width = width + 2
+    reachable = np.zeros((height + 2, padded_width), dtype=bool)
+    reachable[1:-1, 1:-1] = walkable
+    reachable = reachable.ravel()
+    flat_offsets = offsets[:, 0] * padded_width + offsets[:, 1]
+
+    distances = np.full(reachable.size, np.inf)
+    nearest_sources = np.full(reachable.size, -1)
+
+    # duplicate sources keep the lowest index
+    cells = (sources[:, 0] + 1) * padded_width + sources[:, 1] + 1
+    frontier, labels = np.unique(cells, return_index=True)
+
+    distance = 0
+    while frontier.size > 0:
+        distances[frontier] = distance
+        nearest_sources[frontier] = labels
+        reachable[frontier] = False
+
+        # new frontier, each cell labelled by its lowest-labelled neighbor
+        neighbors = (frontier[:, None] + flat_offsets).ravel()
+        labels = np.repeat(labels, len(flat_offsets))
+        (indices,) = np.nonzero(reachable[neighbors])
+        indices = indices[np.lexsort((labels[indices], neighbors[indices]))]
+        neighbors, labels = neighbors[indices], labels[indices]
+
+        first = np.ones(len(neighbors), dtype=bool)
+        first[1:] = neighbors[1:] != neighbors[:-1]
+        frontier, labels = neighbors[first], labels[first]
+        distance += 1
+
+    return DistanceField(
+        distances.reshape(height + 2, padded_width)[1:-1, 1:-1].copy(),
+        nearest_sources.reshape(height + 2, padded_width)[1:-1, 1:-1].copy(),
+    )
+
+
+_neighbor_offsets = {
+    4: np.array([(-1, 0), (1, 0), (0, -1), (0, 1)]),
+    8: np.array(
+        [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+    ),
+}
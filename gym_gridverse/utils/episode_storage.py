@@ -0,0 +1,303 @@
+"""Streaming storage of episodes as chunked, compressed, compact arrays"""
+from __future__ import annotations
+
+import glob
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from gym_gridverse.action import Action
+from gym_gridverse.observation import Observation
+from gym_gridverse.representations.representation import (
+    ObservationRepresentation,
+    StateRepresentation,
+)
+from gym_gridverse.representations.spaces import compact_dtype
+from gym_gridverse.state import State
+
+Representation = Union[StateRepresentation, ObservationRepresentation]
+"""A State or Observation representation"""
+
+_METADATA_FILENAME = 'metadata.json'
+_EPISODES_FILENAME = 'episodes.txt'
+_CHUNK_FILENAME_PREFIX = 'chunk_'
+_CHUNK_FILENAME_FORMAT = _CHUNK_FILENAME_PREFIX + '{:08d}.npz'
+
+
+@dataclass(frozen=True)
+class Episode:
+    """Episode data, with frames in their array representation
+
+    Follows the same conventions as :py:class:`~gym_gridverse.recording.Data`,
+    i.e., there is one more frame than actions and rewards.
+    """
+
+    frames: Dict[str, np.ndarray]
+    actions: List[Action]
+    rewards: np.ndarray
+
+    def __post_init__(self):
+        lengths = {len(frames) for frames in self.frames.values()}
+        if lengths != {len(self.actions) + 1} or len(self.actions) != len(
+            self.rewards
+        ):
+            raise ValueError('wrong lengths')
+
+
+class EpisodeWriter:
+    """Writes episodes to disk as they run, without holding them in memory.
+
+    Each frame is converted into its array representation (stored using the
+    smallest fitting dtype) and buffered in a fixed-size chunk;  full chunks
+    are written as compressed `.npz` shards.  Episode boundaries are appended
+    to a plain-text index as soon as each episode ends.
+
+    Usage mirrors :py:class:`~gym_gridverse.recording.DataBuilder`:
+
+        >>> with EpisodeWriter(directory, representation) as writer:
+        >>>     writer.append0(env.state)
+        >>>     ...
+        >>>     writer.append(env.state, action, reward)
+        >>>     ...
+        >>>     writer.end_episode()
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        representation: Representation,
+        *,
+        chunk_size: int = 1024,
+    ):
+        """Creates a writer on an empty (or new) directory.
+
+        Args:
+            directory (str): output directory
+            representation (Representation): frame representation
+            chunk_size (int): number of frames per shard
+        """
+        if chunk_size <= 0:
+            raise ValueError(f'chunk_size ({chunk_size}) must be positive')
+
+        os.makedirs(directory, exist_ok=True)
+        if os.listdir(directory):
+            raise ValueError(f'directory {directory} is not empty')
+
+        self.directory = directory
+        self.representation = representation
+        self.chunk_size = chunk_size
+
+        space = representation.space
+        self._frames = {
+            key: np.zeros(
+                (chunk_size, *subspace.shape), dtype=compact_dtype(subspace)
+            )
+            for key, subspace in space.items()
+        }
+        self._actions = np.zeros(chunk_size, dtype=np.int16)
+        self._rewards = np.zeros(chunk_size, dtype=np.float32)
+
+        self._num_chunks = 0
+        self._chunk_length = 0
+        self._episode_start: int = -1
+
+        metadata = {
+            'chunk_size': chunk_size,
+            'keys': list(space.keys()),
+        }
+        with open(os.path.join(directory, _METADATA_FILENAME), 'w') as f:
+            json.dump(metadata, f)
+
+        self._episodes_file = open(
+            os.path.join(directory, _EPISODES_FILENAME), 'w'
+        )
+
+    @property
+    def num_frames(self) -> int:
+        """Number of frames written (or buffered) so far"""
+        return self._num_chunks * self.chunk_size + self._chunk_length
+
+    def _append(self, frame: Union[State, Observation], action: int, reward):
+        for key, array in self.representation.convert(frame).items():  # type: ignore
+            self._frames[key][self._chunk_length] = array
+        self._actions[self._chunk_length] = action
+        self._rewards[self._chunk_length] = reward
+        self._chunk_length += 1
+
+        if self._chunk_length == self.chunk_size:
+            self.flush()
+
+    def append0(self, frame: Union[State, Observation]):
+        """Appends the first frame of a new episode"""
+        if self._episode_start >= 0:
+            raise RuntimeError(
+                'cannot call EpisodeWriter.append0 at this point'
+            )
+
+        self._episode_start = self.num_frames
+        self._append(frame, -1, np.nan)
+
+    def append(
+        self, frame: Union[State, Observation], action: Action, reward: float
+    ):
+        """Appends the next frame of the ongoing episode"""
+        if self._episode_start < 0:
+            raise RuntimeError('cannot call EpisodeWriter.append at this point')
+
+        self._append(frame, action.value, reward)
+
+    def end_episode(self):
+        """Marks the end of the ongoing episode"""
+        if self._episode_start < 0:
+            raise RuntimeError(
+                'cannot call EpisodeWriter.end_episode at this point'
+            )
+
+        length = self.num_frames - self._episode_start
+        self._episodes_file.write(f'{self._episode_start} {length}\n')
+        self._episodes_file.flush()
+        self._episode_start = -1
+
+    def flush(self):
+        """Writes the buffered frames to a (possibly partial) shard"""
+        if self._chunk_length == 0:
+            return
+
+        filename = os.path.join(
+            self.directory, _CHUNK_FILENAME_FORMAT.format(self._num_chunks)
+        )
+        n = self._chunk_length
+        np.savez_compressed(
+            filename,
+            actions=self._actions[:n],
+            rewards=self._rewards[:n],
+            **{
+                f'frames_{key}': frames[:n]
+                for key, frames in self._frames.items()
+            },
+        )
+
+        # partial shards are overwritten until they are full
+        if n == self.chunk_size:
+            self._num_chunks += 1
+            self._chunk_length = 0
+
+    def close(self):
+        """Flushes buffered frames and closes the index"""
+        if self._episode_start >= 0:
+            self.end_episode()
+
+        self.flush()
+        self._episodes_file.close()
+
+    def __enter__(self) -> EpisodeWriter:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class EpisodeReader:
+    """Random-access reader of episodes written by :py:class:`EpisodeWriter`.
+
+    Only the shards needed to serve a request are loaded, and the most
+    recently used ones are kept in memory.
+    """
+
+    def __init__(self, directory: str, *, cache_size: int = 8):
+        """Opens an episode directory
+
+        Args:
+            directory (str): directory written by an EpisodeWriter
+            cache_size (int): number of decompressed shards kept in memory
+        """
+        self.directory = directory
+
+        with open(os.path.join(directory, _METADATA_FILENAME)) as f:
+            metadata = json.load(f)
+
+        self.chunk_size: int = metadata['chunk_size']
+        self.keys: List[str] = metadata['keys']
+
+        with open(os.path.join(directory, _EPISODES_FILENAME)) as f:
+            self._episodes: List[Tuple[int, int]] = [
+                (int(start), int(length))
+                for start, length in (line.split() for line in f)
+            ]
+
+        pattern = os.path.join(directory, f'{_CHUNK_FILENAME_PREFIX}*')
+        num_chunks = len(glob.glob(pattern))
+        self._num_frames = 0
+        if num_chunks > 0:
+            last_chunk = self._load_chunk(num_chunks - 1)
+            self._num_frames = (num_chunks - 1) * self.chunk_size + len(
+                last_chunk['actions']
+            )
+
+        # episodes are only available if all their frames were flushed
+        self._episodes = [
+            (start, length)
+            for start, length in self._episodes
+            if start + length <= self._num_frames
+        ]
+
+        self._cached_load_chunk = lru_cache(maxsize=cache_size)(
+            self._load_chunk
+        )
+
+    def _load_chunk(self, i: int) -> Dict[str, np.ndarray]:
+        filename = os.path.join(
+            self.directory, _CHUNK_FILENAME_FORMAT.format(i)
+        )
+        with np.load(filename) as data:
+            return dict(data)
+
+    def __len__(self) -> int:
+        return len(self._episodes)
+
+    def episode_length(self, i: int) -> int:
+        """Number of steps (actions) in the i-th episode"""
+        _, length = self._episodes[i]
+        return length - 1
+
+    def _read(self, key: str, start: int, stop: int) -> np.ndarray:
+        if stop <= start:
+            chunk = self._cached_load_chunk(
+                max(start - 1, 0) // self.chunk_size
+            )
+            return chunk[key][:0]
+
+        first_chunk = start // self.chunk_size
+        last_chunk = (stop - 1) // self.chunk_size
+        arrays = [
+            self._cached_load_chunk(i)[key][
+                max(start - i * self.chunk_size, 0) : stop - i * self.chunk_size
+            ]
+            for i in range(first_chunk, last_chunk + 1)
+        ]
+        return np.concatenate(arrays) if len(arrays) > 1 else arrays[0]
+
+    def frame(self, i: int, t: int) -> Dict[str, np.ndarray]:
+        """Returns the t-th frame of the i-th episode"""
+        start, length = self._episodes[i]
+        if not 0 <= t < length:
+            raise IndexError(f'frame index {t} out of range')
+
+        return {
+            key: self._read(f'frames_{key}', start + t, start + t + 1)[0]
+            for key in self.keys
+        }
+
+    def __getitem__(self, i: int) -> Episode:
+        start, length = self._episodes[i]
+        stop = start + length
+        frames = {
+            key: self._read(f'frames_{key}', start, stop) for key in self.keys
+        }
+        actions = [Action(a) for a in self._read('actions', start + 1, stop)]
+        rewards = self._read('rewards', start + 1, stop)
+        return Episode(frames, actions, rewards)
@@ -0,0 +1,208 @@
+"""Fixed grid layouts, compiled once into templates which are cheap to clone"""
+from __future__ import annotations
+
+import copy
+import os
+from functools import lru_cache, partial
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from gym_gridverse.geometry import Position
+from gym_gridverse.grid import Grid
+from gym_gridverse.grid_object import (
+    DeliveryAddress,
+    DeliveryHub,
+    Exit,
+    Floor,
+    GridObject,
+    GridObjectFactory,
+    Wall,
+)
+
+ASCII_LEGEND: Dict[str, GridObjectFactory] = {
+    '.': Floor,
+    '#': Wall,
+    'E': Exit,
+    'H': DeliveryHub,
+    '1': partial(DeliveryAddress, num_items=1),
+    '2': partial(DeliveryAddress, num_items=2),
+    '3': partial(DeliveryAddress, num_items=3),
+}
+"""Characters of ASCII layouts, and the objects they represent"""
+
+
+class GridTemplate:
+    """A fixed grid layout, which is cheap to clone.
+
+    Objects without instance attributes (e.g., Floor, Wall) carry no state, and
+    are shared by the template and all its clones;  only the other objects
+    (e.g., DeliveryAddress, DeliveryHub) are copied by :py:meth:`instantiate`.
+    """
+
+    def __init__(self, objects: List[List[GridObject]]):
+        """Compiles the template of a grid layout
+
+        Args:
+            objects (List[List[GridObject]]): layout objects
+        """
+        stateful = [[bool(vars(obj)) for obj in row] for row in objects]
+        floor = [[isinstance(obj, Floor) for obj in row] for row in objects]
+        self._setup(objects, np.array(stateful), np.array(floor))
+
+    def _setup(
+        self,
+        objects: List[List[GridObject]],
+        stateful: np.ndarray,
+        floor: np.ndarray,
+    ):
+        self._objects = [list(row) for row in objects]
+        self._stateful_positions: List[Tuple[int, int]] = [
+            (y, x) for y, x in np.argwhere(stateful).tolist()
+        ]
+
+        self.floor_positions: List[Position] = [
+            Position(y, x) for y, x in np.argwhere(floor).tolist()
+        ]
+        """positions of Floor objects, e.g., to place the agent"""
+
+    @staticmethod
+    def from_grid(grid: Grid) -> GridTemplate:
+        """Compiles the template of a grid"""
+        return GridTemplate(grid.objects)
+
+    @staticmethod
+    def from_codes(
+        codes: np.ndarray, legend: Dict[int, GridObjectFactory]
+    ) -> GridTemplate:
+        """Compiles the template of an integer array layout, in bulk
+
+        One object is created per distinct code, and copied into its cells
+        through array indexing.
+
+        Args:
+            codes (numpy.ndarray): (height, width) integer layout
+            legend (Dict[int, GridObjectFactory]): objects represented by codes
+        Returns:
+            GridTemplate:
+        """
+        if codes.ndim != 2 or codes.size == 0:
+            raise ValueError(f'invalid layout shape {codes.shape}')
+
+        unique_codes, indices = np.unique(codes, return_inverse=True)
+        try:
+            factories = [legend[code] for code in unique_codes.tolist()]
+        except KeyError as error:
+            raise ValueError(f'invalid layout code {error}') from error
+
+        prototypes = np.empty(len(factories), dtype=object)
+        prototypes[:] = [factory() for factory in factories]
+        stateful = np.array([bool(vars(obj)) for obj in prototypes])
+        floor = np.array([isinstance(obj, Floor) for obj in prototypes])
+
+        indices = indices.reshape(codes.shape)
+        template = GridTemplate.__new__(GridTemplate)
+        template._setup(
+            prototypes[indices].tolist(), stateful[indices], floor[indices]
+        )
+
+        # stateful objects must not be shared between cells
+        for y, x in template._stateful_positions:
+            template._objects[y][x] = copy.copy(template._objects[y][x])
+
+        return template
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self._objects), len(self._objects[0])
+
+    def instantiate(self) -> Grid:
+        """Returns a new grid with the template layout"""
+        objects = [list(row) for row in self._objects]
+        for y, x in self._stateful_positions:
+            objects[y][x] = copy.copy(objects[y][x])
+        return Grid(objects)
+
+
+def parse_ascii_layout(
+    lines: Sequence[str],
+    legend: Dict[str, GridObjectFactory] = ASCII_LEGEND,
+) -> GridTemplate:
+    """Compiles the template of an ASCII layout, one character per cell
+
+    Args:
+        lines (Sequence[str]): layout rows, all of the same length
+        legend (Dict[str, GridObjectFactory]): objects represented by characters
+    Returns:
+        GridTemplate:
+    """
+    try:
+        data = [line.encode('ascii') for line in lines]
+    except UnicodeEncodeError as error:
+        raise ValueError(
+            'ASCII layout contains non-ASCII characters'
+        ) from error
+
+    return _parse_ascii_bytes(data, legend)
+
+
+def _parse_ascii_bytes(
+    lines: Sequence[bytes], legend: Dict[str, GridObjectFactory]
+) -> GridTemplate:
+    if len({len(line) for line in lines}) != 1:
+        raise ValueError('ASCII layout rows must be non-empty, of equal length')
+
+    codes = np.frombuffer(b''.join(lines), dtype=np.uint8)
+    codes = codes.reshape(len(lines), -1)
+    return GridTemplate.from_codes(
+        codes, {ord(char): factory for char, factory in legend.items()}
+    )
+
+
+def load_layout(path: str) -> GridTemplate:
+    """Compiles the template of a layout file
+
+    Supported files are ASCII maps (one row per line, see
+    :py:data:`ASCII_LEGEND`), and `.npy` (height, width) integer arrays of the
+    same characters' codes, e.g., `ord('#')` for a Wall.
+
+    Args:
+        path (str): layout file
+    Returns:
+        GridTemplate:
+    """
+    if path.endswith('.npy'):
+        codes = np.load(path, allow_pickle=False)
+        if not np.issubdtype(codes.dtype, np.integer):
+            raise ValueError(f'layout array {path} is not an integer array')
+
+        return GridTemplate.from_codes(
+            codes,
+            {ord(char): factory for char, factory in ASCII_LEGEND.items()},
+        )
+
+    with open(path, 'rb') as f:
+        lines = [line.rstrip(b'\r') for line in f.read().split(b'\n')]
+
+    # ignores trailing empty lines
+    while lines and not lines[-1]:
+        lines.pop()
+
+    return _parse_ascii_bytes(lines, ASCII_LEGEND)
+
+
+def cached_load_layout(path: str) -> GridTemplate:
+    """Cached :py:func:`load_layout`;  files are reloaded if modified"""
+    path = os.path.abspath(path)
+    return _cached_load_layout(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _cached_load_layout(path: str, mtime_ns: int) -> GridTemplate:
+    return load_layout(path)
+
+
+@lru_cache(maxsize=None)
+def cached_parse_ascii_layout(lines: Tuple[str, ...]) -> GridTemplate:
+    """Cached :py:func:`parse_ascii_layout` with the default legend"""
+    return parse_ascii_layout(lines)
@@ -1,5 +1,6 @@
 import itertools as itt
 import math
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Iterable, List
 
@@ -120,7 +121,85 @@ def compute_rays_fancy(position: Position, area: Area) -> List[Ray]:
     return rays
 
 
+@dataclass(frozen=True)
+class RayTable:
+    """Rays as arrays of flat cell indices (relative to the area), for
+    vectorized ray traversal.
+
+    Attributes:
+        indices (numpy.ndarray): (num_rays, max_ray_length) flat cell indices,
+            with shorter rays padded by `area.height * area.width`
+        valid (numpy.ndarray): (num_rays, max_ray_length) mask of non-padding
+            entries
+        counts (numpy.ndarray): (area.height, area.width) number of rays
+            through each cell
+    """
+
+    indices: np.ndarray
+    valid: np.ndarray
+    counts: np.ndarray
+
+
+def compute_ray_table(position: Position, area: Area) -> RayTable:
+    """Returns the rays of :py:func:`compute_rays_fancy` as a ray table.
+
+    Args:
+        position (Position): initial position, must be in area.
+        area (Area): boundary over rays.
+
+    Returns:
+        RayTable:
+    """
+    rays = cached_compute_rays_fancy(position, area)
+    size = area.height * area.width
+
+    indices = np.full((len(rays), max(map(len, rays))), size)
+    for i, ray in enumerate(rays):
+        indices[i, : len(ray)] = [
+            (pos.y - area.ymin) * area.width + (pos.x - area.xmin)
+            for pos in ray
+        ]
+
+    valid = indices < size
+    counts = np.bincount(indices[valid], minlength=size)
+    counts = counts.reshape(area.height, area.width)
+
+    for array in [indices, valid, counts]:
+        array.flags.writeable = False
+
+    return RayTable(indices, valid, counts)
+
+
+def count_lit_rays(table: RayTable, blocks: np.ndarray) -> np.ndarray:
+    """Returns the number of rays which reach each cell.
+
+    A ray reaches a cell if none of the cells before it along the ray block
+    it;  the first blocking cell is itself reached.
+
+    Args:
+        table (RayTable): rays over the area
+        blocks (numpy.ndarray): (area.height, area.width) blocking mask
+
+    Returns:
+        numpy.ndarray: (area.height, area.width) int counts
+    """
+    size = blocks.size
+    transparent = np.ones(size + 1, dtype=bool)
+    transparent[:size] = ~blocks.ravel()
+
+    lit = np.ones(table.indices.shape, dtype=bool)
+    np.logical_and.accumulate(
+        transparent[table.indices[:, :-1]], axis=1, out=lit[:, 1:]
+    )
+
+    counts = np.bincount(
+        table.indices[table.valid], weights=lit[table.valid], minlength=size
+    )
+    return counts.astype(int).reshape(blocks.shape)
+
+
 # the ray functions are deterministic and can be cached for efficiency (extra
 # calls for python3.7 compatibility)
 cached_compute_rays = lru_cache()(compute_rays)
 cached_compute_rays_fancy = lru_cache()(compute_rays_fancy)
+cached_compute_ray_table = lru_cache()(compute_ray_table)
@@ -0,0 +1,237 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+import numpy.random as rnd
+
+from gym_gridverse.representations.spaces import Space, compact_dtype
+from gym_gridverse.rng import get_gv_rng_if_none
+
+
+@dataclass(frozen=True)
+class Batch:
+    """Minibatch of transitions sampled from a replay buffer"""
+
+    observations: Dict[str, np.ndarray]
+    actions: np.ndarray
+    rewards: np.ndarray
+    next_observations: Dict[str, np.ndarray]
+    dones: np.ndarray
+
+
+class ReplayBuffer:
+    """Fixed-size replay buffer of transitions with compact frame storage.
+
+    Observations (or states) are stored once, as frames in preallocated ring
+    arrays using the smallest dtype which fits their space (e.g., `uint8` for
+    the `compact` representations);  transitions only hold references to their
+    two frames, so that consecutive transitions share the frame between them,
+    and a frame identical to the previous one (e.g., after bumping into a wall)
+    is not stored again.  Sampling is a single vectorized gather.
+
+    Frames and transitions are evicted in FIFO order;  evicting a frame also
+    evicts the (oldest) transitions which refer to it.  If `directory` is
+    given, all arrays are backed by memory-mapped `.npy` files in it, which
+    allows buffers larger than the available memory.
+    """
+
+    def __init__(
+        self,
+        space: Dict[str, Space],
+        capacity: int,
+        *,
+        frame_capacity: Optional[int] = None,
+        directory: Optional[str] = None,
+    ):
+        """Allocates the buffer.
+
+        Args:
+            space (Dict[str, Space]): representation space of the frames
+            capacity (int): maximum number of transitions
+            frame_capacity (Optional[int]): maximum number of frames (default
+                `capacity + 1`, enough if episodes are long)
+            directory (Optional[str]): directory for memory-mapped storage
+        """
+        if capacity <= 0:
+            raise ValueError(f'capacity ({capacity}) must be positive')
+
+        if frame_capacity is None:
+            frame_capacity = capacity + 1
+
+        if frame_capacity < 2:
+            raise ValueError(f'frame_capacity ({frame_capacity}) must be >= 2')
+
+        self.space = space
+        self.capacity = capacity
+        self.frame_capacity = frame_capacity
+        self.directory = directory
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        self._frames = {
+            key: self._allocate(
+                f'frame_{key}',
+                (frame_capacity, *subspace.shape),
+                compact_dtype(subspace),
+            )
+            for key, subspace in space.items()
+        }
+        self._observation_ids = self._allocate(
+            'observation_ids', (capacity,), np.int64
+        )
+        self._next_observation_ids = self._allocate(
+            'next_observation_ids', (capacity,), np.int64
+        )
+        self._actions = self._allocate('actions', (capacity,), np.int64)
+        self._rewards = self._allocate('rewards', (capacity,), np.float32)
+        self._dones = self._allocate('dones', (capacity,), bool)
+
+        # global (monotonic) counters;  ring slots are obtained via modulo
+        self._num_frames = 0
+        self._num_transitions = 0
+        self._first_transition = 0
+
+        # id of the last frame of the ongoing episode, if any
+        self._frame_id: Optional[int] = None
+
+    def _allocate(self, name: str, shape, dtype) -> np.ndarray:
+        if self.directory is None:
+            return np.zeros(shape, dtype=dtype)
+
+        return np.lib.format.open_memmap(
+            os.path.join(self.directory, f'{name}.npy'),
+            mode='w+',
+            dtype=dtype,
+            shape=shape,
+        )
+
+    def __len__(self) -> int:
+        return self._num_transitions - self._first_transition
+
+    def _is_last_frame(self, observation: Dict[str, np.ndarray]) -> bool:
+        if self._frame_id is None:
+            return False
+
+        slot = self._frame_id % self.frame_capacity
+        return all(
+            np.array_equal(self._frames[key][slot], observation[key])
+            for key in self._frames
+        )
+
+    def _write_frame(self, observation: Dict[str, np.ndarray]) -> int:
+        if self._is_last_frame(observation):
+            assert self._frame_id is not None
+            return self._frame_id
+
+        frame_id = self._num_frames
+
+        # evicts the transitions which refer to the overwritten frame
+        evicted_frame_id = frame_id - self.frame_capacity
+        while (
+            self._first_transition < self._num_transitions
+            and self._observation_ids[self._first_transition % self.capacity]
+            <= evicted_frame_id
+        ):
+            self._first_transition += 1
+
+        slot = frame_id % self.frame_capacity
+        for key, frames in self._frames.items():
+            frames[slot] = observation[key]
+
+        self._num_frames += 1
+        return frame_id
+
+    def add_first(self, observation: Dict[str, np.ndarray]):
+        """Adds the first frame of an episode.
+
+        Args:
+            observation (Dict[str, numpy.ndarray]): initial observation
+        """
+        self._frame_id = self._write_frame(observation)
+
+    def add(
+        self,
+        action: int,
+        reward: float,
+        observation: Dict[str, np.ndarray],
+        done: bool,
+    ):
+        """Adds a transition, from the last frame to the given observation.
+
+        Args:
+            action (int): action taken from the last frame
+            reward (float): reward received
+            observation (Dict[str, numpy.ndarray]): next observation
+            done (bool): whether the episode has ended
+        """
+        if self._frame_id is None:
+            raise RuntimeError('cannot call ReplayBuffer.add at this point')
+
+        observation_id = self._frame_id
+        next_observation_id = self._write_frame(observation)
+
+        if len(self) == self.capacity:
+            self._first_transition += 1
+
+        slot = self._num_transitions % self.capacity
+        self._observation_ids[slot] = observation_id
+        self._next_observation_ids[slot] = next_observation_id
+        self._actions[slot] = action
+        self._rewards[slot] = reward
+        self._dones[slot] = done
+        self._num_transitions += 1
+
+        self._frame_id = None if done else next_observation_id
+
+    def sample(
+        self, batch_size: int, *, rng: Optional[rnd.Generator] = None
+    ) -> Batch:
+        """Samples a minibatch of transitions uniformly (with replacement).
+
+        Args:
+            batch_size (int): number of transitions
+            rng (Optional[rnd.Generator]):
+
+        Returns:
+            Batch:
+        """
+        if len(self) == 0:
+            raise RuntimeError('cannot sample from an empty ReplayBuffer')
+
+        rng = get_gv_rng_if_none(rng)
+
+        indices = rng.integers(len(self), size=batch_size)
+        slots = (self._first_transition + indices) % self.capacity
+        observation_slots = self._observation_ids[slots] % self.frame_capacity
+        next_observation_slots = (
+            self._next_observation_ids[slots] % self.frame_capacity
+        )
+
+        return Batch(
+            {
+                key: frames[observation_slots]
+                for key, frames in self._frames.items()
+            },
+            self._actions[slots],
+            self._rewards[slots],
+            {
+                key: frames[next_observation_slots]
+                for key, frames in self._frames.items()
+            },
+            self._dones[slots],
+        )
+
+    def flush(self):
+        """Flushes memory-mapped storage to disk (no-op if in memory)."""
+        for array in [
+            *self._frames.values(),
+            self._observation_ids,
+            self._next_observation_ids,
+            self._actions,
+            self._rewards,
+            self._dones,
+        ]:
+            if isinstance(array, np.memmap):
+                array.flush()
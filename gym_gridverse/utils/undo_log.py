@@ -0,0 +1,55 @@
+from typing import Any, Callable, List, Tuple
+
+
+class UndoLog:
+    """Log of inverse operations, used to revert in-place modifications.
+
+    Objects which support undo (:py:class:`~gym_gridverse.grid.Grid` and
+    :py:class:`~gym_gridverse.agent.Agent`) have an `undo_log` attribute;  when
+    set, each of their modifications records its inverse operation here
+    (in-place modifications of grid objects go through
+    :py:meth:`~gym_gridverse.grid.Grid.set_object_attribute`).
+    Reverting is done by running the inverse operations in reverse order,
+    during which nothing is recorded.
+
+        >>> checkpoint = undo_log.checkpoint()
+        >>> state.grid[position] = Wall()  # records the previous object
+        >>> undo_log.undo(checkpoint)  # restores the previous object
+    """
+
+    def __init__(self):
+        self._operations: List[Tuple[Callable, Tuple[Any, ...]]] = []
+        self._undoing = False
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def record(self, function: Callable, *args):
+        """Records an inverse operation, i.e., `function(*args)`"""
+        if not self._undoing:
+            self._operations.append((function, args))
+
+    def checkpoint(self) -> int:
+        """Returns a checkpoint, i.e., the current length of the log"""
+        return len(self._operations)
+
+    def undo(self, checkpoint: int = 0):
+        """Reverts all operations recorded after the checkpoint
+
+        Args:
+            checkpoint (int): checkpoint obtained from :py:meth:`checkpoint`
+        """
+        if not 0 <= checkpoint <= len(self._operations):
+            raise ValueError(f'invalid checkpoint {checkpoint}')
+
+        self._undoing = True
+        try:
+            while len(self._operations) > checkpoint:
+                function, args = self._operations.pop()
+                function(*args)
+        finally:
+            self._undoing = False
+
+    def clear(self):
+        """Forgets all recorded operations"""
+        self._operations.clear()
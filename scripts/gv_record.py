@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import argparse
-import itertools as itt
+import json
 import sys
-from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
 
 import imageio
 import numpy.random as rnd
@@ -17,55 +19,121 @@ from gym_gridverse.envs.yaml.factory import factory_env_from_yaml
 from gym_gridverse.observation import Observation
 from gym_gridverse.recording import Data, DataBuilder, generate_images, record
 from gym_gridverse.state import State
+from gym_gridverse.utils.rl import make_return_computer
+
+
+@dataclass(frozen=True)
+class Job:
+    """Everything a worker needs to record one episode"""
+
+    episode: int
+    seed: Optional[int]
+    yaml: str
+    observation_function: Optional[str]
+    discount: float
+    max_steps: int
+    headless: bool
+    mode: str
+    state: Optional[str]
+    observation: Optional[str]
+    record_kwargs: Dict
 
 
 def main():
     args = get_args()
 
-    env = factory_env_from_yaml(args.yaml)
+    headless = args.headless or args.num_workers > 1
+    jobs = [
+        Job(
+            episode=episode,
+            seed=None if args.seed is None else args.seed + episode,
+            yaml=args.yaml,
+            observation_function=args.observation_function,
+            discount=args.discount,
+            max_steps=args.max_steps,
+            headless=headless,
+            mode=args.mode,
+            state=args.state,
+            observation=args.observation,
+            record_kwargs={
+                'loop': args.gif_loop,
+                'duration': args.gif_duration,
+                'fps': args.gif_fps,
+            },
+        )
+        for episode in range(args.num_episodes)
+    ]
+
+    if args.num_workers > 1:
+        with ProcessPoolExecutor(args.num_workers) as executor:
+            manifest = list(executor.map(record_episode, jobs))
+    else:
+        manifest = [record_episode(job) for job in jobs]
+
+    if args.manifest is not None:
+        with open(args.manifest, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+
+def record_episode(job: Job) -> Dict:
+    """Runs, renders and encodes one episode;  returns its manifest entry"""
+
+    env = factory_env_from_yaml(job.yaml)
 
-    if args.observation_function is not None:
+    if job.observation_function is not None:
         env._observation_function = observation_function_factory(
-            args.observation_function, observation_space=env.observation_space
+            job.observation_function, observation_space=env.observation_space
         )
         env._observation = None
 
-    env.set_seed(args.seed)
-    rnd.seed(args.seed)
+    env.set_seed(job.seed)
+    rnd.seed(job.seed)
 
     state_data, observation_data = make_data(
-        env, args.discount, max_steps=args.max_steps
+        env, job.discount, max_steps=job.max_steps
     )
 
-    if args.state:
-        images = list(generate_images(state_data))
-        filename = args.state
-        filenames = map(args.state.format, itt.count())
-
-        record(
-            args.mode,
-            images,
-            filename=filename,
-            filenames=filenames,
-            loop=args.gif_loop,
-            duration=args.gif_duration,
-            fps=args.gif_fps,
-        )
+    return_computer = make_return_computer(job.discount)
+    ret = 0.0
+    for reward in state_data.rewards:
+        ret = return_computer(reward)
 
-    if args.observation:
-        images = list(generate_images(observation_data))
-        filename = args.observation
-        filenames = map(args.observation.format, itt.count())
-
-        record(
-            args.mode,
-            images,
-            filename=filename,
-            filenames=filenames,
-            loop=args.gif_loop,
-            duration=args.gif_duration,
-            fps=args.gif_fps,
-        )
+    entry = {
+        'episode': job.episode,
+        'seed': job.seed,
+        'length': len(state_data.actions),
+        'return': ret,
+    }
+
+    for name, template, data in [
+        ('state', job.state, state_data),
+        ('observation', job.observation, observation_data),
+    ]:
+        if template is not None:
+            entry[name] = record_data(job, template, data)
+
+    return entry
+
+
+def record_data(
+    job: Job,
+    template: str,
+    data: Union[Data[State], Data[Observation]],
+) -> Union[str, List[str]]:
+    """Encodes the data;  returns the created filename(s)"""
+
+    images = list(generate_images(data, headless=job.headless))
+
+    if job.mode == 'images':
+        filenames = [
+            template.format(i, episode=job.episode) for i in range(len(images))
+        ]
+        record(job.mode, images, filenames=filenames, **job.record_kwargs)
+        return filenames
+
+    filename = template.format(episode=job.episode)
+    record(job.mode, images, filename=filename, **job.record_kwargs)
+    return filename
 
 
 def make_data(
@@ -98,7 +166,12 @@ def get_args():
     parser.add_argument('mode', choices=['images', 'gif', 'mp4'])
     parser.add_argument('yaml', help='env YAML file')
 
-    parser.add_argument('--seed', type=int, default=None, help='env seed')
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='env seed (episode i uses seed + i)',
+    )
 
     parser.add_argument(
         '--gif-loop', type=int, default=0, help='gif loop count'
@@ -115,13 +188,37 @@ def get_args():
         '--max-steps', type=int, default=99, help='maximum number of steps'
     )
 
-    parser.add_argument('--state', default=None, help='state filename')
     parser.add_argument(
-        '--observation', default=None, help='observation filename'
+        '--state',
+        default=None,
+        help='state filename (may contain {episode}, and {} for images)',
+    )
+    parser.add_argument(
+        '--observation',
+        default=None,
+        help='observation filename (may contain {episode}, and {} for images)',
     )
 
     parser.add_argument('--observation-function', default=None)
 
+    parser.add_argument(
+        '--num-episodes', type=int, default=1, help='number of episodes'
+    )
+    parser.add_argument(
+        '--num-workers',
+        type=int,
+        default=1,
+        help='number of worker processes (implies --headless if > 1)',
+    )
+    parser.add_argument(
+        '--headless',
+        action='store_true',
+        help='render without a display',
+    )
+    parser.add_argument(
+        '--manifest', default=None, help='output manifest JSON filename'
+    )
+
     imageio_help_sentinel = object()  # used to detect no argument given
     parser.add_argument(
         '--imageio-help',
@@ -146,6 +243,17 @@ def get_args():
             'you must give at least --state or --observation (or both)'
         )
 
+    if args.num_episodes <= 0 or args.num_workers <= 0:
+        raise ValueError('--num-episodes and --num-workers must be positive')
+
+    if args.num_episodes > 1 and any(
+        filename is not None and '{episode}' not in filename
+        for filename in [args.state, args.observation]
+    ):
+        raise ValueError(
+            'filenames must contain {episode} when recording many episodes'
+        )
+
     return args
 
 
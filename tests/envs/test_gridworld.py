@@ -0,0 +1,228 @@
+import numpy.random as rnd
+import pytest
+
+from gym_gridverse.action import Action
+from gym_gridverse.envs.gridworld import GridWorld
+from gym_gridverse.envs.observation_functions import (
+    factory as observation_factory,
+)
+from gym_gridverse.envs.yaml.factory import factory_env_from_yaml
+from gym_gridverse.geometry import Area
+from gym_gridverse.grid_object import DeliveryAddress, DeliveryHub
+from gym_gridverse.rng import make_rng
+from gym_gridverse.spaces import ObservationSpace
+from gym_gridverse.utils.fast_copy import fast_copy
+
+
+@pytest.mark.parametrize(
+    'path',
+    [
+        'yaml/gv_keydoor.5x5.yaml',
+        'yaml/gv_dynamic_obstacles.7x7.yaml',
+        'yaml/gv_teleport.5x5.yaml',
+    ],
+)
+def test_step_in_place_undo(path: str):
+    env = factory_env_from_yaml(path)
+    env.set_seed(0)
+    env.reset()
+    rng = make_rng(0)
+
+    states = []
+    for _ in range(20):
+        states.append(fast_copy(env.state))
+        action = env.action_space.actions[
+            rng.integers(env.action_space.num_actions)
+        ]
+        env.step_in_place(action)
+
+    for state in reversed(states):
+        env.undo()
+        assert env.state == state
+
+    with pytest.raises(RuntimeError):
+        env.undo()
+
+
+def test_step_in_place_undo_drone_env():
+    env = factory_env_from_yaml('custom_env.yaml')
+    env.set_seed(0)
+    env.reset()
+    grid = env.state.grid
+    position = next(
+        position
+        for position in grid.area.positions()
+        if isinstance(grid[position], DeliveryHub)
+    )
+    grid.set_object_attribute(position, 'item_num', 1)
+    env.state.agent.position = position
+
+    # the hub empties, and its one-off reload reward is then given
+    env.step_in_place(Action.ACTUATE)
+    env.step_in_place(Action.ACTUATE)
+    assert env.state.grid[position].is_rewarded
+
+    env.undo()
+    assert not env.state.grid[position].is_rewarded
+    env.undo()
+    assert env.state.grid[position].item_num == 1
+
+
+def test_step_in_place_reward():
+    env = factory_env_from_yaml('yaml/gv_keydoor.5x5.yaml')
+    env.set_seed(0)
+    env.reset()
+    rng = make_rng(0)
+
+    for _ in range(20):
+        action = env.action_space.actions[
+            rng.integers(env.action_space.num_actions)
+        ]
+        state = fast_copy(env.state)
+        next_state, expected_reward, expected_done = env.functional_step(
+            state, action
+        )
+
+        reward, done = env.step_in_place(action)
+        assert env.state == next_state
+        assert reward == expected_reward
+        assert done == expected_done
+
+
+def make_cached_env(path: str, observation_cache_size: int) -> GridWorld:
+    env = factory_env_from_yaml(path)
+    return GridWorld(
+        env.state_space,
+        env.action_space,
+        env.observation_space,
+        env._reset_function,
+        env._transition_function,
+        env._observation_function,
+        env._reward_function,
+        env._termination_function,
+        observation_cache_size=observation_cache_size,
+    )
+
+
+@pytest.mark.parametrize(
+    'path',
+    [
+        'yaml/gv_keydoor.5x5.yaml',
+        'yaml/gv_dynamic_obstacles.7x7.yaml',
+        'yaml/gv_nine_rooms.13x13.yaml',
+    ],
+)
+def test_observation_cache(path: str):
+    env = make_cached_env(path, 8)
+    env.set_seed(0)
+    env.reset()
+    rng = make_rng(0)
+
+    for _ in range(50):
+        action = env.action_space.actions[
+            rng.integers(env.action_space.num_actions)
+        ]
+        env.step(action)
+        expected = env._observation_function(env.state)
+        assert env.observation == expected
+        assert len(env._observation_cache) <= 8
+
+    assert len(env._observation_cache) > 0
+
+
+def test_observation_cache_hit():
+    env = make_cached_env('yaml/gv_keydoor.5x5.yaml', 8)
+    env.reset()
+
+    observation = env.functional_observation(env.state)
+    assert env.functional_observation(fast_copy(env.state)) is observation
+
+
+def test_observation_cache_object_attributes():
+    env = make_cached_env('yaml/gv_keydoor.5x5.yaml', 8)
+    env.observation_space = ObservationSpace(
+        env.observation_space.grid_shape,
+        env.observation_space.object_types + [DeliveryAddress],
+        env.observation_space.colors,
+    )
+    env.reset()
+    state = env.state
+    position = state.agent.position
+    state.grid[position] = DeliveryAddress(num_items=2)
+
+    def num_items(observation):
+        return [
+            obj.num_items
+            for row in observation.grid.objects
+            for obj in row
+            if isinstance(obj, DeliveryAddress)
+        ]
+
+    observation = env.functional_observation(state)
+    assert num_items(observation) == [2]
+
+    # attributes which do not affect object equality still change the key
+    other_state = fast_copy(state)
+    other_state.grid.set_object_attribute(position, 'num_items', 1)
+    assert num_items(env.functional_observation(other_state)) == [1]
+
+    # cached observations are not affected by in-place modifications
+    state.grid.set_object_attribute(position, 'num_items', 3)
+    assert num_items(env.functional_observation(state)) == [3]
+    assert num_items(observation) == [2]
+
+
+def test_observation_cache_stochastic_bypass():
+    env = make_cached_env('yaml/gv_keydoor.5x5.yaml', 8)
+    env._observation_function = observation_factory(
+        'stochastic_raytracing', area=Area((-6, 0), (-3, 3))
+    )
+    env.set_seed(0)
+    env.reset()
+
+    env.observation
+    assert len(env._observation_cache) == 0
+
+
+@pytest.mark.parametrize('with_observations', [False, True])
+def test_set_seed_independent_streams(with_observations: bool):
+    env = factory_env_from_yaml('yaml/gv_dynamic_obstacles.7x7.yaml')
+    env._observation_function = observation_factory(
+        'stochastic_raytracing', area=Area((-6, 0), (-3, 3))
+    )
+    rng = make_rng(0)
+    actions = [
+        env.action_space.actions[rng.integers(env.action_space.num_actions)]
+        for _ in range(20)
+    ]
+
+    def run(with_observations: bool):
+        env.set_seed(0)
+        env.reset()
+        states = [env.state]
+        for action in actions:
+            env.step(action)
+            states.append(env.state)
+            if with_observations:
+                env.observation
+        return states
+
+    # generating observations does not affect the dynamics
+    assert run(with_observations) == run(False)
+
+
+def test_set_seed_seed_sequence():
+    env = factory_env_from_yaml('yaml/gv_dynamic_obstacles.7x7.yaml')
+    seed_sequence = rnd.SeedSequence(1337)
+
+    def run():
+        env.set_seed(seed_sequence)
+        env.reset()
+        states = [env.state]
+        for _ in range(20):
+            env.step(Action.MOVE_FORWARD)
+            states.append(env.state)
+        return states
+
+    # seeding twice with the same seed sequence reproduces the trajectory
+    assert run() == run()
@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+
+from gym_gridverse.action import Action
+from gym_gridverse.envs.multi_drone import (
+    DroneRewards,
+    DroneSwarmState,
+    MultiDroneGridWorld,
+    resolve_collisions,
+)
+from gym_gridverse.geometry import Orientation, Position
+from gym_gridverse.grid_object import DeliveryAddress, DeliveryHub
+from gym_gridverse.rng import make_rng
+from gym_gridverse.utils.layouts import parse_ascii_layout
+
+LAYOUT = [
+    '#######',
+    '#.....#',
+    '#H...1#',
+    '#######',
+]
+
+
+def make_state(positions, orientations, capacities=None) -> DroneSwarmState:
+    num_drones = len(positions)
+    address_items = np.zeros((4, 7), dtype=int)
+    address_items[2, 5] = 1
+    hub_items = np.zeros((4, 7), dtype=int)
+    hub_items[2, 1] = DeliveryHub.item_num
+    return DroneSwarmState(
+        positions=np.array(positions),
+        orientations=np.array([o.value for o in orientations]),
+        capacities=np.zeros(num_drones, dtype=int)
+        if capacities is None
+        else np.array(capacities),
+        finished_deliver_nums=np.zeros(num_drones, dtype=int),
+        address_items=address_items,
+        hub_items=hub_items,
+        hub_rewarded=np.zeros((4, 7), dtype=bool),
+    )
+
+
+@pytest.mark.parametrize(
+    'positions,targets,expected',
+    [
+        # free moves
+        ([[1, 1], [1, 3]], [[1, 2], [1, 4]], [[1, 2], [1, 4]]),
+        # same target, lowest index wins
+        ([[1, 1], [1, 3]], [[1, 2], [1, 2]], [[1, 2], [1, 3]]),
+        ([[1, 3], [1, 1]], [[1, 2], [1, 2]], [[1, 2], [1, 1]]),
+        # swaps are blocked
+        ([[1, 1], [1, 2]], [[1, 2], [1, 1]], [[1, 1], [1, 2]]),
+        # following is allowed
+        ([[1, 1], [1, 2]], [[1, 2], [1, 3]], [[1, 2], [1, 3]]),
+        # blocked chain
+        (
+            [[1, 1], [1, 2], [1, 3], [1, 4]],
+            [[1, 2], [1, 3], [1, 4], [1, 4]],
+            [[1, 1], [1, 2], [1, 3], [1, 4]],
+        ),
+        # cycles are allowed
+        (
+            [[1, 1], [1, 2], [2, 2], [2, 1]],
+            [[1, 2], [2, 2], [2, 1], [1, 1]],
+            [[1, 2], [2, 2], [2, 1], [1, 1]],
+        ),
+    ],
+)
+def test_resolve_collisions(positions, targets, expected):
+    next_positions = resolve_collisions(
+        np.array(positions), np.array(targets), (4, 7)
+    )
+    np.testing.assert_array_equal(next_positions, expected)
+
+
+def test_multi_drone_step():
+    env = MultiDroneGridWorld(parse_ascii_layout(LAYOUT), 2)
+    state = make_state([[1, 1], [1, 2]], [Orientation.B, Orientation.R])
+
+    # drone 0 moves onto the hub, drone 1 turns
+    state, rewards, done = env.functional_step(
+        state, [Action.MOVE_FORWARD, Action.TURN_RIGHT]
+    )
+    np.testing.assert_array_equal(state.positions, [[2, 1], [1, 2]])
+    np.testing.assert_array_equal(
+        state.orientations, [Orientation.B.value, Orientation.B.value]
+    )
+    np.testing.assert_array_equal(rewards, [-0.1, -0.1])
+    assert not done
+
+    # drone 0 reloads, drone 1 actuates on the floor
+    state, rewards, done = env.functional_step(
+        state, [Action.ACTUATE, Action.ACTUATE]
+    )
+    np.testing.assert_array_equal(state.capacities, [1, 0])
+    assert state.hub_items[2, 1] == DeliveryHub.item_num - 1
+    np.testing.assert_allclose(rewards, [199.9, -5.1])
+    assert not done
+
+
+def test_multi_drone_deliver():
+    rewards = DroneRewards(living=0.0, holding=0.0)
+    env = MultiDroneGridWorld(parse_ascii_layout(LAYOUT), 1, rewards=rewards)
+    state = make_state([[2, 5]], [Orientation.F], capacities=[2])
+
+    next_state, rewards, done = env.functional_step(state, [Action.ACTUATE])
+    assert next_state.address_items[2, 5] == 0
+    np.testing.assert_array_equal(next_state.capacities, [1])
+    np.testing.assert_array_equal(next_state.finished_deliver_nums, [1])
+    np.testing.assert_array_equal(rewards, [800.0 + 500.0])
+    assert done
+
+    # the input state is not modified
+    assert state.address_items[2, 5] == 1
+
+    single_agent_state = env.to_state(next_state, 0)
+    assert single_agent_state.agent.position == Position(2, 5)
+    assert single_agent_state.agent.capacity == 1
+    address = single_agent_state.grid[Position(2, 5)]
+    assert isinstance(address, DeliveryAddress)
+    assert address.num_items == 0
+
+
+def test_multi_drone_actuate_rewards():
+    rewards = DroneRewards(living=0.0, holding=0.0)
+    env = MultiDroneGridWorld(parse_ascii_layout(LAYOUT), 3, rewards=rewards)
+    # drone 0 on the hub, drone 1 on the address, drone 2 on the floor
+    state = make_state(
+        [[2, 1], [2, 5], [1, 3]],
+        [Orientation.F, Orientation.F, Orientation.F],
+    )
+    state.hub_items[2, 1] = 0
+
+    # empty hub (first time), address without carried items, floor
+    state, rewards, _ = env.functional_step(state, [Action.ACTUATE] * 3)
+    np.testing.assert_array_equal(rewards, [200.0 - 10.0, -10.0, -5.0])
+    assert state.hub_rewarded[2, 1]
+    assert env.to_state(state, 0).grid[Position(2, 1)].is_rewarded
+
+    # the emptied hub is only rewarded once
+    state, rewards, _ = env.functional_step(state, [Action.ACTUATE] * 3)
+    np.testing.assert_array_equal(rewards, [-10.0, -10.0, -5.0])
+
+
+def test_multi_drone_reset():
+    env = MultiDroneGridWorld(parse_ascii_layout(LAYOUT), 6)
+
+    env.set_seed(0)
+    env.reset()
+    state = env.state
+
+    # drones are on distinct Floor cells
+    assert len({tuple(position) for position in state.positions.tolist()}) == 6
+    assert all(LAYOUT[y][x] == '.' for y, x in state.positions.tolist())
+
+    env.set_seed(0)
+    env.reset()
+    np.testing.assert_array_equal(env.state.positions, state.positions)
+
+    rng = make_rng(0)
+    for _ in range(20):
+        actions = rng.integers(len(Action), size=6)
+        env.step(actions)
+        positions = env.state.positions.tolist()
+        assert len({tuple(position) for position in positions}) == 6
+        assert all(LAYOUT[y][x] != '#' for y, x in positions)
+
+    with pytest.raises(ValueError):
+        env.step([Action.ACTUATE])
+
+    with pytest.raises(ValueError):
+        MultiDroneGridWorld(parse_ascii_layout(LAYOUT), 9)
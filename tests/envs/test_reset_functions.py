@@ -3,21 +3,27 @@ from typing import Type
 import pytest
 
 from gym_gridverse.envs.reset_functions import (
+    ResetPool,
     crossing,
     dynamic_obstacles,
     factory,
+    from_layout,
+    from_layout_file,
     keydoor,
+    pooled,
     teleport,
 )
-from gym_gridverse.geometry import Shape
+from gym_gridverse.geometry import Position, Shape
 from gym_gridverse.grid_object import (
     Door,
     Exit,
+    Floor,
     Key,
     MovingObstacle,
     Telepod,
     Wall,
 )
+from gym_gridverse.rng import make_rng
 from gym_gridverse.state import State
 
 
@@ -189,3 +195,122 @@ def test_factory_valid(name: str, kwargs):
 def test_factory_invalid(name: str, kwargs, exception: Type[Exception]):
     with pytest.raises(exception):
         factory(name, **kwargs)
+
+
+@pytest.mark.parametrize('background', ['none', 'thread', 'process'])
+def test_reset_pool(background: str):
+    reset_function = factory('keydoor', shape=Shape(7, 7))
+    pool = ResetPool(reset_function, pool_size=3, background=background)
+
+    rng = make_rng(0)
+    states = [pool(rng=rng) for _ in range(7)]
+    assert len(set(map(id, states))) == 7
+
+    # the same rng seed produces the same states
+    rng = make_rng(0)
+    assert [pool(rng=rng) for _ in range(7)] == states
+
+    # independently of the background
+    other_pool = ResetPool(reset_function, pool_size=3, background='none')
+    rng = make_rng(0)
+    assert [other_pool(rng=rng) for _ in range(7)] == states
+
+    pool.close()
+
+
+def test_reset_pool_invalid():
+    reset_function = factory('keydoor', shape=Shape(7, 7))
+
+    with pytest.raises(ValueError):
+        ResetPool(reset_function, pool_size=0)
+
+    with pytest.raises(ValueError):
+        ResetPool(reset_function, background='invalid')
+
+
+def test_reset_pooled_factory():
+    reset_function = factory(
+        'pooled',
+        reset_function=factory('keydoor', shape=Shape(7, 7)),
+        pool_size=4,
+        background='none',
+    )
+
+    rng = make_rng(0)
+    states = [reset_function(rng=rng) for _ in range(6)]
+    rng = make_rng(0)
+    assert [reset_function(rng=rng) for _ in range(6)] == states
+
+
+def counting_keydoor():
+    calls = []
+
+    def reset_function(*, rng=None):
+        calls.append(None)
+        return keydoor(shape=Shape(7, 7), rng=rng)
+
+    return reset_function, calls
+
+
+def test_reset_pool_no_background():
+    reset_function, calls = counting_keydoor()
+    pool = ResetPool(reset_function, pool_size=3, background='none')
+    rng = make_rng(0)
+
+    # batches are only generated when the pool is empty
+    pool(rng=rng)
+    assert len(calls) == 3
+    pool(rng=rng)
+    pool(rng=rng)
+    assert len(calls) == 3
+    pool(rng=rng)
+    assert len(calls) == 6
+
+
+def test_reset_pooled_arguments():
+    reset_function, calls = counting_keydoor()
+    rng = make_rng(0)
+
+    pooled(
+        reset_function=reset_function, pool_size=2, background='none', rng=rng
+    )
+    assert len(calls) == 2
+
+    # different arguments use a different pool
+    pooled(
+        reset_function=reset_function, pool_size=3, background='none', rng=rng
+    )
+    assert len(calls) == 5
+    pooled(
+        reset_function=reset_function, pool_size=2, background='none', rng=rng
+    )
+    assert len(calls) == 5
+
+
+def test_reset_from_layout():
+    layout = ['#####', '#H.1#', '#...#', '#####']
+
+    state = from_layout(layout, agent_position=[1, 1])
+    assert state.agent.position == Position(1, 1)
+
+    rng = make_rng(0)
+    states = [from_layout(layout, rng=rng) for _ in range(10)]
+    assert all(
+        isinstance(state.grid[state.agent.position], Floor) for state in states
+    )
+    assert all(state.grid == states[0].grid for state in states)
+
+    with pytest.raises(ValueError):
+        from_layout(layout, agent_position=[4, 0])
+    with pytest.raises(ValueError):
+        from_layout(layout, agent_position=[0, 0])
+
+
+def test_reset_from_layout_file(tmp_path):
+    layout = ['#####', '#H.1#', '#...#', '#####']
+    path = tmp_path / 'layout.txt'
+    path.write_text('\n'.join(layout))
+
+    state = from_layout_file(str(path), rng=make_rng(0))
+    assert state.grid == from_layout(layout).grid
+    assert isinstance(state.grid[state.agent.position], Floor)
@@ -10,6 +10,8 @@ from gym_gridverse.envs.reward_functions import (
     bump_moving_obstacle,
     factory,
     getting_closer,
+    getting_closer_Address,
+    getting_closer_Hub,
     getting_closer_shortest_path,
     living_reward,
     pickndrop,
@@ -20,6 +22,8 @@ from gym_gridverse.geometry import Orientation, Position
 from gym_gridverse.grid import Grid
 from gym_gridverse.grid_object import (
     Color,
+    DeliveryAddress,
+    DeliveryHub,
     Door,
     Exit,
     Key,
@@ -27,6 +31,7 @@ from gym_gridverse.grid_object import (
     Wall,
 )
 from gym_gridverse.state import State
+from gym_gridverse.utils.layouts import parse_ascii_layout
 
 
 def make_5x5_exit_state() -> State:
@@ -252,6 +257,77 @@ def test_getting_closer_shortest_path(
     )
 
 
+def make_delivery_state(position: Position, **num_items: int) -> State:
+    grid = parse_ascii_layout(
+        [
+            '#######',
+            '#.....#',
+            '#H1.#2#',
+            '#######',
+        ]
+    ).instantiate()
+    for name, n in num_items.items():
+        grid.set_object_attribute(
+            Position(2, 2 if name == 'near' else 5), 'num_items', n
+        )
+    return State(grid, Agent(position, Orientation.F))
+
+
+@pytest.mark.parametrize(
+    'position,next_position,num_items,expected',
+    [
+        # closer/further to the nearest address, plus/minus remaining items
+        (Position(1, 3), Position(1, 2), {}, 1.0 + 3 * 0.2),
+        (Position(1, 2), Position(1, 3), {}, 0.0 - 3 * 0.2),
+        (Position(1, 3), Position(1, 3), {}, 0.0),
+        # empty addresses are ignored
+        (Position(1, 4), Position(1, 3), {'near': 0}, 0.0 - 2 * 0.2),
+        (Position(1, 3), Position(1, 4), {'near': 0}, 1.0 + 2 * 0.2),
+        # all addresses empty
+        (Position(1, 4), Position(1, 3), {'near': 0, 'far': 0}, -1.0),
+    ],
+)
+def test_getting_closer_address(
+    position: Position,
+    next_position: Position,
+    num_items,
+    expected: float,
+):
+    state = make_delivery_state(position, **num_items)
+    next_state = make_delivery_state(next_position, **num_items)
+    reward = getting_closer_Address(
+        state,
+        Action.MOVE_LEFT,
+        next_state,
+        object_type=DeliveryAddress,
+        hub_type=DeliveryHub,
+    )
+    assert reward == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    'position,next_position,expected',
+    [
+        (
+            Position(1, 3),
+            Position(1, 2),
+            5.0 + 1.5 * DeliveryHub.item_num * 0.01,
+        ),
+        (Position(1, 2), Position(1, 3), 0.0 - DeliveryHub.item_num * 0.01 * 5),
+        (Position(1, 2), Position(1, 2), 0.0),
+    ],
+)
+def test_getting_closer_hub(
+    position: Position, next_position: Position, expected: float
+):
+    state = make_delivery_state(position)
+    next_state = make_delivery_state(next_position)
+    reward = getting_closer_Hub(
+        state, Action.MOVE_LEFT, next_state, object_type=DeliveryHub
+    )
+    assert reward == pytest.approx(expected)
+
+
 @pytest.mark.parametrize(
     'state,action,kwargs,expected',
     [
@@ -4,6 +4,7 @@ import copy
 from typing import List
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pytest
 
 from gym_gridverse.action import Action
@@ -20,7 +21,12 @@ from gym_gridverse.envs.transition_functions import (
     transition_with_copy,
     turn_agent,
 )
-from gym_gridverse.geometry import Orientation, Position, Shape
+from gym_gridverse.geometry import (
+    Orientation,
+    Position,
+    Shape,
+    get_manhattan_boundary,
+)
 from gym_gridverse.grid import Grid
 from gym_gridverse.grid_object import (
     Box,
@@ -34,7 +40,9 @@ from gym_gridverse.grid_object import (
     Telepod,
     Wall,
 )
+from gym_gridverse.rng import make_rng
 from gym_gridverse.state import State
+from gym_gridverse.utils.fast_copy import fast_copy
 
 
 def make_moving_obstacle_state():
@@ -362,6 +370,39 @@ def test_move_obstacles(
     assert state.grid == expected_state.grid
 
 
+def _move_obstacles_sequential(state: State, uniforms: np.ndarray):
+    """reference implementation, which moves one obstacle at a time"""
+    positions = [
+        position
+        for position in state.grid.area.positions()
+        if isinstance(state.grid[position], MovingObstacle)
+    ]
+
+    for position, uniform in zip(positions, uniforms):
+        next_positions = [
+            next_position
+            for next_position in get_manhattan_boundary(position, distance=1)
+            if state.grid.area.contains(next_position)
+            and isinstance(state.grid[next_position], Floor)
+        ]
+        if next_positions:
+            i = int(uniform * len(next_positions))
+            state.grid.swap(position, next_positions[i])
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_move_obstacles_sequential_semantics(seed: int):
+    state = dynamic_obstacles(
+        Shape(12, 12), num_obstacles=40, rng=make_rng(seed)
+    )
+    expected_state = fast_copy(state)
+
+    move_obstacles(state, Action.PICK_N_DROP, rng=make_rng(seed))
+    _move_obstacles_sequential(expected_state, make_rng(seed).random(40))
+
+    assert state.grid == expected_state.grid
+
+
 @pytest.mark.parametrize(
     'door_state,door_color,key_color,action,expected_state',
     [
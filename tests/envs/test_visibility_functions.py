@@ -1,16 +1,23 @@
-from typing import List, Type
+from typing import List, Tuple, Type
 
+import numpy as np
 import pytest
 
 from gym_gridverse.envs.visibility_functions import (
+    CachedVisibilityFunction,
     factory,
     fully_transparent,
     partially_occluded,
     raytracing,
+    stochastic_raytracing,
+    stochastic_raytracing_batch,
+    stochastic_raytracing_probabilities,
 )
 from gym_gridverse.geometry import Position
 from gym_gridverse.grid import Grid
 from gym_gridverse.grid_object import Floor, GridObject, Wall
+from gym_gridverse.rng import make_rng
+from gym_gridverse.utils.raytracing import compute_rays_fancy
 
 
 @pytest.mark.parametrize(
@@ -173,6 +180,106 @@ def test_raytracing_visibility(
     assert (visibility == expected_int).all()
 
 
+def _raytracing_counts(
+    grid: Grid, position: Position
+) -> Tuple[np.ndarray, np.ndarray]:
+    """reference (ray by ray) implementation of the raytracing counts"""
+    counts_num = np.zeros((grid.shape.height, grid.shape.width), dtype=int)
+    counts_den = np.zeros((grid.shape.height, grid.shape.width), dtype=int)
+
+    for ray in compute_rays_fancy(position, grid.area):
+        light = True
+        for pos in ray:
+            counts_num[pos.y, pos.x] += int(light)
+            counts_den[pos.y, pos.x] += 1
+            light = light and not grid[pos].blocks_vision
+
+    return counts_num, counts_den
+
+
+def _random_grid(seed: int) -> Grid:
+    rng = make_rng(seed)
+    walls = rng.random((7, 5)) < 0.3
+    return Grid(
+        [[Wall() if wall else Floor() for wall in row] for row in walls]
+    )
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_raytracing_reference(seed: int):
+    grid = _random_grid(seed)
+    position = Position(6, 2)
+    counts_num, counts_den = _raytracing_counts(grid, position)
+
+    for threshold in [1, 3]:
+        expected = counts_num >= threshold
+        assert (
+            raytracing(grid, position, threshold=threshold) == expected
+        ).all()
+
+    expected = (counts_num / counts_den) >= 0.5
+    visibility = raytracing(
+        grid, position, absolute_counts=False, threshold=0.5
+    )
+    assert (visibility == expected).all()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected_probs = np.nan_to_num(counts_num / counts_den)
+    probs = stochastic_raytracing_probabilities(grid, position)
+    np.testing.assert_allclose(probs, expected_probs)
+
+
+def test_stochastic_raytracing_batch():
+    grids = [_random_grid(seed) for seed in range(4)]
+    positions = [Position(6, 2)] * 4
+
+    visibility = stochastic_raytracing_batch(grids, positions, rng=make_rng(0))
+    assert visibility.shape == (4, 7, 5)
+    assert visibility.dtype == bool
+
+    # a single batched draw matches sequential draws from the same stream
+    rng = make_rng(0)
+    uniforms = rng.random((4, 7, 5))
+    for grid, position, u, v in zip(grids, positions, uniforms, visibility):
+        probs = stochastic_raytracing_probabilities(grid, position)
+        assert ((u <= probs) == v).all()
+
+    # the agent cell is always reached
+    assert visibility[:, 6, 2].all()
+    assert stochastic_raytracing(grids[0], positions[0], rng=rng)[6, 2]
+
+
+@pytest.mark.parametrize('name', ['fully_transparent', 'raytracing'])
+def test_cached_visibility_function(name: str):
+    visibility_function = factory(name)
+    cached_visibility_function = factory(name, cache_size=3)
+    assert isinstance(cached_visibility_function, CachedVisibilityFunction)
+
+    grids = [_random_grid(seed) for seed in range(4)]
+    position = Position(6, 2)
+    for grid in grids + grids[::-1]:
+        expected = visibility_function(grid, position)
+        visibility = cached_visibility_function(grid, position)
+        assert (visibility == expected).all()
+        assert not visibility.flags.writeable
+
+    # in reverse, grids 3, 2 and 1 are hits, but grids[0] was evicted
+    info = cached_visibility_function.cache_info()
+    assert (info['hits'], info['misses'], info['size']) == (3, 5, 3)
+    assert cached_visibility_function.hit_rate == 3 / 8
+
+    cached_visibility_function.cache_clear()
+    assert cached_visibility_function.cache_info()['size'] == 0
+
+
+def test_cached_visibility_function_invalid():
+    with pytest.raises(ValueError):
+        factory('stochastic_raytracing', cache_size=8)
+
+    with pytest.raises(ValueError):
+        CachedVisibilityFunction(raytracing, maxsize=0)
+
+
 @pytest.mark.parametrize(
     'name',
     [
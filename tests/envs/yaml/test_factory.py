@@ -5,8 +5,10 @@ import pytest
 from schema import SchemaError
 
 import gym_gridverse.envs.yaml.factory as yaml_factory
+import yaml
 from gym_gridverse.action import Action
 from gym_gridverse.envs import InnerEnv
+from gym_gridverse.envs.visibility_functions import CachedVisibilityFunction
 from gym_gridverse.geometry import Shape
 from gym_gridverse.spaces import ActionSpace
 
@@ -98,6 +100,46 @@ def test_factory_action_space_fail(data):
         yaml_factory.factory_action_space(data)
 
 
+def test_factory_visibility_function_cache_size():
+    visibility_function = yaml_factory.factory_visibility_function(
+        {'name': 'raytracing', 'cache_size': 16}
+    )
+    assert isinstance(visibility_function, CachedVisibilityFunction)
+    assert visibility_function.maxsize == 16
+
+    visibility_function = yaml_factory.factory_visibility_function(
+        {'name': 'raytracing'}
+    )
+    assert not isinstance(visibility_function, CachedVisibilityFunction)
+
+    with pytest.raises(SchemaError):
+        yaml_factory.factory_visibility_function(
+            {'name': 'raytracing', 'cache_size': 0}
+        )
+
+
+def test_factory_pooled_reset_function():
+    with open('yaml/gv_keydoor.5x5.yaml') as f:
+        data = yaml.safe_load(f)
+
+    data['reset_function'] = {
+        'name': 'pooled',
+        'reset_function': data['reset_function'],
+        'pool_size': 4,
+    }
+    env = yaml_factory.factory_env_from_data(data)
+
+    def reset_states(seed: int):
+        env.set_seed(seed)
+        states = []
+        for _ in range(6):
+            env.reset()
+            states.append(env.state)
+        return states
+
+    assert reset_states(0) == reset_states(0)
+
+
 # NOTE: individual factory_xxx_function are annoying to test comprehensively;
 # they are tested indirectly by testing the entire format from the yaml files
 
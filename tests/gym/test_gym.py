@@ -4,6 +4,7 @@ import gym
 import numpy as np
 import pytest
 
+from gym_gridverse.action import Action
 from gym_gridverse.gym import GymStateWrapper
 
 
@@ -89,3 +90,102 @@ def test_gym_state_wrapper(env_id: str, representation: str):
 
         if done:
             env.reset()
+
+
+@pytest.mark.parametrize('env_id', ['GV-Empty-4x4-v0', 'GV-Keydoor-5x5-v0'])
+def test_gym_reset_batch(env_id: str):
+    env = gym.make(env_id)
+    seeds = [1, 10, 1337]
+
+    observations = env.reset_batch(len(seeds), seeds)
+
+    for i, seed in enumerate(seeds):
+        env.unwrapped.outer_env.inner_env.set_seed(seed)
+        observation = env.reset()
+        for key, array in observation.items():
+            assert observations[key].shape == (len(seeds),) + array.shape
+            np.testing.assert_equal(observations[key][i], array)
+
+    with pytest.raises(ValueError):
+        env.reset_batch(2, seeds)
+
+
+def test_gym_step_no_obs():
+    env = gym.make('GV-Keydoor-5x5-v0')
+    inner_env = env.unwrapped.outer_env.inner_env
+
+    env.unwrapped.reset_no_obs()
+    assert inner_env._observation is None
+
+    reward, done, info = env.unwrapped.step_no_obs(0)
+    assert inner_env._observation is None
+    assert isinstance(reward, float)
+    assert isinstance(done, bool)
+
+    # observations are still available on request
+    np.testing.assert_equal(
+        env.unwrapped.observation,
+        env.unwrapped.outer_env.observation_representation.convert(
+            inner_env.observation
+        ),
+    )
+
+
+@pytest.mark.parametrize('observation_info', [False, True])
+def test_gym_state_wrapper_observation_info(observation_info: bool):
+    env = gym.make('GV-Keydoor-5x5-v0').unwrapped
+    env.set_state_representation('default')
+    env = GymStateWrapper(env, observation_info=observation_info)
+    inner_env = env.unwrapped.outer_env.inner_env
+
+    env.reset()
+    _, _, _, info = env.step(env.action_space.sample())
+
+    if observation_info:
+        np.testing.assert_equal(info['observation'], env.unwrapped.observation)
+    else:
+        assert 'observation' not in info
+        assert inner_env._observation is None
+
+
+def test_gym_state_wrapper_default_observation_info():
+    env = gym.make('GV-Keydoor-5x5-v0')
+    env.set_state_representation('default')
+    env = GymStateWrapper(env)
+
+    env.reset()
+    _, _, _, info = env.step(env.action_space.sample())
+    assert 'observation' in info
+
+
+class StepLimit(gym.Wrapper):
+    """4-tuple API time limit"""
+
+    def __init__(self, env, max_episode_steps: int):
+        super().__init__(env)
+        self.max_episode_steps = max_episode_steps
+        self.num_steps = 0
+
+    def reset(self, **kwargs):
+        self.num_steps = 0
+        return self.env.reset(**kwargs)
+
+    def step(self, action):
+        observation, reward, done, info = self.env.step(action)
+        self.num_steps += 1
+        done = done or self.num_steps >= self.max_episode_steps
+        return observation, reward, done, info
+
+
+@pytest.mark.parametrize('observation_info', [False, True])
+def test_gym_state_wrapper_intermediate_wrapper(observation_info: bool):
+    env = gym.make('GV-Keydoor-5x5-v0').unwrapped
+    env.set_state_representation('default')
+    env = GymStateWrapper(
+        StepLimit(env, max_episode_steps=3), observation_info=observation_info
+    )
+
+    # intermediate wrappers are not skipped
+    env.reset()
+    dones = [env.step(Action.TURN_LEFT.value)[2] for _ in range(3)]
+    assert dones == [False, False, True]
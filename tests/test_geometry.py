@@ -1,6 +1,7 @@
 import math
 from typing import Sequence
 
+import numpy as np
 import pytest
 
 from gym_gridverse.geometry import (
@@ -8,7 +9,9 @@ from gym_gridverse.geometry import (
     Orientation,
     Position,
     Transform,
+    distance_function_factory,
     get_manhattan_boundary,
+    get_manhattan_boundary_coordinates,
 )
 
 
@@ -372,3 +375,56 @@ def test_transform_neg_identity(transform: Transform):
 )
 def test_transform_mul_area(transform: Transform, area: Area, expected: Area):
     assert transform * area == expected
+
+
+@pytest.mark.parametrize('area', [A((0, 3), (0, 2)), A((-2, 1), (-1, 3))])
+@pytest.mark.parametrize('selection', ['all', 'border', 'inside'])
+def test_area_coordinates(area: Area, selection: str):
+    coordinates = area.coordinates(selection)
+    expected = [position.yx for position in area.positions(selection)]
+    assert coordinates.shape == (len(expected), 2)
+    assert [tuple(yx) for yx in coordinates.tolist()] == expected
+    assert area.contains_coordinates(coordinates).all()
+
+
+@pytest.mark.parametrize('orientation', list(O_))
+def test_orientation_mul_coordinates(orientation: Orientation):
+    area = A((-2, 1), (-1, 3))
+    coordinates = orientation * area.coordinates()
+    expected = [(orientation * position).yx for position in area.positions()]
+    assert [tuple(yx) for yx in coordinates.tolist()] == expected
+
+
+@pytest.mark.parametrize(
+    'transform', [T(0, 0, O_.F), T(1, 1, O_.R), T(-2, 3, O_.B), T(2, 0, O_.L)]
+)
+def test_transform_mul_coordinates(transform: Transform):
+    area = A((-2, 1), (-1, 3))
+    coordinates = transform * area.coordinates()
+    expected = [(transform * position).yx for position in area.positions()]
+    assert [tuple(yx) for yx in coordinates.tolist()] == expected
+
+
+@pytest.mark.parametrize('distance', [1, 2, 3])
+def test_manhattan_boundary_coordinates(distance: int):
+    positions = [P(0, 0), P(4, 3), P(-1, 2)]
+    coordinates = np.array([position.yx for position in positions])
+    boundaries = get_manhattan_boundary_coordinates(coordinates, distance)
+
+    assert boundaries.shape == (len(positions), 4 * distance, 2)
+    for position, boundary in zip(positions, boundaries):
+        expected = [p.yx for p in get_manhattan_boundary(position, distance)]
+        assert [tuple(yx) for yx in boundary.tolist()] == expected
+
+
+@pytest.mark.parametrize('name', ['manhattan', 'euclidean'])
+def test_distance_function_vectorized(name: str):
+    distance_function = distance_function_factory(name)
+    distances_function = distance_function_factory(name, vectorized=True)
+
+    positions = list(A((-1, 2), (0, 3)).positions())
+    coordinates = np.array([position.yx for position in positions])
+    distances = distances_function(coordinates[:, None], coordinates[None, :])
+
+    expected = [[distance_function(p, q) for q in positions] for p in positions]
+    np.testing.assert_allclose(distances, expected)
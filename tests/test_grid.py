@@ -1,12 +1,15 @@
 from typing import List
 
+import numpy as np
 import pytest
 
-from gym_gridverse.geometry import Area, Orientation, Position, Shape
+from gym_gridverse.geometry import Area, Orientation, Position, Shape, Transform
 from gym_gridverse.grid import Grid
 from gym_gridverse.grid_object import (
     Box,
     Color,
+    DeliveryAddress,
+    Door,
     Exit,
     Floor,
     GridObject,
@@ -102,6 +105,26 @@ def test_grid_object_types():
     grid[1, 1] = Wall()
     assert grid.object_types() == set([Floor, Exit, Wall])
 
+    grid.swap(Position(0, 0), Position(2, 3))
+    grid[1, 1] = Floor()
+    assert grid.object_types() == set([Floor, Exit])
+
+
+def test_grid_object_colors():
+    grid = Grid.from_shape((3, 4))
+
+    assert grid.object_colors() == set([Color.NONE])
+
+    grid[0, 0] = Key(Color.RED)
+    grid[1, 1] = Key(Color.BLUE)
+    assert grid.object_colors() == set([Color.NONE, Color.RED, Color.BLUE])
+
+    grid[0, 0] = Floor()
+    assert grid.object_colors() == set([Color.NONE, Color.BLUE])
+
+    grid.set_object_attribute(Position(1, 1), 'color', Color.GREEN)
+    assert grid.object_colors() == set([Color.NONE, Color.GREEN])
+
 
 def test_grid_get_item():
     grid = Grid.from_shape((3, 4))
@@ -122,6 +145,81 @@ def test_grid_set_item():
     assert grid[pos] is obj
 
 
+def test_grid_object_index():
+    grid = Grid.from_shape((3, 4))
+    grid[0, 1] = Key(Color.RED)
+    grid[2, 0] = Key(Color.RED)
+    grid[1, 1] = Key(Color.BLUE)
+
+    assert grid.object_index(Key) == {
+        Color.RED: (Position(0, 1), Position(2, 0)),
+        Color.BLUE: (Position(1, 1),),
+    }
+    assert grid.object_index(Wall) == {}
+
+    # unrelated writes do not invalidate the index
+    index = grid.object_index(Key)
+    grid[0, 0] = Wall()
+    assert grid.object_index(Key) is index
+
+    grid.swap(Position(1, 1), Position(1, 2))
+    assert grid.object_index(Key)[Color.BLUE] == (Position(1, 2),)
+
+    grid[0, 1] = Floor()
+    assert grid.object_index(Key)[Color.RED] == (Position(2, 0),)
+    assert grid.object_index(Wall) == {Color.NONE: (Position(0, 0),)}
+
+
+def test_grid_property_mask():
+    grid = Grid.from_shape((3, 4))
+
+    def expected_mask(name: str) -> List[List[bool]]:
+        return [[getattr(obj, name) for obj in row] for row in grid.objects]
+
+    names = ['blocks_movement', 'blocks_vision', 'holdable']
+    masks = {name: grid.property_mask(name) for name in names}
+    assert not masks['blocks_movement'].any()
+
+    grid[0, 0] = Wall()
+    grid[1, 2] = Key(Color.RED)
+    grid[2, 3] = Door(Door.Status.CLOSED, Color.RED)
+    grid.swap(Position(0, 0), Position(2, 0))
+    grid.set_object_attribute(Position(2, 3), 'state', Door.Status.OPEN)
+
+    for name in names:
+        assert (grid.property_mask(name) == expected_mask(name)).all()
+        # masks are read-only views which reflect writes
+        assert (masks[name] == expected_mask(name)).all()
+        assert not masks[name].flags.writeable
+
+    with pytest.raises(ValueError):
+        grid.property_mask('color')
+
+
+def test_grid_attribute_array():
+    grid = Grid.from_shape((3, 4))
+    grid[0, 0] = DeliveryAddress(num_items=2)
+
+    array = grid.attribute_array(DeliveryAddress, 'num_items')
+    assert array[0, 0] == 2
+    assert np.isnan(array).sum() == 11
+
+    grid[1, 1] = DeliveryAddress(num_items=1)
+    grid.swap(Position(0, 0), Position(2, 3))
+    grid.set_object_attribute(Position(1, 1), 'num_items', 3)
+    grid[0, 0] = Wall()
+
+    expected = np.full((3, 4), np.nan)
+    expected[1, 1] = 3
+    expected[2, 3] = 2
+    np.testing.assert_array_equal(
+        grid.attribute_array(DeliveryAddress, 'num_items'), expected
+    )
+    # arrays are read-only views which reflect writes
+    np.testing.assert_array_equal(array, expected)
+    assert not array.flags.writeable
+
+
 def test_grid_swap():
     grid = Grid.from_shape((3, 4))
 
@@ -326,3 +424,33 @@ def test_grid_mul(
 
     expected = Grid(expected_objects)
     assert grid * orientation == expected
+
+
+@pytest.mark.parametrize('orientation', list(Orientation))
+@pytest.mark.parametrize(
+    'position', [Position(0, 0), Position(1, 2), Position(2, 3)]
+)
+def test_grid_view(orientation: Orientation, position: Position):
+    grid = Grid(
+        [
+            [Wall(), Floor(), Key(Color.RED), Floor()],
+            [Floor(), Exit(), Floor(), Box(Key(Color.BLUE))],
+            [Key(Color.GREEN), Floor(), Wall(), Key(Color.YELLOW)],
+        ]
+    )
+    transform = Transform(position, orientation)
+    area = Area((-3, 0), (-2, 2))
+
+    def expected_view() -> Grid:
+        return grid.subgrid(transform * area) * orientation
+
+    assert grid.view(transform, area) == expected_view()
+
+    # writes after the first view are reflected in the next ones
+    grid[1, 2] = Key(Color.RED)
+    grid.swap(Position(0, 0), Position(2, 1))
+    assert grid.view(transform, area) == expected_view()
+
+    # larger areas extend the padding
+    area = Area((-4, 1), (-3, 3))
+    assert grid.view(transform, area) == expected_view()
@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+
+from gym_gridverse.envs.yaml.factory import factory_env_from_yaml
+from gym_gridverse.geometry import Orientation
+from gym_gridverse.grid_object import Color, DeliveryAddress, Door, Floor, Wall
+from gym_gridverse.rasterization import (
+    BLACK,
+    BLUE,
+    GREEN,
+    RED,
+    YELLOW,
+    GridVerseRasterizer,
+    sprite_key,
+)
+from gym_gridverse.recording import Data, generate_images
+
+
+@pytest.mark.parametrize(
+    'path',
+    [
+        'yaml/gv_keydoor.5x5.yaml',
+        'yaml/gv_teleport.7x7.yaml',
+        'yaml/gv_dynamic_obstacles.7x7.yaml',
+    ],
+)
+@pytest.mark.parametrize('tile_size', [8, 40])
+def test_rasterizer_shape(path: str, tile_size: int):
+    env = factory_env_from_yaml(path)
+    env.reset()
+    rasterizer = GridVerseRasterizer(tile_size=tile_size, supersampling=1)
+
+    image = rasterizer.render(env.state)
+    height, width = env.state.grid.shape.height, env.state.grid.shape.width
+    assert image.shape == (height * tile_size, width * tile_size, 3)
+    assert image.dtype == np.uint8
+
+    image = rasterizer.render(env.observation)
+    height, width = (
+        env.observation.grid.shape.height,
+        env.observation.grid.shape.width,
+    )
+    assert image.shape == (height * tile_size, width * tile_size, 3)
+
+
+@pytest.mark.parametrize('tile_size', [8, 40])
+def test_rasterizer_grid_lines(tile_size: int):
+    env = factory_env_from_yaml('yaml/gv_empty.4x4.yaml')
+    env.reset()
+    rasterizer = GridVerseRasterizer(tile_size=tile_size, supersampling=1)
+
+    # the outer frame is dark on all sides
+    image = rasterizer.render(env.state)
+    assert (image[0] == 0).all()
+    assert (image[-1] == 0).all()
+    assert (image[:, 0] == 0).all()
+    assert (image[:, -1] == 0).all()
+
+
+def test_rasterizer_sprite_cache():
+    env = factory_env_from_yaml('yaml/gv_empty.8x8.yaml')
+    env.reset()
+    rasterizer = GridVerseRasterizer(tile_size=8, supersampling=1)
+
+    image1 = rasterizer.render(env.state)
+    num_sprites = len(rasterizer._atlas)
+    image2 = rasterizer.render(env.state)
+
+    # only floors, walls, and the exit
+    assert num_sprites == 3
+    assert len(rasterizer._atlas) == num_sprites
+    np.testing.assert_array_equal(image1, image2)
+
+
+def test_rasterizer_agent_orientation():
+    env = factory_env_from_yaml('yaml/gv_empty.4x4.yaml')
+    env.reset()
+    rasterizer = GridVerseRasterizer(tile_size=16)
+
+    images = []
+    for orientation in [Orientation.F, Orientation.L]:
+        env.state.agent.orientation = orientation
+        images.append(rasterizer.render(env.state))
+
+    assert not np.array_equal(images[0], images[1])
+
+
+def test_sprite_key():
+    assert sprite_key(Floor()) == sprite_key(Floor())
+    assert sprite_key(Wall()) != sprite_key(Floor())
+    assert sprite_key(Door(Door.Status.OPEN, Color.RED)) != sprite_key(
+        Door(Door.Status.LOCKED, Color.RED)
+    )
+    assert sprite_key(Door(Door.Status.OPEN, Color.RED)) != sprite_key(
+        Door(Door.Status.OPEN, Color.BLUE)
+    )
+
+    address1, address2 = DeliveryAddress(), DeliveryAddress()
+    address2.num_items = address1.num_items + 1
+    assert sprite_key(address1) != sprite_key(address2)
+
+
+def test_generate_images_headless():
+    env = factory_env_from_yaml('yaml/gv_keydoor.5x5.yaml')
+    env.reset()
+    data = Data([env.state], [], [], 1.0)
+
+    images = list(generate_images(data, headless=True))
+    assert len(images) == 1
+    assert images[0].shape == (5 * 40, 5 * 40, 3)
+
+
+@pytest.mark.parametrize(
+    'num_items,expected_color',
+    [(0, BLUE), (1, GREEN), (2, YELLOW), (3, RED), (4, BLACK)],
+)
+def test_rasterizer_address(num_items: int, expected_color):
+    env = factory_env_from_yaml('yaml/gv_empty.4x4.yaml')
+    env.reset()
+    position = next(
+        position
+        for position in env.state.grid.area.positions()
+        if isinstance(env.state.grid[position], Floor)
+        and position != env.state.agent.position
+    )
+    address = DeliveryAddress()
+    address.num_items = num_items
+    env.state.grid[position] = address
+    tile_size = 16
+    rasterizer = GridVerseRasterizer(tile_size=tile_size, supersampling=1)
+
+    # the package circle is filled like in the viewer, black beyond 3 items
+    image = rasterizer.render(env.state)
+    center = image[
+        position.y * tile_size + tile_size // 2,
+        position.x * tile_size + tile_size // 2,
+    ]
+    np.testing.assert_allclose(center, np.array(expected_color) * 255, atol=1)
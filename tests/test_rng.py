@@ -1,10 +1,17 @@
+import pickle
+
+import numpy as np
 import pytest
 
 from gym_gridverse.rng import (
+    BufferedRng,
     get_gv_rng,
     get_gv_rng_if_none,
     make_rng,
+    make_seed_sequence,
     reset_gv_rng,
+    spawn_rngs,
+    spawn_seeds,
 )
 
 
@@ -64,3 +71,72 @@ def test_rng_if_none():
     # call with an rng returns that rng
     rng = make_rng()
     assert get_gv_rng_if_none(rng) is rng
+
+
+def test_spawn_seeds():
+    values1 = [rng.random() for rng in spawn_rngs(1337, 4)]
+    values2 = [rng.random() for rng in spawn_rngs(1337, 8)]
+
+    # children only depend on the seed and their index
+    assert values1 == values2[:4]
+    assert len(set(values2)) == 8
+
+    seed_sequence = make_seed_sequence(1337)
+    assert make_seed_sequence(seed_sequence) is seed_sequence
+    assert [child.entropy for child in spawn_seeds(seed_sequence, 2)] == [
+        1337,
+        1337,
+    ]
+
+    # spawning does not modify the input seed sequence
+    children1 = spawn_seeds(seed_sequence, 2)
+    children2 = spawn_seeds(seed_sequence, 2)
+    assert [child.spawn_key for child in children1] == [(0,), (1,)]
+    assert [child.spawn_key for child in children2] == [(0,), (1,)]
+    assert seed_sequence.n_children_spawned == 0
+
+    # the first children of the seed, regardless of earlier spawns
+    seed_sequence.spawn(3)
+    assert [child.spawn_key for child in spawn_seeds(seed_sequence, 2)] == [
+        child.spawn_key for child in make_seed_sequence(1337).spawn(2)
+    ]
+
+
+@pytest.mark.parametrize('buffer_size', [1, 7, 1024])
+def test_buffered_rng(buffer_size: int):
+    rng = BufferedRng(make_rng(0), buffer_size=buffer_size)
+
+    values = [int(rng.integers(3, 7)) for _ in range(1000)]
+    assert set(values) == {3, 4, 5, 6}
+    values = [int(rng.integers(3, 7, endpoint=True)) for _ in range(1000)]
+    assert set(values) == {3, 4, 5, 6, 7}
+    values = [rng.choice(4) for _ in range(1000)]
+    assert set(values) == {0, 1, 2, 3}
+
+    assert 0.0 <= rng.random() < 1.0
+    assert rng.random((2, 3)).shape == (2, 3)
+    assert rng.integers(5, size=10).shape == (10,)
+    assert rng.choice(['a', 'b']) in ['a', 'b']
+
+    # reproducible given the wrapped generator
+    rng1 = BufferedRng(make_rng(0), buffer_size=buffer_size)
+    rng2 = BufferedRng(make_rng(0), buffer_size=buffer_size)
+    values1 = [rng1.integers(10) for _ in range(100)] + [rng1.random(5)]
+    values2 = [rng2.integers(10) for _ in range(100)] + [rng2.random(5)]
+    np.testing.assert_equal(values1, values2)
+
+    # copies carry on from the same point
+    rng_copy = pickle.loads(pickle.dumps(rng1))
+    assert isinstance(rng_copy, BufferedRng)
+    np.testing.assert_equal(rng_copy.random(10), rng1.random(10))
+
+
+def test_buffered_rng_invalid():
+    with pytest.raises(ValueError):
+        BufferedRng(make_rng(0), buffer_size=0)
+
+    rng = BufferedRng(make_rng(0))
+    with pytest.raises(ValueError):
+        rng.integers(0)
+    with pytest.raises(ValueError):
+        rng.choice(0)
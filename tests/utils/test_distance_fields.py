@@ -0,0 +1,99 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from gym_gridverse.utils.distance_fields import multi_source_bfs
+
+
+def _bfs(walkable: np.ndarray, source, offsets) -> np.ndarray:
+    """reference single-source BFS"""
+    distances = np.full(walkable.shape, np.inf)
+    distances[source] = 0.0
+    frontier = deque([source])
+    while frontier:
+        y, x = frontier.popleft()
+        for dy, dx in offsets:
+            ny, nx = y + dy, x + dx
+            if (
+                0 <= ny < walkable.shape[0]
+                and 0 <= nx < walkable.shape[1]
+                and walkable[ny, nx]
+                and np.isinf(distances[ny, nx])
+            ):
+                distances[ny, nx] = distances[y, x] + 1
+                frontier.append((ny, nx))
+    return distances
+
+
+_offsets = {
+    4: [(-1, 0), (1, 0), (0, -1), (0, 1)],
+    8: [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx],
+}
+
+
+@pytest.mark.parametrize('connectivity', [4, 8])
+@pytest.mark.parametrize('seed', range(5))
+def test_multi_source_bfs(connectivity: int, seed: int):
+    rng = np.random.default_rng(seed)
+    walkable = rng.random((9, 13)) < 0.7
+    sources = rng.integers((9, 13), size=(6, 2))
+
+    field = multi_source_bfs(walkable, sources, connectivity=connectivity)
+
+    distances = np.stack(
+        [
+            _bfs(walkable, tuple(source), _offsets[connectivity])
+            for source in sources.tolist()
+        ]
+    )
+    expected_distances = distances.min(axis=0)
+    expected_sources = np.where(
+        np.isinf(expected_distances), -1, distances.argmin(axis=0)
+    )
+    np.testing.assert_array_equal(field.distances, expected_distances)
+    np.testing.assert_array_equal(field.nearest_sources, expected_sources)
+
+
+def test_multi_source_bfs_mask():
+    walkable = np.array(
+        [
+            [True, True, True, True],
+            [True, False, False, True],
+            [True, True, False, False],
+        ]
+    )
+    sources = np.zeros_like(walkable)
+    sources[0, 0] = sources[1, 2] = True
+
+    field = multi_source_bfs(walkable, sources)
+    inf = np.inf
+    np.testing.assert_array_equal(
+        field.distances,
+        [[0, 1, 1, 2], [1, inf, 0, 1], [2, 3, inf, inf]],
+    )
+    np.testing.assert_array_equal(
+        field.nearest_sources,
+        [[0, 0, 1, 1], [0, -1, 1, 1], [0, 0, -1, -1]],
+    )
+
+    field = multi_source_bfs(walkable, sources, connectivity=8)
+    np.testing.assert_array_equal(
+        field.distances,
+        [[0, 1, 1, 1], [1, inf, 0, 1], [2, 1, inf, inf]],
+    )
+
+
+def test_multi_source_bfs_invalid():
+    walkable = np.ones((3, 3), dtype=bool)
+
+    with pytest.raises(ValueError):
+        multi_source_bfs(walkable, [(0, 0)], connectivity=6)
+    with pytest.raises(ValueError):
+        multi_source_bfs(walkable, [(3, 0)])
+    with pytest.raises(ValueError):
+        multi_source_bfs(walkable, np.ones((2, 2), dtype=bool))
+
+    field = multi_source_bfs(walkable, np.zeros((0, 2), dtype=int))
+    assert np.isinf(field.distances).all()
+    assert (field.nearest_sources == -1).all()
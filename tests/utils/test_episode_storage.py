@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from gym_gridverse.envs.yaml.factory import factory_env_from_yaml
+from gym_gridverse.representations.state_representations import (
+    make_state_representation,
+)
+from gym_gridverse.rng import make_rng
+from gym_gridverse.utils.episode_storage import EpisodeReader, EpisodeWriter
+
+
+def run_episodes(env, writer, num_episodes: int, max_steps: int):
+    rng = make_rng(0)
+    lengths = []
+
+    for _ in range(num_episodes):
+        env.reset()
+        writer.append0(env.state)
+
+        num_steps = rng.integers(max_steps)
+        for _ in range(num_steps):
+            action = env.action_space.actions[
+                rng.integers(env.action_space.num_actions)
+            ]
+            reward, _ = env.step(action)
+            writer.append(env.state, action, reward)
+
+        writer.end_episode()
+        lengths.append(num_steps)
+
+    return lengths
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1024])
+def test_episode_storage(chunk_size: int, tmp_path):
+    env = factory_env_from_yaml('yaml/gv_keydoor.5x5.yaml')
+    env.set_seed(0)
+    representation = make_state_representation('compact', env.state_space)
+
+    with EpisodeWriter(
+        str(tmp_path), representation, chunk_size=chunk_size
+    ) as writer:
+        lengths = run_episodes(env, writer, 5, 10)
+
+    # the last state of the last episode is still available in the env
+    expected_last_frame = representation.convert(env.state)
+
+    reader = EpisodeReader(str(tmp_path))
+    assert len(reader) == 5
+
+    for i, length in enumerate(lengths):
+        episode = reader[i]
+        assert reader.episode_length(i) == length
+        assert len(episode.actions) == len(episode.rewards) == length
+        assert episode.frames['grid'].shape[0] == length + 1
+        assert episode.frames['grid'].dtype == np.uint8
+
+    frame = reader.frame(4, lengths[4])
+    for key, array in expected_last_frame.items():
+        np.testing.assert_allclose(frame[key], array, rtol=1e-6)
+
+
+def test_episode_writer_wrong_calls(tmp_path):
+    env = factory_env_from_yaml('yaml/gv_empty.4x4.yaml')
+    representation = make_state_representation('default', env.state_space)
+    writer = EpisodeWriter(str(tmp_path), representation)
+    env.reset()
+
+    with pytest.raises(RuntimeError):
+        writer.end_episode()
+
+    writer.append0(env.state)
+
+    with pytest.raises(RuntimeError):
+        writer.append0(env.state)
+
+    writer.close()
+
+    # directory is not empty anymore
+    with pytest.raises(ValueError):
+        EpisodeWriter(str(tmp_path), representation)
+
+
+def test_episode_reader_unflushed_episodes(tmp_path):
+    env = factory_env_from_yaml('yaml/gv_empty.4x4.yaml')
+    representation = make_state_representation('default', env.state_space)
+    writer = EpisodeWriter(str(tmp_path), representation, chunk_size=4)
+
+    run_episodes(env, writer, 3, 10)
+
+    # episodes whose frames are not flushed yet are not visible
+    reader = EpisodeReader(str(tmp_path))
+    assert all(
+        start + length <= writer.num_frames
+        for start, length in reader._episodes
+    )
+
+    writer.close()
+    reader = EpisodeReader(str(tmp_path))
+    assert len(reader) == 3
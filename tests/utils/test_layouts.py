@@ -0,0 +1,121 @@
+import os
+
+import numpy as np
+import pytest
+
+from gym_gridverse.grid_object import DeliveryAddress, DeliveryHub, Floor, Wall
+from gym_gridverse.utils.layouts import (
+    GridTemplate,
+    cached_load_layout,
+    load_layout,
+    parse_ascii_layout,
+)
+
+LAYOUT = [
+    '#####',
+    '#H.1#',
+    '#3..#',
+    '#####',
+]
+
+
+def test_parse_ascii_layout():
+    template = parse_ascii_layout(LAYOUT)
+    assert template.shape == (4, 5)
+
+    grid = template.instantiate()
+    assert isinstance(grid[0, 0], Wall)
+    assert isinstance(grid[1, 1], DeliveryHub)
+    assert isinstance(grid[1, 2], Floor)
+    assert isinstance(grid[1, 3], DeliveryAddress)
+    assert grid[1, 3].num_items == 1
+    assert grid[2, 1].num_items == 3
+
+    assert [position.yx for position in template.floor_positions] == [
+        (1, 2),
+        (2, 2),
+        (2, 3),
+    ]
+
+
+def test_grid_template_instantiate():
+    template = parse_ascii_layout(LAYOUT)
+    grid1 = template.instantiate()
+    grid2 = template.instantiate()
+    assert grid1 == grid2
+
+    # stateless objects are shared, stateful objects are copied
+    assert grid1[0, 0] is grid2[0, 0]
+    assert grid1[1, 3] is not grid2[1, 3]
+
+    grid1[1, 3].num_items = 0
+    assert grid2[1, 3].num_items == 1
+    assert template.instantiate()[1, 3].num_items == 1
+
+
+def test_grid_template_from_grid():
+    grid = parse_ascii_layout(LAYOUT).instantiate()
+    assert GridTemplate.from_grid(grid).instantiate() == grid
+
+
+@pytest.mark.parametrize(
+    'layout',
+    [
+        [],
+        ['###', '##'],
+        ['#?#'],
+        ['#é#'],
+    ],
+)
+def test_parse_ascii_layout_invalid(layout):
+    with pytest.raises(ValueError):
+        parse_ascii_layout(layout)
+
+
+def test_load_layout(tmp_path):
+    expected = parse_ascii_layout(LAYOUT).instantiate()
+
+    txt_path = tmp_path / 'layout.txt'
+    txt_path.write_text('\n'.join(LAYOUT) + '\n')
+    assert load_layout(str(txt_path)).instantiate() == expected
+
+    npy_path = tmp_path / 'layout.npy'
+    np.save(npy_path, np.array([[ord(c) for c in row] for row in LAYOUT]))
+    assert load_layout(str(npy_path)).instantiate() == expected
+
+
+def test_load_layout_large(tmp_path):
+    codes = np.full((256, 256), ord('.'), dtype=np.uint8)
+    codes[[0, -1], :] = codes[:, [0, -1]] = ord('#')
+    codes[128, 128] = ord('H')
+    path = tmp_path / 'layout.npy'
+    np.save(path, codes)
+
+    template = load_layout(str(path))
+    assert template.shape == (256, 256)
+    assert len(template.floor_positions) == 254 * 254 - 1
+
+    grid = template.instantiate()
+    assert isinstance(grid[0, 0], Wall)
+    assert isinstance(grid[128, 128], DeliveryHub)
+
+
+def test_cached_load_layout(tmp_path):
+    path = tmp_path / 'layout.txt'
+    path.write_text('\n'.join(LAYOUT))
+
+    template = cached_load_layout(str(path))
+    assert cached_load_layout(str(path)) is template
+
+    # modified files are re-loaded
+    path.write_text('\n'.join(LAYOUT[:-1]))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert cached_load_layout(str(path)).shape == (3, 5)
+
+
+def test_load_layout_invalid(tmp_path):
+    path = tmp_path / 'layout.npy'
+    np.save(path, np.zeros((3, 3), dtype=float))
+    with pytest.raises(ValueError):
+        load_layout(str(path))
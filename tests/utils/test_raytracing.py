@@ -1,13 +1,16 @@
 import math
 from typing import List
 
+import numpy as np
 import pytest
 
 from gym_gridverse.geometry import Area, Position
 from gym_gridverse.utils.raytracing import (
     compute_ray,
+    compute_ray_table,
     compute_rays,
     compute_rays_fancy,
+    count_lit_rays,
 )
 
 
@@ -227,3 +230,31 @@ def test_compute_rays_fancy(position: Position, area: Area):
 
     for ray in rays:
         assert len(ray) <= area.height + area.width - 1
+
+
+@pytest.mark.parametrize(
+    'position,area',
+    [
+        (Position(0, 0), Area((-2, 0), (-1, 1))),
+        (Position(4, 2), Area((0, 4), (0, 4))),
+    ],
+)
+def test_compute_ray_table(position: Position, area: Area):
+    rays = compute_rays_fancy(position, area)
+    table = compute_ray_table(position, area)
+
+    assert table.indices.shape[0] == len(rays)
+    assert table.valid.sum() == sum(map(len, rays))
+    assert table.counts.sum() == sum(map(len, rays))
+
+    # without blocking cells, all rays reach all their cells
+    blocks = np.zeros((area.height, area.width), dtype=bool)
+    assert (count_lit_rays(table, blocks) == table.counts).all()
+
+    # if every cell blocks, rays only reach their first cell
+    blocks = np.ones((area.height, area.width), dtype=bool)
+    counts = count_lit_rays(table, blocks)
+    assert (
+        counts.sum() == counts[position.y - area.ymin, position.x - area.xmin]
+    )
+    assert counts.sum() == len(rays)
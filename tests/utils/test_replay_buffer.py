@@ -0,0 +1,115 @@
+from typing import Dict
+
+import numpy as np
+import pytest
+
+from gym_gridverse.representations.spaces import Space
+from gym_gridverse.rng import make_rng
+from gym_gridverse.utils.replay_buffer import ReplayBuffer
+
+
+def make_space() -> Dict[str, Space]:
+    return {
+        'grid': Space.make_categorical_space(np.full((2, 2), 200)),
+        'agent': Space.make_continuous_space(
+            np.zeros(2, dtype=float), np.ones(2, dtype=float)
+        ),
+    }
+
+
+def make_observation(i: int) -> Dict[str, np.ndarray]:
+    return {
+        'grid': np.full((2, 2), i % 200),
+        'agent': np.full(2, i / 1000.0),
+    }
+
+
+def test_replay_buffer_dtypes():
+    replay_buffer = ReplayBuffer(make_space(), 10)
+    assert replay_buffer._frames['grid'].dtype == np.uint8
+    assert replay_buffer._frames['agent'].dtype == np.float32
+
+
+@pytest.mark.parametrize('capacity', [1, 5, 10])
+@pytest.mark.parametrize('num_steps', [3, 10, 30])
+def test_replay_buffer_len(capacity: int, num_steps: int):
+    replay_buffer = ReplayBuffer(make_space(), capacity)
+
+    replay_buffer.add_first(make_observation(0))
+    for i in range(1, num_steps + 1):
+        replay_buffer.add(0, 0.0, make_observation(i), False)
+
+    assert len(replay_buffer) == min(capacity, num_steps)
+
+
+def test_replay_buffer_add_before_add_first():
+    replay_buffer = ReplayBuffer(make_space(), 10)
+
+    with pytest.raises(RuntimeError):
+        replay_buffer.add(0, 0.0, make_observation(0), False)
+
+    replay_buffer.add_first(make_observation(0))
+    replay_buffer.add(0, 0.0, make_observation(1), True)
+
+    with pytest.raises(RuntimeError):
+        replay_buffer.add(0, 0.0, make_observation(2), False)
+
+
+def test_replay_buffer_deduplicates_frames():
+    replay_buffer = ReplayBuffer(make_space(), 10)
+
+    replay_buffer.add_first(make_observation(0))
+    replay_buffer.add(0, 0.0, make_observation(0), False)
+    replay_buffer.add(0, 0.0, make_observation(1), False)
+
+    assert len(replay_buffer) == 2
+    assert replay_buffer._num_frames == 2
+
+
+def test_replay_buffer_evicts_transitions_with_evicted_frames():
+    # short episodes use two frames per transition
+    replay_buffer = ReplayBuffer(make_space(), 10, frame_capacity=4)
+
+    for i in range(0, 20, 2):
+        replay_buffer.add_first(make_observation(i))
+        replay_buffer.add(0, 0.0, make_observation(i + 1), True)
+
+    assert len(replay_buffer) == 2
+
+
+@pytest.mark.parametrize('directory', [False, True])
+def test_replay_buffer_sample(directory: bool, tmp_path):
+    replay_buffer = ReplayBuffer(
+        make_space(),
+        5,
+        directory=str(tmp_path) if directory else None,
+    )
+
+    replay_buffer.add_first(make_observation(0))
+    for i in range(1, 20):
+        replay_buffer.add(i, float(i), make_observation(i), i % 7 == 0)
+        if i % 7 == 0:
+            replay_buffer.add_first(make_observation(i))
+
+    batch = replay_buffer.sample(100, rng=make_rng(0))
+
+    assert batch.actions.shape == (100,)
+    assert batch.observations['grid'].shape == (100, 2, 2)
+    assert batch.next_observations['agent'].shape == (100, 2)
+
+    # only the last 5 transitions are available
+    assert set(batch.actions) <= {15, 16, 17, 18, 19}
+    np.testing.assert_array_equal(batch.rewards, batch.actions)
+    np.testing.assert_array_equal(
+        batch.next_observations['grid'][:, 0, 0], batch.actions
+    )
+    np.testing.assert_array_equal(
+        batch.observations['grid'][:, 0, 0], batch.actions - 1
+    )
+
+
+def test_replay_buffer_sample_empty():
+    replay_buffer = ReplayBuffer(make_space(), 10)
+
+    with pytest.raises(RuntimeError):
+        replay_buffer.sample(1)
@@ -0,0 +1,64 @@
+import pytest
+
+from gym_gridverse.agent import Agent
+from gym_gridverse.geometry import Orientation, Position
+from gym_gridverse.grid import Grid
+from gym_gridverse.grid_object import Color, Door, Floor, Key, Wall
+from gym_gridverse.utils.fast_copy import fast_copy
+from gym_gridverse.utils.undo_log import UndoLog
+
+
+def test_undo_log_grid():
+    grid = Grid.from_shape((3, 4))
+    grid[0, 0] = Door(Door.Status.LOCKED, Color.RED)
+    expected = fast_copy(grid)
+
+    undo_log = UndoLog()
+    grid.undo_log = undo_log
+
+    grid[1, 1] = Wall()
+    checkpoint = undo_log.checkpoint()
+    grid.swap(Position(1, 1), Position(2, 3))
+    grid.set_object_attribute(Position(0, 0), 'state', Door.Status.OPEN)
+
+    assert isinstance(grid[2, 3], Wall)
+    assert grid[0, 0].is_open
+    assert len(undo_log) == 3
+
+    undo_log.undo(checkpoint)
+    assert isinstance(grid[1, 1], Wall)
+    assert isinstance(grid[2, 3], Floor)
+    assert grid[0, 0].is_locked
+
+    undo_log.undo()
+    assert grid == expected
+    assert len(undo_log) == 0
+
+
+def test_undo_log_agent():
+    agent = Agent(Position(1, 1), Orientation.F)
+    undo_log = UndoLog()
+    agent.undo_log = undo_log
+
+    agent.position = Position(2, 1)
+    agent.orientation = Orientation.L
+    agent.grid_object = Key(Color.RED)
+    agent.capacity += 1
+
+    undo_log.undo()
+    assert agent == Agent(Position(1, 1), Orientation.F)
+    assert agent.capacity == 0
+
+
+def test_undo_log_not_copied():
+    grid = Grid.from_shape((2, 2))
+    grid.undo_log = UndoLog()
+
+    assert fast_copy(grid).undo_log is None
+
+
+def test_undo_log_invalid_checkpoint():
+    undo_log = UndoLog()
+
+    with pytest.raises(ValueError):
+        undo_log.undo(1)